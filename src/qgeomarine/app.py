@@ -28,7 +28,7 @@ from PyQt6 import QtGui, QtCore, QtWidgets, QtWebEngineWidgets, QtWebEngineCore
 from PyQt6.QtCore import pyqtSlot
 import pyproj
 import pyproj.database
-from qgeomarine.ui.ui import Ui_IntroWindow
+from qgeomarine.ui.ui import Ui_IntroWindow, IconCache, apply_app_stylesheet
 from qgeomarine.data_io.seismic_io import SEGY
 from qgeomarine.data_io.magy_io import MAGGY
 from qgeomarine.core.navigation.navigation import NavigationFromTowFish, NavigationFromShip, NavigationFromFile
@@ -1480,6 +1480,8 @@ class QGeoMarine(QtWidgets.QMainWindow):
 def main() -> int:
     """Entry point used by the console script."""
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    apply_app_stylesheet(app)
+    QtGui.QPixmapCache.setCacheLimit(IconCache.PIXMAP_CACHE_LIMIT_KB)
     win = IntroWindow()
     win.show()
     return app.exec()
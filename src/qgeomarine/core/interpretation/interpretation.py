@@ -27,9 +27,33 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas,
 from matplotlib.figure import Figure
 from skimage import feature
 from skimage import filters, morphology, measure
-from skimage.measure import label, regionprops
+from skimage.measure import label, regionprops_table
+from scipy.spatial import cKDTree
 from qgeomarine.core.processing.trace_analysis import instantaneous_attributes
 
+try:
+    # Optional GPU path for the edge detectors (CuPy + cuCIM mirror the scikit-image API)
+    import cupy as cp
+    from cucim.skimage import feature as cu_feature, filters as cu_filters
+    GPU_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    GPU_AVAILABLE = False
+
+
+def canny_edges(data):
+    """Canny edge map of a 2D array, computed on the GPU when one is available."""
+    if GPU_AVAILABLE:
+        return cp.asnumpy(cu_feature.canny(cp.asarray(data)))
+    return feature.canny(data)
+
+
+def sobel_edges(data):
+    """Sobel edge magnitude of a 2D array, computed on the GPU when one is available."""
+    if GPU_AVAILABLE:
+        return cp.asnumpy(cu_filters.sobel(cp.asarray(data)))
+    return filters.sobel(data)
+
+
 class SeismicInterpretationWindow(QMainWindow):
     """
     SeismicInterpretationWindow class provides a graphical interface for seismic data interpretation.
@@ -42,6 +66,7 @@ class SeismicInterpretationWindow(QMainWindow):
 
     Attributes:
         seismic_data (ndarray): 2D array containing the seismic data (traces x samples).
+        seismic_data32 (ndarray): float32 version of seismic_data used for display and edge detection.
         horizon_points (list): List of points marked by the user, stored as (x, y, tag) tuples.
         current_tag (str): The current tag used when marking horizon points.
         current_mode (str): The current mode for interacting with the data ('mark' or 'erase').
@@ -78,8 +103,10 @@ class SeismicInterpretationWindow(QMainWindow):
         self.seismic_data = seismic_data  # Store the seismic data
         self.sample_rate = sample_rate
         self.horizon_points = []  # Stores points as (x, y, tag) tuples
+        self._kdtree = None  # KD-tree over horizon_points, rebuilt lazily after any change
         self.current_tag = None
         self.current_mode = 'mark'  # Default mode to mark points
+        self._prepare_data()
 
         self.init_ui()
 
@@ -92,9 +119,11 @@ class SeismicInterpretationWindow(QMainWindow):
         self.canvas = FigureCanvas(Figure())
         self.ax = self.canvas.figure.subplots()
 
-        # Display the seismic data as an image
-        self.ax.clear()
-        self.ax.imshow(np.transpose(self.seismic_data), cmap='seismic', aspect='auto')
+        # Display the seismic data as an image. The limits are fixed to the full section so
+        # that decimated (smaller) display arrays keep trace/sample axis coordinates.
+        self._full = self._display  # Full-resolution array behind the image (samples x traces)
+        self._img = self.ax.imshow(self._display, cmap='seismic', aspect='auto')
+        self.ax.set_autoscale_on(False)
         self.ax.set_title("Seismic Image")
         self.ax.set_xlabel("Trace Number")
         self.ax.set_ylabel("Two Way Travel Time (ms)")
@@ -111,8 +140,20 @@ class SeismicInterpretationWindow(QMainWindow):
         container.setLayout(layout)
         self.setCentralWidget(container)
 
+        # Horizon points live in a single animated line that is blitted over a cached background
+        self._pts_line, = self.ax.plot([], [], 'ro', animated=True)
+        self._bg = None
+        self._horizon_scatter = None  # Created on the first horizon extraction
+
         # Connect the Matplotlib event handler to handle clicks
         self.canvas.mpl_connect('button_press_event', self.on_click)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+        # Rebuild the decimated display whenever the canvas size or the visible range changes
+        self.canvas.mpl_connect('resize_event', self._update_display_decim)
+        self.ax.callbacks.connect('xlim_changed', self._update_display_decim)
+        self.ax.callbacks.connect('ylim_changed', self._update_display_decim)
+        self._update_display_decim()
 
     def create_menu(self):
         """Create the menu bar for file operations and horizon detection tools."""
@@ -199,12 +240,11 @@ class SeismicInterpretationWindow(QMainWindow):
         if self.current_mode == 'mark':
             point = (event.xdata, event.ydata, self.current_tag)
             self.horizon_points.append(point)
-            self.ax.plot(event.xdata, event.ydata, 'ro')  # Mark the point with a red dot
-            self.canvas.draw()
+            self._kdtree = None
+            self.redraw_horizon_points()  # Mark the point with a red dot
 
         elif self.current_mode == 'erase':
             self.erase_nearest_point(event.xdata, event.ydata)
-            self.canvas.draw()
 
     def erase_nearest_point(self, x, y):
         """
@@ -220,21 +260,85 @@ class SeismicInterpretationWindow(QMainWindow):
         if not self.horizon_points:
             return
 
-        # Calculate distances to each point and find the nearest one
-        distances = [np.hypot(px - x, py - y) for px, py, _ in self.horizon_points]
-        min_index = np.argmin(distances)
+        # Find the nearest point with a KD-tree query, rebuilding the tree only after changes
+        if self._kdtree is None:
+            self._kdtree = cKDTree(np.array([(px, py) for px, py, _ in self.horizon_points], dtype=float))
+        distance, min_index = self._kdtree.query([x, y], k=1)
 
-        if distances[min_index] < 10:  # Threshold distance to identify nearby points
+        if distance < 10:  # Threshold distance to identify nearby points
             del self.horizon_points[min_index]  # Remove the point
-            self.ax.clear()
-            self.ax.imshow(np.transpose(self.seismic_data), cmap='seismic', aspect='auto')  # Redraw seismic image
+            self._kdtree = None
             self.redraw_horizon_points()  # Redraw all horizon points
 
     def redraw_horizon_points(self):
-        """Redraw all marked horizon points on the seismic image."""
-        for x, y, tag in self.horizon_points:
-            self.ax.plot(x, y, 'ro')
-        self.canvas.draw()
+        """
+        Redraw all marked horizon points on the seismic image.
+
+        Only the points line is updated and blitted over the cached background; a full
+        canvas draw is done when no background has been rendered yet.
+        """
+        xs = [point[0] for point in self.horizon_points]
+        ys = [point[1] for point in self.horizon_points]
+        self._pts_line.set_data(xs, ys)
+
+        if self._bg is None:
+            self.canvas.draw()
+            return
+
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self._pts_line)
+        self.canvas.blit(self.ax.bbox)
+
+    def _on_draw(self, event):
+        """Cache the rendered background after every full draw and paint the points over it."""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self._pts_line)
+
+    def _update_display_decim(self, *args):
+        """
+        Pass imshow only the visible part of the current array, decimated to about two
+        samples per screen pixel.
+
+        The full-resolution array is kept for analysis; the image extent is set so that
+        the axes still read in trace and sample indices.
+        """
+        n_rows, n_cols = self._full.shape
+        x0, x1 = sorted(self.ax.get_xlim())
+        y0, y1 = sorted(self.ax.get_ylim())
+        c0, c1 = max(0, int(np.floor(x0 + 0.5))), min(n_cols, int(np.ceil(x1 + 0.5)))
+        r0, r1 = max(0, int(np.floor(y0 + 0.5))), min(n_rows, int(np.ceil(y1 + 0.5)))
+        if c1 <= c0 or r1 <= r0:
+            return
+
+        width, height = self.canvas.get_width_height()
+        sx = max(1, (c1 - c0) // (2 * max(width, 1)))
+        sy = max(1, (r1 - r0) // (2 * max(height, 1)))
+
+        self._display_decim = self._full[r0:r1:sy, c0:c1:sx]
+        n_dec_rows, n_dec_cols = self._display_decim.shape
+        self._img.set_data(self._display_decim)
+        self._img.set_extent((c0 - 0.5, c0 + n_dec_cols * sx - 0.5, r0 + n_dec_rows * sy - 0.5, r0 - 0.5))
+
+    def _show(self, arr, title, cmap):
+        """
+        Display a (samples x traces) array in the shared image artist.
+
+        The AxesImage created in `init_ui` is updated in place (decimated data, colormap
+        and limits) instead of clearing the axes and building a new image.
+
+        Parameters:
+            arr (ndarray): 2D array to display, same shape as the seismic image.
+            title (str): Title of the plot.
+            cmap (str): Name of the Matplotlib colormap.
+        """
+        self._full = arr
+        self._update_display_decim()
+        self._img.set_cmap(cmap)
+        self._img.set_clim(float(np.nanmin(arr)), float(np.nanmax(arr)))
+        if self._horizon_scatter is not None:
+            self._horizon_scatter.set_visible(False)
+        self.ax.set_title(title)
+        self.canvas.draw_idle()
 
     def save_horizon_points(self):
         """Save the marked horizon points to a CSV or TXT file."""
@@ -249,109 +353,139 @@ class SeismicInterpretationWindow(QMainWindow):
         if file_path:
             df = pd.read_csv(file_path)
             self.horizon_points = df.values.tolist()
-            self.ax.clear()
-            self.ax.imshow(np.transpose(self.seismic_data), cmap='seismic', aspect='auto')
+            self._kdtree = None
+            self._show(self._display, "Seismic Image", 'seismic')
             self.redraw_horizon_points()
 
     def apply_canny_edge_detection(self):
         """Apply Canny edge detection to the seismic data and display the result."""
         try:
-            edges_canny = feature.canny(self.seismic_data)
-            self.ax.clear()
-            self.ax.imshow(np.transpose(edges_canny), cmap='gray', aspect='auto')
-            self.ax.set_title("Seismic Image with Canny Edge Detection")
-            self.ax.set_xlabel("Trace Number")
-            self.ax.set_ylabel("Two Way Travel Time (ms)")
-            self.canvas.draw()
+            edges_canny = self._cached('canny', lambda: np.ascontiguousarray(canny_edges(self.seismic_data32).T))
+            self._show(edges_canny, "Seismic Image with Canny Edge Detection", 'gray')
         except Exception as e:
             print("Error:", e)
 
     def apply_sobel_edge_detection(self):
         """Apply Sobel edge detection to the seismic data and display the result."""
         try:
-            edges_sobel = filters.sobel(self.seismic_data)
-            self.ax.clear()
-            self.ax.imshow(np.transpose(edges_sobel), cmap='gray', aspect='auto')
-            self.ax.set_title("Seismic Image with Sobel Edge Detection")
-            self.ax.set_xlabel("Trace Number")
-            self.ax.set_ylabel("Two Way Travel Time (ms)")
-            self.canvas.draw()
+            edges_sobel = self._cached('sobel_display', lambda: self._sobel_edges().T.copy())
+            self._show(edges_sobel, "Seismic Image with Sobel Edge Detection", 'gray')
         except Exception as e:
             print("Error:", e)
 
+    def _prepare_data(self):
+        """
+        Build the working arrays derived from `seismic_data` and reset the result cache.
+
+        `seismic_data32` is a float32 view/copy used by the display and edge-detection
+        pipelines (half the memory traffic of float64); `_display` is its contiguous
+        (samples x traces) transpose passed to imshow. The original array is kept for
+        the attribute computations and export.
+        """
+        self._cache = {}  # Results derived from seismic_data (edges, attributes, horizons)
+        self._cache_source = self.seismic_data  # The seismic_data array the cache was built from
+        self.seismic_data32 = self.seismic_data.astype(np.float32, copy=False)
+        self._display = np.ascontiguousarray(self.seismic_data32.T)
+
+    def _sobel_edges(self):
+        """Sobel edge magnitude of the seismic data (traces x samples), computed once."""
+        return self._cached('sobel', lambda: sobel_edges(self.seismic_data32))
+
+    def _cached(self, key, compute):
+        """
+        Return the cached result stored under `key`, computing it on first use.
+
+        All cached results are pure functions of `seismic_data`; the cache is dropped
+        whenever `seismic_data` is replaced by a different array.
+
+        Parameters:
+            key (str): Name of the cached result.
+            compute (callable): Zero-argument function producing the result.
+
+        Returns:
+            The cached (or freshly computed) result.
+        """
+        if self._cache_source is not self.seismic_data:
+            self._prepare_data()
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _compute_all_attrs(self):
+        """
+        Compute the instantaneous attributes of every trace with a single Hilbert transform.
+
+        The whole section goes through the shared ``instantaneous_attributes`` as one gather,
+        so the values match the trace analysis window, and the resulting amplitude, phase and
+        frequency arrays are cached for later plots.
+
+        Returns:
+            dict: 2D arrays (traces x samples) keyed 'instantaneous_amplitude',
+                  'instantaneous_phase' and 'instantaneous_frequency'.
+        """
+        return self._cached('analytic', lambda: instantaneous_attributes(self.seismic_data, self.sample_rate))
+
     def plot_instantaneous_amplitude(self):
         """Plot the instantaneous amplitude of the seismic data."""
         try:
-            instamplitude = [instantaneous_attributes(trace, self.sample_rate)['instantaneous_amplitude'] for trace in self.seismic_data]
-            self.ax.clear()
-            self.ax.imshow(np.transpose(instamplitude), cmap='hot', aspect='auto')
-            self.ax.set_title("Instantaneous Amplitude")
-            self.ax.set_xlabel("Trace Number")
-            self.ax.set_ylabel("Two Way Travel Time (ms)")
-            self.canvas.draw()
+            instamplitude = self._compute_all_attrs()['instantaneous_amplitude']
+            self._show(np.transpose(instamplitude), "Instantaneous Amplitude", 'hot')
         except Exception as e:
             print("Error:", e)
 
     def plot_instantaneous_phase(self):
         """Plot the instantaneous phase of the seismic data."""
         try:
-            instaphase = [instantaneous_attributes(trace, self.sample_rate)['instantaneous_phase'] for trace in self.seismic_data]
-            self.ax.clear()
-            self.ax.imshow(np.transpose(instaphase), cmap='viridis', aspect='auto')
-            self.ax.set_title("Instantaneous Phase")
-            self.ax.set_xlabel("Trace Number")
-            self.ax.set_ylabel("Two Way Travel Time (ms)")
-            self.canvas.draw()
+            instaphase = self._compute_all_attrs()['instantaneous_phase']
+            self._show(np.transpose(instaphase), "Instantaneous Phase", 'viridis')
         except Exception as e:
             print("Error:", e)
 
     def plot_instantaneous_frequency(self):
         """Plot the instantaneous frequency of the seismic data."""
         try:
-            instafreq = [instantaneous_attributes(trace, self.sample_rate)['instantaneous_frequency'] for trace in self.seismic_data]
-            self.ax.clear()
-            self.ax.imshow(np.transpose(instafreq), cmap='plasma', aspect='auto')
-            self.ax.set_title("Instantaneous Frequency")
-            self.ax.set_xlabel("Trace Number")
-            self.ax.set_ylabel("Two Way Travel Time (ms)")
-            self.canvas.draw()
+            instafreq = self._compute_all_attrs()['instantaneous_frequency']
+            self._show(np.transpose(instafreq), "Instantaneous Frequency", 'plasma')
         except Exception as e:
             print("Error:", e)
     
     def plot_seismic_data(self):
         """Plot the seismic data on the canvas."""
         try:
-            self.ax.clear()
-            self.ax.imshow(np.transpose(self.seismic_data), cmap='seismic', aspect='auto')
-            self.ax.set_title("Seismic Data")
-            self.ax.set_xlabel("Trace Number")
-            self.ax.set_ylabel("Two Way Travel Time (ms)")
-            self.canvas.draw()
+            self._show(self._display, "Seismic Data", 'seismic')
         except Exception as e:
             print("Error:", e)
 
+    def _detect_horizon_regions(self):
+        """
+        Threshold the Sobel edges with Otsu's method and locate the labelled horizon regions.
+
+        Returns:
+            tuple: (sample_coords, trace_coords) arrays holding the bounding-box centres of
+                   all regions, in plotting order (x along rows, y along columns).
+        """
+        edges_sobel = self._sobel_edges()
+        thresh = filters.threshold_otsu(edges_sobel)
+        binary_image = edges_sobel > thresh
+
+        labeled_image = label(binary_image)
+        bbox = regionprops_table(labeled_image, properties=('bbox',))
+        trace_coords = (bbox['bbox-1'] + bbox['bbox-3']) * 0.5
+        sample_coords = (bbox['bbox-0'] + bbox['bbox-2']) * 0.5
+        return sample_coords, trace_coords
+
     def extract_and_plot_horizons(self):
         """Extract horizons from the seismic data and plot them on the seismic image."""
         try:
-            edges_sobel = filters.sobel(self.seismic_data)
-            thresh = filters.threshold_otsu(edges_sobel)
-            binary_image = edges_sobel > thresh
-
-            labeled_image = label(binary_image)
-            regions = regionprops(labeled_image)
+            sample_coords, trace_coords = self._cached('horizons', self._detect_horizon_regions)
 
-            self.ax.clear()
-            self.ax.imshow(np.transpose(self.seismic_data), cmap='seismic', aspect='auto')
-            self.ax.set_title("Seismic Image with Detected Horizons")
-            self.ax.set_xlabel("Trace Number")
-            self.ax.set_ylabel("Two Way Travel Time (ms)")
+            self._show(self._display, "Seismic Image with Detected Horizons", 'seismic')
 
-            for region in regions:
-                min_row, min_col, max_row, max_col = region.bbox
-                trace_coords = (min_col + max_col) / 2
-                sample_coords = (min_row + max_row) / 2
-                self.ax.scatter(sample_coords, trace_coords, color='red', s=5)  # Mark horizon points with red dots
-
-            self.canvas.draw()
+            # Mark horizon points with red dots, reusing the scatter artist across extractions
+            if self._horizon_scatter is None:
+                self._horizon_scatter = self.ax.scatter(sample_coords, trace_coords, color='red', s=5)
+            else:
+                self._horizon_scatter.set_offsets(np.column_stack((sample_coords, trace_coords)))
+                self._horizon_scatter.set_visible(True)
         except Exception as e:
             print("Error:", e)
\ No newline at end of file
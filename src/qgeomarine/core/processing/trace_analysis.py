@@ -9,85 +9,403 @@ The primary analyses included are:
   - Spectrogram: Time-frequency analysis showing how spectral content changes over time.
 
 Functions:
-    trace_periodogram(trace, fs): Computes the periodogram of a seismic trace.
-    trace_welch_periodogram(trace, fs): Computes the Welch periodogram of a seismic trace.
+    trace_periodogram(trace, fs): Computes the periodogram of a seismic trace or gather.
+    trace_welch_periodogram(trace, fs): Computes the Welch periodogram of a seismic trace or gather.
     trace_wavelet_transform(trace, widths): Computes the continuous wavelet transform (CWT) of a seismic trace.
     trace_spectrogram(trace, fs): Computes the spectrogram (time-frequency representation) of a seismic trace.
+    trace_RMS(trace): Computes the root mean square amplitude of a seismic trace or gather.
+
+Classes:
+    SpectralPlanner(n, fs): Set-up-once, call-many periodogram / Welch estimator for traces of one length.
 """
 
 import numpy as np
-from scipy.signal import periodogram, welch, spectrogram, hilbert, cwt, ricker
-from scipy.fft import fft, fftfreq
+import pywt
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import spectrogram, get_window
+from functools import lru_cache
+from scipy.fft import fft, ifft, rfft, irfft, rfftfreq, next_fast_len, set_global_backend, set_workers
+
+try:
+    from scipy.signal import ricker
+except ImportError:  # scipy.signal.ricker was removed in SciPy 1.15
+    def ricker(points, a):
+        """Ricker (Mexican hat) wavelet with ``points`` samples and width ``a``, as in SciPy."""
+        amplitude = 2 / (np.sqrt(3 * a) * (np.pi ** 0.25))
+        x = np.arange(0, points) - (points - 1.0) / 2
+        xsq = x * x
+        return amplitude * (1 - xsq / (a * a)) * np.exp(-xsq / (2 * a * a))
+
+try:
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft
+    FFTW_AVAILABLE = True
+except ImportError:  # pyFFTW is optional, scipy's pocketfft is used otherwise
+    FFTW_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional, fall back to the NumPy implementation
+    NUMBA_AVAILABLE = False
+
+try:
+    # Optional GPU path for batched wavelet transforms (cupyx.scipy.fft wraps cuFFT)
+    import cupy as cp
+    import cupyx.scipy.fft as cufft
+    GPU_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    GPU_AVAILABLE = False
+
+if FFTW_AVAILABLE:
+    # Route scipy.fft (and so welch, spectrogram and hilbert) through FFTW and keep
+    # its plans alive between calls, so repeated per-trace transforms skip planning.
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+    set_global_backend(pyfftw.interfaces.scipy_fft)
+
+def _float_dtype(trace, dtype=None):
+    """Dtype to compute in: ``dtype`` if given, else float32 for float32 traces and float64 otherwise."""
+    if dtype is not None:
+        return np.dtype(dtype)
+    return np.dtype(np.float32) if trace.dtype == np.float32 else np.dtype(np.float64)
+
+class SpectralPlanner:
+    """
+    Set-up-once, call-many power spectral density estimates for traces of one length.
 
-def trace_periodogram(trace, fs):
+    Only the window, segment layout and scaling are kept between calls, so calling the
+    planner on trace after trace only copies, transforms and averages. Work arrays are
+    allocated per call, so one planner can be shared between threads. The planner holds
+    no FFT plan itself: with pyFFTW installed the transforms go through its scipy.fft
+    backend, which keeps its own plan cache.
+    Results match ``scipy.signal.periodogram`` and ``scipy.signal.welch`` called with
+    the same segment, detrend and scaling options (one-sided, mean averaging).
 
+    Parameters:
+        n (int): Trace length in samples.
+        fs (float): Sampling frequency of the traces.
+        method (str): 'welch' or 'periodogram' (default: 'welch').
+        nperseg (int): Welch segment length, capped at n (default: 256).
+        noverlap (int, optional): Welch segment overlap. Defaults to nperseg // 2.
+        detrend (str or bool): 'constant' to remove each segment's mean, or False to skip
+                               detrending (default: 'constant').
+        scaling (str): 'density' for V**2/Hz or 'spectrum' for V**2 (default: 'density').
+        dtype (dtype): Real dtype of the computation (default: float64).
+        workers (int): Number of FFT threads, -1 for all cores (default: -1).
     """
-    Compute the periodogram of a seismic trace.
+
+    def __init__(self, n, fs, method='welch', nperseg=256, noverlap=None, detrend='constant',
+                 scaling='density', dtype=np.float64, workers=-1):
+        self.n = n
+        self.fs = fs
+        self.method = method
+        if detrend not in ('constant', False):
+            raise ValueError(f"Unsupported detrend '{detrend}', expected 'constant' or False")
+        self.detrend = detrend
+        self.dtype = np.dtype(dtype)
+        self.workers = workers
+
+        if method == 'periodogram':
+            self.nperseg, self.noverlap = n, 0
+            window = np.ones(n)
+        elif method == 'welch':
+            self.nperseg = min(nperseg, n)
+            self.noverlap = self.nperseg // 2 if noverlap is None else noverlap
+            window = get_window('hann', self.nperseg)
+        else:
+            raise ValueError(f"Unknown method '{method}', expected 'welch' or 'periodogram'")
+
+        if self.noverlap >= self.nperseg:
+            raise ValueError('noverlap must be less than nperseg.')
+        self._step = self.nperseg - self.noverlap
+        self._n_segments = (n - self.noverlap) // self._step
+        self._window = window.astype(self.dtype)
+        self._window.flags.writeable = False
+        if scaling == 'density':
+            self._scale = 1.0 / (fs * (window * window).sum())
+        elif scaling == 'spectrum':
+            self._scale = 1.0 / window.sum() ** 2
+        else:
+            raise ValueError(f"Unknown scaling '{scaling}', expected 'density' or 'spectrum'")
+        self.f = rfftfreq(self.nperseg, 1.0 / fs)
+
+    def _segments(self, batch_shape):
+        """Fresh FFT input buffer (SIMD-aligned with pyFFTW) for a batch of traces of this shape."""
+        shape = batch_shape + (self._n_segments, self.nperseg)
+        if FFTW_AVAILABLE:
+            return pyfftw.empty_aligned(shape, dtype=self.dtype)
+        return np.empty(shape, dtype=self.dtype)
+
+    def __call__(self, trace):
+        """
+        Estimate the power spectral density of a trace or of a gather of traces.
+
+        Parameters:
+            trace (ndarray): Trace of length n, or an array of traces along the last axis.
+
+        Returns:
+            tuple:
+                - f (ndarray): Array of sample frequencies.
+                - Pxx (ndarray): Power spectral density, one row per trace for 2D input.
+        """
+        trace = np.asarray(trace)
+        if trace.shape[-1] != self.n:
+            raise ValueError(f"Expected traces of {self.n} samples, got {trace.shape[-1]}")
+        segments = self._segments(trace.shape[:-1])
+
+        # Detrend each segment by its mean and window it, straight into the FFT input buffer
+        view = sliding_window_view(trace, self.nperseg, axis=-1)[..., ::self._step, :]
+        if self.detrend:
+            np.subtract(view, view.mean(axis=-1, keepdims=True), out=segments, casting='unsafe')
+            segments *= self._window
+        else:
+            np.multiply(view, self._window, out=segments, casting='unsafe')
+
+        spectrum = rfft(segments, axis=-1, workers=self.workers)
+        power = np.abs(spectrum)
+        np.square(power, out=power)
+
+        Pxx = power.mean(axis=-2)
+        Pxx *= self._scale
+        # One-sided: fold the negative frequencies, except DC and (for even nperseg) Nyquist
+        if self.nperseg % 2:
+            Pxx[..., 1:] *= 2
+        else:
+            Pxx[..., 1:-1] *= 2
+        return self.f, Pxx
+
+@lru_cache(maxsize=8)
+def _spectral_planner(n, fs, method, dtype, workers, nperseg=256, noverlap=None, detrend='constant',
+                      scaling='density'):
+    """Planner shared by trace_periodogram and trace_welch_periodogram calls with the same setup."""
+    return SpectralPlanner(n, fs, method=method, nperseg=nperseg, noverlap=noverlap, detrend=detrend,
+                           scaling=scaling, dtype=dtype, workers=workers)
+
+def trace_periodogram(trace, fs, workers=-1):
+
+    """
+    Compute the periodogram of a seismic trace or of a whole gather.
 
     The periodogram estimates the power spectral density (PSD) of the signal, 
     showing the distribution of power into frequency components composing the signal.
+    A 2D input is transformed with a single batched, multi-threaded rFFT along the
+    last axis instead of one call per trace, through a cached SpectralPlanner. The
+    result matches ``scipy.signal.periodogram`` with its defaults (boxcar window,
+    constant detrend, one-sided density).
 
     Parameters:
-        trace (ndarray): The seismic trace to analyze.
+        trace (ndarray): The seismic trace to analyze, or a gather of shape (n_traces, n_samples).
         fs (float): The sampling frequency of the trace.
+        workers (int): Number of FFT threads, -1 for all cores (default: -1).
 
     Returns:
         tuple: Contains:
             - f (ndarray): Array of sample frequencies.
-            - Pxx (ndarray): Power spectral density of the trace.
+            - Pxx (ndarray): Power spectral density, one row per trace for 2D input.
     """
 
-    f, Pxx = periodogram(trace, fs)
-    return f, Pxx
+    traces = np.asarray(trace)
+    planner = _spectral_planner(traces.shape[-1], fs, 'periodogram', _float_dtype(traces), workers)
+    return planner(traces)
 
-def trace_welch_periodogram(trace, fs):
+def trace_welch_periodogram(trace, fs, workers=-1, nperseg=None, noverlap=None, detrend=False,
+                            scaling='density'):
     
     """
-    Compute the Welch periodogram of a seismic trace.
+    Compute the Welch periodogram of a seismic trace or of a whole gather.
 
     The Welch method is an improvement over the standard periodogram by splitting 
     the signal into overlapping segments, computing the periodogram of each segment, 
     and then averaging them. This helps reduce noise in the power spectral density estimate.
+    A 2D input is processed along its last axis in one call, so the segment FFTs of
+    all traces are batched together, through a cached SpectralPlanner.
+    Segments are not detrended by default, since processed seismic traces are already
+    zero-mean; pass ``detrend='constant'`` for the ``scipy.signal.welch`` default.
 
     Parameters:
-        trace (ndarray): The seismic trace to analyze.
+        trace (ndarray): The seismic trace to analyze, or a gather of shape (n_traces, n_samples).
         fs (float): The sampling frequency of the trace.
+        workers (int): Number of FFT threads, -1 for all cores (default: -1).
+        nperseg (int, optional): Segment length, rounded up to the next 5-smooth FFT size.
+                                 Defaults to 256 (capped at the trace length).
+        noverlap (int, optional): Segment overlap. Defaults to nperseg // 2.
+        detrend (str or bool): 'constant' or False (default: False).
+        scaling (str): 'density' or 'spectrum' (default: 'density').
 
     Returns:
         tuple: Contains:
             - f (ndarray): Array of sample frequencies.
-            - Pxx (ndarray): Power spectral density of the trace using Welch's method.
+            - Pxx (ndarray): Power spectral density using Welch's method, one row per trace for 2D input.
+    """
+
+    traces = np.asarray(trace)
+    # Every segment is one FFT, so keep the segment length on pocketfft/FFTW's fast sizes
+    nperseg = next_fast_len(256 if nperseg is None else nperseg, real=True)
+    planner = _spectral_planner(traces.shape[-1], fs, 'welch', _float_dtype(traces), workers,
+                                nperseg, noverlap, detrend, scaling)
+    return planner(traces)
+
+def _ricker_bank(widths, n_samples):
     """
+    Time-domain Ricker kernels for all widths at once, laid out like _cwt_filter_bank.
 
-    f, Pxx = welch(trace, fs)
-    return f, Pxx
+    Evaluates ``scipy.signal.ricker`` for every width in one broadcast expression instead
+    of one call per width, already reversed and circularly shifted.
 
-def trace_wavelet_transform(trace, widths=None, wavelet=ricker, sampling_frequency=1.0):
+    Parameters:
+        widths (ndarray): Wavelet widths.
+        n_samples (int): Trace length.
+
+    Returns:
+        ndarray: Padded kernels of shape (len(widths), n_fft).
+    """
+    points = np.minimum(10 * widths, n_samples)[:, None]
+    lengths = np.ceil(points)
+    n_fft = next_fast_len(n_samples + int(lengths.max()) - 1, real=True)
+
+    # Position j holds reversed tap k = (j + (len - 1) // 2) mod n_fft when k < len
+    taps = (np.arange(n_fft) + (lengths - 1) // 2) % n_fft
+    x = (lengths - 1 - taps) - (points - 1) / 2
+    w = widths[:, None]
+    xsq = x * x
+    wsq = w * w
+    amplitude = 2 / (np.sqrt(3 * w) * np.pi ** 0.25)
+    return np.where(taps < lengths, amplitude * (1 - xsq / wsq) * np.exp(-xsq / (2 * wsq)), 0.0)
+
+@lru_cache(maxsize=8)
+def _cwt_filter_bank(wavelet, widths, n_samples, dtype=np.float64):
+    """
+    Build the frequency-domain filter bank used by trace_wavelet_transform.
+
+    Each row is the spectrum of ``conj(wavelet(N, width)[::-1])`` with
+    ``N = min(10 * width, n_samples)`` (the kernels of ``scipy.signal.cwt``), circularly
+    shifted so that a product with the trace spectrum gives the ``mode='same'``
+    convolution. The bank is cached, so repeated transforms of equally long traces
+    only pay for one forward and one inverse FFT.
+
+    Parameters:
+        wavelet (callable): Wavelet function taking (points, width).
+        widths (tuple): Wavelet widths.
+        n_samples (int): Trace length.
+        dtype (dtype): Real dtype of the transform; float32 gives a complex64 bank.
+
+    Returns:
+        tuple:
+            - bank (ndarray): Read-only filter bank, one row per width.
+            - n_fft (int): FFT length the bank was computed for.
+            - is_complex (bool): Whether the wavelet is complex valued.
+    """
+    if wavelet is ricker:
+        padded = _ricker_bank(np.asarray(widths, dtype=np.float64), n_samples)
+        is_complex = False
+        n_fft = padded.shape[-1]
+    else:
+        kernels = [np.conj(np.asarray(wavelet(min(10 * width, n_samples), width))[::-1]) for width in widths]
+        is_complex = any(np.iscomplexobj(kernel) for kernel in kernels)
+        max_len = max(len(kernel) for kernel in kernels)
+        n_fft = next_fast_len(n_samples + max_len - 1, real=not is_complex)
+
+        # Kernel tap k lands at circular offset k - (len - 1) // 2, as in a 'same' convolution
+        padded = np.zeros((len(kernels), n_fft), dtype=np.complex128 if is_complex else np.float64)
+        for row, kernel in zip(padded, kernels):
+            row[:len(kernel)] = kernel
+            row[:] = np.roll(row, -((len(kernel) - 1) // 2))
+
+    bank = fft(padded, axis=-1) if is_complex else rfft(padded, axis=-1)
+    if dtype == np.float32:
+        bank = bank.astype(np.complex64)
+    bank.flags.writeable = False
+    return bank, n_fft, is_complex
+
+@lru_cache(maxsize=8)
+def _default_widths(voices_per_octave, min_width=1, max_width=128):
+    """Read-only log-spaced wavelet widths, ``voices_per_octave`` per doubling of the width."""
+    n_widths = int(np.log2(max_width / min_width) * voices_per_octave)
+    widths = min_width * 2.0 ** (np.arange(n_widths) / voices_per_octave)
+    widths.flags.writeable = False
+    return widths
+
+@lru_cache(maxsize=4)
+def _gpu_cwt_filter_bank(wavelet, widths, n_samples, dtype=np.float64):
+    """Device copy of the _cwt_filter_bank spectra, kept so repeated calls skip the upload."""
+    bank, n_fft, is_complex = _cwt_filter_bank(wavelet, widths, n_samples, dtype)
+    return cp.asarray(bank), n_fft, is_complex
+
+def trace_wavelet_transform(trace, widths=None, wavelet=ricker, sampling_frequency=1.0, backend='cpu', workers=-1,
+                            dtype=None, voices_per_octave=10):
     """
     Compute the continuous wavelet transform (CWT) of a seismic trace.
 
     The CWT provides a time-frequency representation of the signal. By default, it uses 
     the Ricker wavelet (also known as the "Mexican hat" wavelet), which is commonly used 
     for seismic analysis due to its similarity to seismic wavelets.
+    The transform is evaluated in the frequency domain against a cached filter bank,
+    giving the same result as ``scipy.signal.cwt`` without a convolution per width.
+    Passing a PyWavelets wavelet name (e.g. 'mexh', 'morl') instead delegates to
+    ``pywt.cwt(..., method='fft')``; this is slower than the cached bank but gives
+    access to the continuous wavelet families of PyWavelets.
 
     Parameters:
-        trace (ndarray): The seismic trace to analyze.
+        trace (ndarray): The seismic trace to analyze (a 2D gather gives one CWT matrix per trace).
         widths (ndarray, optional): Widths of the wavelet. Determines the frequency scale. 
-                                     Defaults to a range suitable for seismic data.
-        wavelet (callable): The wavelet function to use. Defaults to `scipy.signal.ricker`.
+                                     Defaults to log-spaced widths from 1 to 128, which resolve
+                                     low frequencies as finely as high ones with fewer scales.
+        wavelet (callable or str): The wavelet function to use, or the name of a PyWavelets
+                                   continuous wavelet. Defaults to `scipy.signal.ricker`.
         sampling_frequency (float): Sampling frequency of the seismic trace (Hz). Defaults to 1.0.
+        backend (str): 'cpu', or 'gpu' to run the batched FFTs with cuFFT through CuPy. Falls
+                       back to the CPU when no GPU is available (default: 'cpu').
+        workers (int): Number of FFT threads, -1 for all cores (default: -1).
+        dtype (dtype, optional): Real output dtype. Defaults to float32 for float32 traces and
+                                 float64 otherwise (complex wavelets give the matching complex type).
+        voices_per_octave (int): Number of default widths per octave, used when ``widths`` is None
+                                 (default: 10). The center frequency formula holds for any spacing.
 
     Returns:
         tuple:
             - cwt_matrix (ndarray): CWT matrix where each row corresponds to a wavelet transform at a different width.
-            - frequencies (ndarray): Approximate center frequencies corresponding to the wavelet widths.
+            - frequencies (ndarray): Approximate center frequencies corresponding to the wavelet widths
+                                     (the exact PyWavelets scale frequencies for a named wavelet).
     """
     # Default widths if none provided
     if widths is None:
-        widths = np.arange(1, 128)  # Choose a reasonable default range
-
-    # Compute the CWT
-    cwt_matrix = cwt(trace, wavelet, widths)
+        widths = _default_widths(voices_per_octave)  # Log-spaced, 1 to 128
+
+    if isinstance(wavelet, str):
+        trace = np.asarray(trace)
+        trace = trace.astype(_float_dtype(trace, dtype), copy=False)
+        coeffs, frequencies = pywt.cwt(trace, widths, wavelet, sampling_period=1.0 / sampling_frequency,
+                                       method='fft', axis=-1)
+        # PyWavelets puts the scale axis first; move it next to the samples like the bank path
+        return np.moveaxis(coeffs, 0, -2), frequencies
+
+    # Compute the CWT: one FFT of the trace against the cached spectra of all wavelets
+    trace = np.asarray(trace)
+    dtype = _float_dtype(trace, dtype)
+    trace = trace.astype(dtype, copy=False)
+    n_samples = trace.shape[-1]
+    widths_key = tuple(np.ravel(widths).tolist())
+    if backend == 'gpu' and GPU_AVAILABLE:
+        # CuPy caches the cuFFT plans itself, so only the filter bank needs keeping
+        bank, n_fft, is_complex = _gpu_cwt_filter_bank(wavelet, widths_key, n_samples, dtype)
+        trace_gpu = cp.asarray(trace)
+        if is_complex:
+            spectrum = cufft.fft(trace_gpu, n_fft, axis=-1)[..., None, :]
+            cwt_matrix = cufft.ifft(bank * spectrum, n_fft, axis=-1)[..., :n_samples]
+        else:
+            spectrum = cufft.rfft(trace_gpu, n_fft, axis=-1)[..., None, :]
+            cwt_matrix = cufft.irfft(bank * spectrum, n_fft, axis=-1)[..., :n_samples]
+        cwt_matrix = cp.asnumpy(cwt_matrix)
+        return cwt_matrix, sampling_frequency / (widths * np.sqrt(2))
+
+    bank, n_fft, is_complex = _cwt_filter_bank(wavelet, widths_key, n_samples, dtype)
+    if is_complex:
+        spectrum = fft(trace, n_fft, axis=-1, workers=workers)[..., None, :]
+        cwt_matrix = ifft(bank * spectrum, n_fft, axis=-1, workers=workers)[..., :n_samples]
+    else:
+        spectrum = rfft(trace, n_fft, axis=-1, workers=workers)[..., None, :]
+        cwt_matrix = irfft(bank * spectrum, n_fft, axis=-1, workers=workers)[..., :n_samples]
 
     # Approximate center frequencies based on the widths
     frequencies = sampling_frequency / (widths * np.sqrt(2))
@@ -95,7 +413,38 @@ def trace_wavelet_transform(trace, widths=None, wavelet=ricker, sampling_frequen
     return cwt_matrix, frequencies
 
 
-def trace_spectrogram(trace, fs, window_duration=0.1, overlap=0.5, scaling='density', log_scale=False):
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _to_db_kernel(flat):
+        """10*log10(x + 1e-12) in place, in a single pass over memory."""
+        for i in prange(flat.shape[0]):
+            flat[i] = 10.0 * np.log10(flat[i] + 1e-12)
+
+def _to_db(Sxx):
+    """Convert a power spectrogram to decibels in place."""
+    # Add small value to avoid log(0)
+    if NUMBA_AVAILABLE and Sxx.flags.c_contiguous:
+        _to_db_kernel(Sxx.reshape(-1))
+    else:
+        Sxx += 1e-12
+        np.log10(Sxx, out=Sxx)
+        Sxx *= 10
+    return Sxx
+
+@lru_cache(maxsize=32)
+def _hanning_window(window_length, dtype=np.float64):
+    """Read-only Hanning window, shared by every spectrogram with this window length."""
+    window = np.hanning(window_length).astype(dtype, copy=False)
+    window.flags.writeable = False
+    return window
+
+@lru_cache(maxsize=32)
+def _spectrogram_nfft(window_length):
+    """FFT length for a spectrogram window: at least 256 and 5-smooth."""
+    return max(256, next_fast_len(window_length, real=True))
+
+def trace_spectrogram(trace, fs, window_duration=0.1, overlap=0.5, scaling='density', log_scale=False, workers=-1,
+                      dtype=None):
     """
     Compute the spectrogram of a seismic trace using short-time Fourier transform (STFT).
     
@@ -106,6 +455,8 @@ def trace_spectrogram(trace, fs, window_duration=0.1, overlap=0.5, scaling='dens
         overlap (float): Fraction of overlap between windows (default: 0.5).
         scaling (str): Scaling of the spectrogram ('density' or 'spectrum').
         log_scale (bool): Whether to return the spectrogram in log scale (default: False).
+        workers (int): Number of FFT threads, -1 for all cores (default: -1).
+        dtype (dtype, optional): Output dtype. Defaults to float32 for float32 traces and float64 otherwise.
     
     Returns:
         tuple:
@@ -115,20 +466,24 @@ def trace_spectrogram(trace, fs, window_duration=0.1, overlap=0.5, scaling='dens
     """
     # Define the window length and overlap
     window_length = int(window_duration * fs)
-    window = np.hanning(window_length)
+    trace = np.asarray(trace)
+    dtype = _float_dtype(trace, dtype)
+    trace = trace.astype(dtype, copy=False)
+    window = _hanning_window(window_length, dtype)  # A float64 window would upcast the STFT
     noverlap = int(window_length * overlap)
-    nfft = max(256, 2 ** int(np.ceil(np.log2(window_length))))  # Power of 2 for FFT length
+    nfft = _spectrogram_nfft(window_length)  # 5-smooth FFT length, fast for pocketfft and FFTW
 
     # Compute the spectrogram
-    f, t, Sxx = spectrogram(trace, fs, window=window, noverlap=noverlap, nfft=nfft, scaling=scaling)
+    with set_workers(workers):
+        f, t, Sxx = spectrogram(trace, fs, window=window, noverlap=noverlap, nfft=nfft, scaling=scaling)
 
     # Optionally convert to logarithmic scale
     if log_scale:
-        Sxx = 10 * np.log10(Sxx + 1e-12)  # Add small value to avoid log(0)
+        _to_db(Sxx)
 
     return f, t, Sxx
 
-def tace_RMS(trace):
+def trace_RMS(trace):
     """
     Compute the Root Mean Square (RMS) of a seismic trace.
     The Root Mean Square (RMS) of a seismic trace is a statistical
@@ -153,32 +508,120 @@ def tace_RMS(trace):
 
     RMS is often used to normalize seismic data for further analysis or processing.
     
+    The sum of squares is a single dot product, so no squared copy of the trace is made.
+    A 2D gather of shape (n_traces, n_samples) gives one RMS value per trace.
     """
 
-    rms_trace  = np.sqrt(np.mean(trace**2))
+    trace = np.asarray(trace)
+    if trace.ndim == 1:
+        rms_trace = np.sqrt(np.dot(trace, trace) / trace.size)
+    else:
+        rms_trace = np.sqrt(np.einsum('...i,...i->...', trace, trace) / trace.shape[-1])
     return rms_trace
 
-def instantaneous_attributes(trace, fs):
+tace_RMS = trace_RMS  # Backwards-compatible alias for the original (misspelt) name
+
+def _analytic_signal(trace, workers=-1):
+    """
+    Analytic signal of a real trace, computed from its one-sided spectrum.
+
+    A real FFT only computes the non-negative frequencies, which is all the analytic
+    signal needs, and the transform is zero padded to a 5-smooth length so that
+    awkward trace lengths do not hit slow FFT sizes.
+
+    Parameters:
+        trace (ndarray): Real trace, or a 2D array with one trace per row.
+        workers (int): Number of FFT threads, -1 for all cores.
+
+    Returns:
+        ndarray: Complex analytic signal with the same shape as ``trace``.
+    """
+    n = trace.shape[-1]
+    n_fft = next_fast_len(n, real=True)
+    spectrum = rfft(trace, n=n_fft, axis=-1, workers=workers)
+
+    # Double the positive frequencies and zero the negative ones
+    one_sided = np.zeros(spectrum.shape[:-1] + (n_fft,), dtype=spectrum.dtype)
+    half = n_fft // 2
+    one_sided[..., 0] = spectrum[..., 0]
+    np.multiply(spectrum[..., 1:(n_fft + 1) // 2], 2.0, out=one_sided[..., 1:(n_fft + 1) // 2])
+    if n_fft % 2 == 0:
+        one_sided[..., half] = spectrum[..., half]
+    return ifft(one_sided, axis=-1, workers=workers)[..., :n]
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _inst_attrs(re, im, inv_two_pi_dt):
+        """
+        Amplitude, phase and frequency of analytic signals in one fused pass.
+
+        ``re`` and ``im`` have shape (n_traces, n_samples); the loops run in parallel over
+        every sample of every trace, so a single long trace is parallel as well as a gather.
+        """
+        n_traces, n = re.shape
+        amp = np.empty((n_traces, n), dtype=re.dtype)
+        phase = np.empty((n_traces, n), dtype=re.dtype)
+        freq = np.empty((n_traces, n), dtype=re.dtype)
+        for k in prange(n_traces * n):
+            t, i = k // n, k % n
+            amp[t, i] = np.sqrt(re[t, i] * re[t, i] + im[t, i] * im[t, i])
+            phase[t, i] = np.arctan2(im[t, i], re[t, i])
+        # The unwrapped phase difference is the raw one wrapped to [-pi, pi]
+        two_pi = 2.0 * np.pi
+        for k in prange(n_traces * n):
+            t, i = k // n, k % n
+            if i > 0:
+                d = phase[t, i] - phase[t, i - 1]
+                d -= two_pi * np.round(d / two_pi)
+                freq[t, i] = d * inv_two_pi_dt
+        if n > 1:
+            for t in range(n_traces):
+                freq[t, 0] = freq[t, 1]
+        return amp, phase, freq
+
+
+def instantaneous_attributes(trace, fs, dtype=None):
     """
     Instantaneous attributes are derived from the analytic signal and provide information
     about the seismic trace at every point in time. The key instantaneous attributes are 
     instantaneous amplitude, instantaneous phase, and instantaneous frequency.
+    The attributes are float32 for a float32 trace and float64 otherwise, unless ``dtype``
+    is given. A 2D gather of shape (n_traces, n_samples) is processed in one batched FFT
+    and the returned attributes are 2D arrays of the same shape.
     """
-    t = np.arange(len(trace)) / fs  # Time vector based on the sampling frequency
+    inv = fs / (2.0 * np.pi)  # Converts phase increments per sample to Hz
+
+    trace = np.asarray(trace)
+    if trace.shape[-1] < 2:
+        raise ValueError("Instantaneous attributes need traces of at least 2 samples")
 
     # Compute the analytic signal using the Hilbert transform
-    analytic_signal = hilbert(trace)
+    analytic_signal = _analytic_signal(trace.astype(_float_dtype(trace, dtype), copy=False))
+
+    if NUMBA_AVAILABLE:
+        gather = analytic_signal.reshape(-1, analytic_signal.shape[-1])
+        amplitude, phase, frequency = (attribute.reshape(analytic_signal.shape)
+                                       for attribute in _inst_attrs(gather.real, gather.imag, inv))
+        return {
+            'instantaneous_amplitude': amplitude,
+            'instantaneous_phase': phase,
+            'instantaneous_frequency': frequency
+        }
 
     # Compute instantaneous attributes
     instantaneous_amplitude = np.abs(analytic_signal)  # Instantaneous Amplitude
     instantaneous_phase = np.angle(analytic_signal)    # Instantaneous Phase
     
-    # Instantaneous Frequency (derivative of unwrapped phase)
-    unwrapped_phase = np.unwrap(instantaneous_phase)
-    instantaneous_frequency = np.diff(unwrapped_phase) / (2.0 * np.pi * (t[1] - t[0]))
-    
-    # Pad to match original length
-    instantaneous_frequency = np.concatenate(([instantaneous_frequency[0]], instantaneous_frequency))
+    # Instantaneous Frequency (derivative of unwrapped phase). The difference of the
+    # unwrapped phase is the raw difference wrapped to [-pi, pi], so round to the
+    # nearest turn instead of running np.unwrap and differencing its cumulative sum.
+    # The difference is written straight into a full-length buffer and padded in place
+    instantaneous_frequency = np.empty_like(instantaneous_phase)
+    dphase = instantaneous_frequency[..., 1:]
+    np.subtract(instantaneous_phase[..., 1:], instantaneous_phase[..., :-1], out=dphase)
+    dphase -= (2.0 * np.pi) * np.round(dphase * (1.0 / (2.0 * np.pi)))
+    instantaneous_frequency *= inv
+    instantaneous_frequency[..., 0] = instantaneous_frequency[..., 1]
 
     # Store all results in a dictionary
     attributes = {
@@ -7,10 +7,89 @@ Gain functions are used to enhance or balance the amplitude of seismic traces du
 Functions:
     agc_gain(data, window_size): Applies Automatic Gain Control (AGC) to seismic data.
     tvg_gain(data, time_gradient): Applies Time-Variant Gain (TVG) to seismic data.
-    constant_gain(data, gain_factor): Applies a constant gain factor to seismic data.
+    constant_gain(data, gain_factor, out=None, inplace=False): Applies a constant gain factor to seismic data.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import numpy as np
+from scipy.ndimage import uniform_filter1d
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional, fall back to the NumPy implementation
+    NUMBA_AVAILABLE = False
+
+# Working-set budget (~ a typical per-core L2 cache) for the blocked NumPy AGC path
+AGC_BLOCK_BYTES = 1 << 20
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _agc_kernel(data, out, window_size):
+        """Rolling-sum AGC kernel, one trace per thread (same windows as np.convolve mode='same')."""
+        n_traces, n_samples = data.shape
+        before = window_size // 2
+        after = (window_size - 1) // 2
+        inv_window = 1.0 / window_size
+
+        for i in prange(n_traces):
+            # Energy of the window centred on the first sample
+            acc = 0.0
+            for j in range(min(after + 1, n_samples)):
+                acc += np.float64(data[i, j]) * data[i, j]
+
+            for k in range(n_samples):
+                mean_sq = acc * inv_window
+                if mean_sq < 1e-20:
+                    mean_sq = 1e-20
+                out[i, k] = data[i, k] / np.sqrt(mean_sq)
+
+                # Slide the window one sample forward
+                drop = k - before
+                if drop >= 0:
+                    acc -= np.float64(data[i, drop]) * data[i, drop]
+                add = k + after + 1
+                if add < n_samples:
+                    acc += np.float64(data[i, add]) * data[i, add]
+
+
+def _agc_block(data, out, window_size, squared, mean_sq):
+    """
+    NumPy/SciPy AGC of a block of traces, written into `out`.
+
+    `squared` and `mean_sq` are scratch buffers with the shape of `data`, reused
+    across blocks so the loop does not allocate per block.
+    """
+    # Local mean square within the sliding window. Zero padding at the edges
+    # keeps the result identical to np.convolve(..., mode='same').
+    np.square(data, out=squared)
+    uniform_filter1d(squared, size=window_size, axis=1, output=mean_sq, mode='constant')
+
+    # Prevent division by zero by setting a minimum threshold (1e-10 on the RMS)
+    np.maximum(mean_sq, 1e-20, out=mean_sq)
+    rms = np.sqrt(mean_sq, out=mean_sq)
+
+    # Normalize the traces by the local RMS to apply AGC
+    np.divide(data, rms, out=out, casting='unsafe')
+
+
+def _agc_traces(data, out, window_size, block, work_dtype):
+    """Blocked NumPy/SciPy AGC over a range of traces, with scratch buffers private to the caller."""
+    n_traces, n_samples = data.shape
+    block = min(block, n_traces)
+
+    # Scratch buffers are allocated once and reused by every block
+    squared = np.empty((block, n_samples), dtype=work_dtype)
+    mean_sq = np.empty((block, n_samples), dtype=work_dtype)
+
+    for start in range(0, n_traces, block):
+        stop = min(start + block, n_traces)
+        rows = stop - start
+        _agc_block(data[start:stop], out[start:stop], window_size, squared[:rows], mean_sq[:rows])
+
 
 def agc_gain(data, window_size):
     
@@ -31,26 +110,60 @@ def agc_gain(data, window_size):
     """
 
     n_traces, n_samples = data.shape
-    agc_data = np.zeros_like(data)
-    
-    # Apply AGC to each trace
-    for i in range(n_traces):
-        trace = data[i]
-        # Compute the envelope (magnitude) of the trace
-        envelope = np.abs(trace)
-        
-        # Calculate the local RMS (root mean square) within the window
-        rms = np.sqrt(np.convolve(envelope**2, np.ones(window_size)/window_size, mode='same'))
-        
-        # Prevent division by zero by setting a minimum threshold
-        rms[rms < 1e-10] = 1e-10
-        
-        # Normalize the trace by the local RMS to apply AGC
-        agc_data[i] = trace / rms
-    
+    agc_data = np.empty_like(data)
+
+    if NUMBA_AVAILABLE:
+        _agc_kernel(np.ascontiguousarray(data), agc_data, window_size)
+        return agc_data
+
+    # float32 sections (the usual SEG-Y case) stay in single precision: the
+    # filter accumulates in double internally, so only the memory traffic halves.
+    work_dtype = np.float32 if data.dtype == np.float32 else np.float64
+
+    # Process blocks of traces small enough for the squared, RMS and output
+    # buffers to stay resident in cache between the passes.
+    block = max(1, AGC_BLOCK_BYTES // (3 * n_samples * np.dtype(work_dtype).itemsize))
+    block = min(block, n_traces)
+
+    # Independent trace ranges run on a thread pool; the NumPy/SciPy kernels
+    # release the GIL, so the ranges are processed on separate cores.
+    n_workers = min(os.cpu_count() or 1, int(np.ceil(n_traces / block)))
+    if n_workers <= 1:
+        _agc_traces(data, agc_data, window_size, block, work_dtype)
+        return agc_data
+
+    bounds = np.linspace(0, n_traces, n_workers + 1).astype(int)
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [executor.submit(_agc_traces, data[start:stop], agc_data[start:stop], window_size, block, work_dtype)
+                   for start, stop in zip(bounds[:-1], bounds[1:])]
+        for future in futures:
+            future.result()
+
     return agc_data
 
 
+@lru_cache(maxsize=32)
+def _tvg_curve(n_samples, time_gradient):
+    """
+    Build the read-only TVG curve t**time_gradient for t = 1..n_samples.
+
+    Integer and half-integer gradients (the common cases) are specialised into
+    repeated multiplies and a single sqrt instead of a per-element pow.
+    """
+    t = np.arange(1, n_samples + 1, dtype=np.float64)
+    whole = int(time_gradient)
+
+    if time_gradient >= 0 and time_gradient - whole in (0.0, 0.5):
+        curve = np.sqrt(t) if time_gradient - whole == 0.5 else np.ones_like(t)
+        for _ in range(whole):
+            curve *= t
+    else:
+        curve = np.power(t, time_gradient)
+
+    curve.setflags(write=False)
+    return curve
+
+
 def tvg_gain(data, time_gradient):
     
     """
@@ -71,18 +184,17 @@ def tvg_gain(data, time_gradient):
     """
 
     n_traces, n_samples = data.shape
-    tvg_data = np.zeros_like(data)
-    
-    # Generate a time gain curve that increases with time
-    time_curve = np.arange(1, n_samples + 1) ** time_gradient
 
-    # Apply the time gain curve to each trace
-    for i in range(n_traces):
-        tvg_data[i] = data[i] * time_curve
-    
+    # Generate a time gain curve that increases with time (cached per length and gradient)
+    time_curve = _tvg_curve(n_samples, float(time_gradient))
+
+    # Apply the time gain curve to all traces at once (broadcast over rows)
+    tvg_data = np.empty_like(data)
+    np.multiply(data, time_curve, out=tvg_data, casting='unsafe')
+
     return tvg_data
 
-def constant_gain(data, gain_factor):
+def constant_gain(data, gain_factor, out=None, inplace=False):
     
     """
     Apply a Constant Gain to the seismic data.
@@ -94,10 +206,25 @@ def constant_gain(data, gain_factor):
         data (ndarray): 2D array of seismic data, where each row corresponds to a trace 
                         and each column represents a sample (n_traces, n_samples).
         gain_factor (float): A constant factor used to amplify the seismic data.
+        out (ndarray, optional): Preallocated array, same shape as `data`, to write the result into.
+        inplace (bool): If True, scale `data` in place and return it (default: False).
 
     Returns:
         const_gain_data (ndarray): 2D array of seismic data after applying the constant gain.
+                                   When `gain_factor` is 1.0 and no output is requested, `data` itself is returned.
     """
-    
-    const_gain_data = data * gain_factor
-    return const_gain_data
+
+    if inplace:
+        np.multiply(data, gain_factor, out=data, casting='unsafe')
+        return data
+
+    if gain_factor == 1.0 and out is None:
+        return data
+
+    if out is None:
+        const_gain_data = np.empty(np.shape(data), np.result_type(data, gain_factor))
+        np.multiply(data, gain_factor, out=const_gain_data)
+        return const_gain_data
+
+    np.multiply(data, gain_factor, out=out, casting='unsafe')
+    return out
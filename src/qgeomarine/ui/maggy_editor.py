@@ -10,19 +10,25 @@ It uses PyQt6 for the GUI and pandas for data manipulation.
 """
 
 import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 import re
 import logging
 import sqlite3
+import numpy as np
 import pandas as pd
 import pyqtgraph as pg
 from PyQt6 import QtWidgets, QtCore, QtGui
 from PyQt6.QtWidgets import (
-    QTableWidgetItem, QTreeWidgetItem, QHeaderView, QComboBox,
+    QTreeWidgetItem, QHeaderView, QComboBox,
     QVBoxLayout, QWidget, QFileDialog, QMessageBox
 )
-from PyQt6.QtCore import Qt, QSortFilterProxyModel
-from qgeomarine.ui.ui import Maggy_editor_UI  
+from PyQt6.QtCore import (
+    Qt, QSortFilterProxyModel, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool, pyqtSignal
+)
+from qgeomarine.ui.ui import Maggy_editor_UI, apply_app_stylesheet
 from qgeomarine.core.maps.grids import grid
 logging.basicConfig(
     level=logging.DEBUG, 
@@ -30,6 +36,263 @@ logging.basicConfig(
     stream=sys.stdout
     )
 
+# Rows fetched per step when streaming a table into the editor
+TABLE_CHUNK_ROWS = 10_000
+# Name under which a table's rowid is loaded as the DataFrame index
+ROWID_INDEX = "_rowid_"
+
+# Channel Math expression patterns, compiled once for translate_expression
+_ROLL_RE = re.compile(r'\broll(mean|sum)\(\s*(C\d+)\s*,\s*(\d+)\s*\)')
+_OFFSET_RE = re.compile(r'\b(C\d+)(?:\.offset\((-?\d+)\))?')
+
+# Functions whose SQL form rewrites the argument list
+_FUNC_ARG_MAP = {
+    "square": "POWER({}, 2)",
+    "countdistinct": "COUNT(DISTINCT {})",
+}
+
+# Functions that only need renaming
+_FUNC_MAP = {
+    "sqrt": "SQRT",
+    "abs": "ABS",
+    "log": "LOG",
+    "ln": "LOG",
+    "log10": "LOG10",
+    "cos": "COS",
+    "sin": "SIN",
+    "tan": "TAN",
+    "atan": "ATAN",
+    "atan2": "ATAN2",
+    "pow": "POWER",  # Note: Ideally power(x,y)
+    "floor": "FLOOR",
+    "ceil": "CEIL",
+    "round": "ROUND",
+    "exp": "EXP",
+    # statistical functions
+    "mean": "AVG",
+    "median": "MEDIAN",  # Note: Only some DBs support this
+    "std": "STDDEV",
+    "var": "VARIANCE",
+    "min": "MIN",
+    "max": "MAX",
+    "sum": "SUM",
+    "count": "COUNT",
+    "first": "FIRST_VALUE",
+    "last": "LAST_VALUE",
+    # mode usually needs special handling
+}
+
+_FUNC_ARG_RE = re.compile(r'\b(' + '|'.join(_FUNC_ARG_MAP) + r')\(([^)]+)\)')
+_FUNC_RE = re.compile(
+    r'\b(' + '|'.join(sorted(map(re.escape, _FUNC_MAP), key=len, reverse=True)) + r')\('
+)
+
+# Functions the pandas evaluator supports, mapped to DataFrame.eval names.
+# log follows SQLite, where LOG(x) is the base-10 logarithm.
+_PANDAS_FUNC_MAP = {
+    "sqrt": "sqrt",
+    "abs": "abs",
+    "log": "log10",
+    "ln": "log",
+    "log10": "log10",
+    "exp": "exp",
+    "cos": "cos",
+    "sin": "sin",
+    "tan": "tan",
+    "atan": "arctan",
+    "atan2": "arctan2",
+}
+_PANDAS_FUNC_RE = re.compile(r'\b(' + '|'.join(_PANDAS_FUNC_MAP) + r')\(')
+_IDENT_RE = re.compile(r'\b[A-Za-z_]\w*\b')
+
+
+def quote_identifier(name):
+    """
+    Quote a table or column name for use in SQL.
+
+    Identifiers cannot be bound as parameters, so they are double-quoted with
+    embedded quotes doubled, as SQLite expects.
+    Args:
+        name (str): The table or column name.
+    Returns:
+        str: The quoted identifier.
+    """
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+@lru_cache(maxsize=32)
+def select_table_sql(table, with_rowid):
+    """
+    Return the statement loading a whole table, optionally with its rowid first.
+
+    Statements are cached so repeated loads reuse the same SQL text, which
+    also lets sqlite3 reuse its compiled statement.
+    """
+    if with_rowid:
+        return f'SELECT rowid AS {quote_identifier(ROWID_INDEX)}, * FROM {quote_identifier(table)}'
+    return f'SELECT * FROM {quote_identifier(table)}'
+
+
+@lru_cache(maxsize=128)
+def update_cell_sql(table, column, key_sql):
+    """Return the cached UPDATE statement writing one cell of ``column`` addressed by ``key_sql``."""
+    return f'UPDATE {quote_identifier(table)} SET {quote_identifier(column)} = ? WHERE {key_sql} = ?'
+
+
+@contextmanager
+def bulk_write(conn):
+    """
+    Run a multi-statement write as one IMMEDIATE transaction.
+
+    Syncing is relaxed to OFF for the duration of the batch and the
+    connection's previous setting is restored afterwards; the transaction is rolled back if any statement fails.
+    Args:
+        conn (sqlite3.Connection): Connection to write through.
+    Yields:
+        sqlite3.Cursor: Cursor to issue the statements on.
+    """
+    synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+    conn.execute("PRAGMA synchronous=OFF")
+    cursor = conn.cursor()
+    try:
+        cursor.execute("BEGIN IMMEDIATE")
+        yield cursor
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.execute(f"PRAGMA synchronous={synchronous}")
+
+
+class SqlTaskSignals(QObject):
+    """Signals emitted by SqlTask: the task's return value, or the error message."""
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class SqlTask(QRunnable):
+    """
+    Runs ``fn(conn)`` on a QThreadPool thread with its own SQLite connection.
+
+    SQLite connections cannot be shared across threads, so every task opens
+    and closes a private one. The result is delivered to the GUI thread
+    through ``signals.finished``; exceptions through ``signals.error``.
+
+    Args:
+        db_file_path (str): Path to the SQLite database file.
+        fn (callable): Function taking the connection and doing the work.
+    """
+
+    def __init__(self, db_file_path, fn):
+        super().__init__()
+        self.db_file_path = db_file_path
+        self.fn = fn
+        self.signals = SqlTaskSignals()
+
+    def run(self):
+        conn = sqlite3.connect(self.db_file_path)
+        try:
+            result = self.fn(conn)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+        finally:
+            conn.close()
+
+
+class PandasModel(QAbstractTableModel):
+    """
+    Table model exposing a pandas DataFrame to a QTableView.
+
+    Cells are only converted to strings when the view asks for them, so
+    loading a table no longer allocates one QTableWidgetItem per cell.
+    Edits are written back into the DataFrame and announced through
+    ``dataChanged``.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to display.
+        parent (QObject, optional): Parent object.
+    """
+
+    def __init__(self, df, parent=None):
+        super().__init__(parent)
+        self._df = df
+        # One ndarray per column: cell lookups become plain array indexing
+        # instead of going through DataFrame.iat on every paint.
+        self._columns = [df[name].to_numpy(copy=False) for name in df.columns]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._df.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._df.shape[1]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return str(self._columns[index.column()][index.row()])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return str(self._df.columns[section])
+        return str(section)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        row, col = index.row(), index.column()
+        if pd.api.types.is_numeric_dtype(self._df.dtypes.iloc[col]):
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                return False
+        self._df.iat[row, col] = value
+        self._columns[col] = self._df.iloc[:, col].to_numpy(copy=False)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def set_dataframe(self, df):
+        """
+        Replace the displayed DataFrame with a single model reset.
+
+        Args:
+            df (pd.DataFrame): The new DataFrame to display.
+        """
+        self.beginResetModel()
+        self._df = df
+        self._columns = [df[name].to_numpy(copy=False) for name in df.columns]
+        self.endResetModel()
+
+    def dataframe(self):
+        """Return the DataFrame currently shown by the model."""
+        return self._df
+
+    def append_rows(self, df):
+        """
+        Append the rows of ``df`` to the end of the model.
+
+        Args:
+            df (pd.DataFrame): Rows with the same columns as the model.
+        """
+        if df.empty:
+            return
+        first = self._df.shape[0]
+        self.beginInsertRows(QModelIndex(), first, first + df.shape[0] - 1)
+        self._df = pd.concat([self._df, df], copy=False)
+        self._columns = [self._df[name].to_numpy(copy=False) for name in self._df.columns]
+        self.endInsertRows()
+
 class MaggyEditor(QtWidgets.QMainWindow):
     """
     MaggyEditor is the main window class for the Maggy Editor application, providing a graphical interface for loading,
@@ -50,12 +313,19 @@ class MaggyEditor(QtWidgets.QMainWindow):
         add_file_to_tree(file_path): Adds a file to the tree view in the UI.
         load_table_names(): Loads table names from the database and populates the selector.
         load_selected_table(): Loads the selected table and displays it in the UI.
-        populate_table_widget(df): Populates the data table widget with DataFrame data.
+        _table_columns(table): Returns the cached column names of a table.
+        _row_key(table): Returns the indexed column used to address table rows.
+        _load_next_chunk(): Appends the next chunk of a table that is still streaming.
+        _finish_loading(): Reads the remaining chunks of a streaming table at once.
+        populate_table_widget(df): Displays DataFrame data in the table view through a PandasModel.
         show_context_menu(pos): Displays a context menu for table actions.
         plot_column_data(): Plots the data of the selected column.
-        save_changes(item): Saves changes made in the table widget back to the database.
+        save_changes(top_left, bottom_right, roles): Queues edits from the table model for the database.
+        _flush_pending(): Writes the queued edits in one transaction.
+        _run_sql_task(table, write, done_message): Runs a database write on the thread pool.
         MaggyAnalysisWin(): Opens the analysis window for advanced plotting and analysis.
         create_column(): Creates a new column in the database using a user-defined expression.
+        evaluate_expression(expr, var_map, df): Evaluates an expression on the loaded data with pandas.
         translate_expression(expr, var_map): Translates a custom expression into a valid SQL expression.
         delete_column(): Deletes a column from the database.
         closeEvent(event): Handles application close events.
@@ -77,10 +347,36 @@ class MaggyEditor(QtWidgets.QMainWindow):
         self.db_file_path = db_file_path
         self.dataFrame = None
         self.table_names = []
+        self._schema_version = None
         self.project_data = project_data
+        # One long-lived connection shared by every editor operation
         self.conn = sqlite3.connect(self.db_file_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
         self.current_line = None
-
+        self._row_keys = {}
+        self._model = None
+        self._sql_tasks = set()
+        self._edit_triggers = None
+        self._columns_cache = {}
+        self._column_curve = None
+
+        # Cell edits are buffered and written in one transaction shortly after
+        # the last edit, instead of one UPDATE + commit per cell.
+        self._pending = {}
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
+        # Tables are streamed in chunks: the first one is shown immediately and
+        # the rest are appended from the event loop.
+        self._chunks = None
+        self._chunk_timer = QtCore.QTimer(self)
+        self._chunk_timer.setSingleShot(True)
+        self._chunk_timer.setInterval(0)
+        self._chunk_timer.timeout.connect(self._load_next_chunk)
         
         # Set the LineSelector combobox
         self.lineSelector = self.ui.lineSelection
@@ -104,7 +400,6 @@ class MaggyEditor(QtWidgets.QMainWindow):
     def setup_connections(self):
         """Set up connections for UI elements."""
         self.lineSelector.currentIndexChanged.connect(self.load_selected_table)
-        self.ui.dataTable.itemChanged.connect(self.save_changes)
 
 
     def add_file_to_tree(self, file_path):
@@ -115,19 +410,33 @@ class MaggyEditor(QtWidgets.QMainWindow):
         root.addChild(file_item)
 
     def load_table_names(self):
-        """Load table names from the SQLite database and populate the LineSelector combobox."""
-        try:
-            conn = sqlite3.connect(self.db_file_path)
-            tables_query = "SELECT name FROM sqlite_master WHERE type='table';"
-            self.table_names = pd.read_sql_query(tables_query, conn)['name'].tolist()
-            conn.close()
-
-            if not self.table_names:
-                logging.warning("No tables found in the database.")
-                return
+        """
+        Load table names from the SQLite database, populate the LineSelector combobox
+        and reload the selected table.
 
-            self.lineSelector.clear()
-            self.lineSelector.addItems(self.table_names)
+        The list is cached against PRAGMA schema_version, which SQLite bumps on every
+        schema change from any connection, so calling this again after a write that
+        left the schema unchanged does not re-query sqlite_master or refill the selector.
+        """
+        try:
+            schema_version = self.conn.execute("PRAGMA schema_version").fetchone()[0]
+            if schema_version != self._schema_version:
+                tables_query = "SELECT name FROM sqlite_master WHERE type='table';"
+                self.table_names = [row[0] for row in self.conn.execute(tables_query)]
+                self._schema_version = schema_version
+
+                if not self.table_names:
+                    logging.warning("No tables found in the database.")
+                    return
+
+                # Fill the selector silently, keeping the current table, so it is loaded once below
+                current = self.lineSelector.currentText()
+                self.lineSelector.blockSignals(True)
+                self.lineSelector.clear()
+                self.lineSelector.addItems(self.table_names)
+                if current in self.table_names:
+                    self.lineSelector.setCurrentText(current)
+                self.lineSelector.blockSignals(False)
             self.load_selected_table()
 
         except sqlite3.Error as e:
@@ -139,30 +448,115 @@ class MaggyEditor(QtWidgets.QMainWindow):
         if not selected_table:
             return
 
+        self._flush_pending()
+        # Drop whatever is left of the previously streaming table
+        self._chunk_timer.stop()
+        self._chunks = None
         try:
             self.current_line = selected_table
-            conn = sqlite3.connect(self.db_file_path)
-            query = f"SELECT * FROM {selected_table}"
-            self.dataFrame = pd.read_sql_query(query, conn)
-            conn.close()
-            
+            row_key = self._row_key(selected_table)
+            # With a rowid, keep it as the DataFrame index so edits can address
+            # rows through SQLite's built-in rowid index.
+            query = select_table_sql(selected_table, row_key == "rowid")
+            index_col = ROWID_INDEX if row_key == "rowid" else None
+            self._chunks = pd.read_sql_query(query, self.conn, index_col=index_col,
+                                             chunksize=TABLE_CHUNK_ROWS)
+            self.dataFrame = next(self._chunks, None)
+            if self.dataFrame is None:
+                self._chunks = None
+                self.dataFrame = pd.read_sql_query(f"{query} LIMIT 0", self.conn, index_col=index_col)
+
+            self._columns_cache[selected_table] = list(self.dataFrame.columns)
             self.populate_table_widget(self.dataFrame)
             logging.info(f"Loaded table: {selected_table}")
+            if self._chunks is not None:
+                self._chunk_timer.start()
         except sqlite3.Error as e:
             QMessageBox.warning(self, "Database Error", str(e))
 
-    def populate_table_widget(self, df):
-        """Populate the data table widget with the given DataFrame."""
-        self.ui.dataTable.blockSignals(True)
-        self.ui.dataTable.setRowCount(df.shape[0])
-        self.ui.dataTable.setColumnCount(df.shape[1])
-        self.ui.dataTable.setHorizontalHeaderLabels(df.columns)
+    def _row_key(self, table):
+        """
+        Return the column used to address single rows of a table in UPDATEs.
 
-        for row_idx, row in df.iterrows():
-            for col_idx, value in enumerate(row):
-                self.ui.dataTable.setItem(row_idx, col_idx, QTableWidgetItem(str(value)))
+        This is ``rowid`` for ordinary tables. WITHOUT ROWID tables use their
+        declared primary key, which SQLite always indexes. The answer is cached
+        per table.
+        """
+        if table not in self._row_keys:
+            try:
+                self.conn.execute(f'SELECT rowid FROM {quote_identifier(table)} LIMIT 0')
+                self._row_keys[table] = "rowid"
+            except sqlite3.OperationalError:
+                info = self.conn.execute(f'PRAGMA table_info({quote_identifier(table)})').fetchall()
+                pk_cols = sorted((row[5], row[1]) for row in info if row[5] > 0)
+                self._row_keys[table] = pk_cols[0][1] if pk_cols else info[0][1]
+        return self._row_keys[table]
+
+    def _table_columns(self, table):
+        """
+        Return the column names of a table.
 
-        self.ui.dataTable.blockSignals(False)
+        Uses the names recorded by the last load of the table, falling back to
+        PRAGMA table_info, which reads only the schema.
+        """
+        if table not in self._columns_cache:
+            info = self.conn.execute(f'PRAGMA table_info({quote_identifier(table)})').fetchall()
+            self._columns_cache[table] = [row[1] for row in info]
+        return self._columns_cache[table]
+
+    def _load_next_chunk(self):
+        """Append the next chunk of the table being loaded to the data table view."""
+        if self._chunks is None:
+            return
+        try:
+            chunk = next(self._chunks, None)
+        except sqlite3.Error as e:
+            self._chunks = None
+            QMessageBox.warning(self, "Database Error", str(e))
+            return
+        if chunk is None:
+            self._chunks = None
+            return
+
+        self._model.append_rows(chunk)
+        self.dataFrame = self._model.dataframe()
+        self._chunk_timer.start()
+
+    def _finish_loading(self):
+        """Read the rest of a table that is still streaming, releasing its cursor before writes."""
+        self._chunk_timer.stop()
+        if self._chunks is None:
+            return
+        rest = list(self._chunks)
+        self._chunks = None
+        if rest:
+            self._model.append_rows(pd.concat(rest, copy=False))
+            self.dataFrame = self._model.dataframe()
+
+    def populate_table_widget(self, df):
+        """Populate the data table view with the given DataFrame."""
+        table = self.ui.dataTable
+        header = table.horizontalHeader()
+        # Swap the data with repaints, sorting and header resizing suspended
+        table.setUpdatesEnabled(False)
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        resize_mode = header.sectionResizeMode(0) if header.count() else QHeaderView.ResizeMode.Interactive
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        try:
+            if self._model is None:
+                self._model = PandasModel(df, self)
+                self._model.dataChanged.connect(self.save_changes)
+                table.setModel(self._model)
+            else:
+                self._model.set_dataframe(df)
+        finally:
+            header.setSectionResizeMode(resize_mode)
+            table.setSortingEnabled(sorting)
+            # Size the columns once, from a bounded sample of rows
+            header.setResizeContentsPrecision(TABLE_CHUNK_ROWS // 100)
+            table.resizeColumnsToContents()
+            table.setUpdatesEnabled(True)
         logging.info("Data successfully loaded into the table.")
 
     def show_context_menu(self, pos):
@@ -179,41 +573,79 @@ class MaggyEditor(QtWidgets.QMainWindow):
     
     def plot_column_data(self):
         """Plot the data of the selected column in the data table."""
-        selected_column = self.ui.dataTable.currentColumn()
+        selected_column = self.ui.dataTable.currentIndex().column()
         if selected_column == -1 or self.dataFrame is None:
             QMessageBox.warning(self, "Plot Error", "No column selected or no data loaded.")
             return
 
-        column_name = self.ui.dataTable.horizontalHeaderItem(selected_column).text()
+        column_name = self.dataFrame.columns[selected_column]
         if column_name not in self.dataFrame.columns:
             QMessageBox.warning(self, "Plot Error", "Invalid column selected.")
             return
         
-        self.ui.plotWidget.clear()
-        self.ui.plotWidget.plot(self.dataFrame[column_name].to_numpy(), pen="b")
+        if self._column_curve is None:
+            # One curve is reused for every column; NaNs just break the line.
+            self._column_curve = self.ui.plotWidget.plot(pen="b", connect='finite', skipFiniteCheck=True)
+            # Peak (min/max per pixel) decimation of the visible range keeps the
+            # drawn path proportional to the widget width, not the column length.
+            self._column_curve.setDownsampling(auto=True, method='peak')
+            self._column_curve.setClipToView(True)
+        self._column_curve.setData(self._column_values(column_name))
         logging.info(f"Plotted column: {column_name}")
     
-    def save_changes(self, item):
-        """Save changes made to the data table back to the database."""
+    def _column_values(self, column_name):
+        """Return a column of the loaded data as a contiguous float32 array for plotting."""
+        values = pd.to_numeric(self.dataFrame[column_name], errors="coerce")
+        return np.ascontiguousarray(values.to_numpy(dtype=np.float32, na_value=np.nan))
+
+    def save_changes(self, top_left, bottom_right=None, roles=None):
+        """Queue changes made to the data table; they are written by _flush_pending."""
         selected_table = self.lineSelector.currentText()
         if not selected_table:
             return
 
-        row, col = item.row(), item.column()
-        new_value = item.text()
-        column_name = self.dataFrame.columns[col]
-        primary_key_col = self.dataFrame.columns[0]
-        primary_key_value = self.dataFrame.iloc[row, 0]
-        
+        bottom_right = bottom_right or top_left
+        row_key = self._row_key(selected_table)
+        if row_key == "rowid":
+            key_sql, key_values = "rowid", self.dataFrame.index
+        else:
+            key_sql, key_values = quote_identifier(row_key), self.dataFrame[row_key]
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            key_value = key_values[row] if row_key == "rowid" else key_values.iat[row]
+            for col in range(top_left.column(), bottom_right.column() + 1):
+                column_name = self.dataFrame.columns[col]
+                key = (selected_table, column_name, key_sql, key_value)
+                self._pending[key] = self.dataFrame.iat[row, col]
+        self._flush_timer.start()
+
+    def _flush_pending(self):
+        """
+        Write all buffered cell edits to the database in a single transaction.
+
+        While a background SqlTask holds the write lock the edits stay queued, and
+        they are put back in the queue if the write fails.
+        """
+        self._flush_timer.stop()
+        if not self._pending or self._sql_tasks:
+            return
+        self._finish_loading()
+
+        # Group the edits per (table, column) so each group is one executemany
+        batches = {}
+        for (table, column, key_sql, key_value), value in self._pending.items():
+            params = (getattr(value, "item", lambda: value)(),
+                      getattr(key_value, "item", lambda: key_value)())
+            batches.setdefault((table, column, key_sql), []).append(params)
+        pending, self._pending = self._pending, {}
+
         try:
-            conn = sqlite3.connect(self.db_file_path)
-            cursor = conn.cursor()
-            query = f"UPDATE {selected_table} SET {column_name} = ? WHERE {primary_key_col} = ?"
-            cursor.execute(query, (new_value, primary_key_value))
-            conn.commit()
-            conn.close()
+            with self.conn:
+                for (table, column, key_sql), params in batches.items():
+                    self.conn.executemany(update_cell_sql(table, column, key_sql), params)
             logging.info("Database updated successfully")
         except sqlite3.Error as e:
+            # Keep the edits, letting any made since take precedence
+            self._pending = {**pending, **self._pending}
             QMessageBox.warning(self, "Database Error", str(e))
 
     def MaggyAnalysisWin(self):
@@ -226,6 +658,8 @@ class MaggyEditor(QtWidgets.QMainWindow):
         self.ui.xcolumnInput.addItems(self.dataFrame.columns)
         self.ui.ycolumnInput.addItems(self.dataFrame.columns)
         
+        curve = self.ui.Plot.plot(pen='b', connect='finite', skipFiniteCheck=True)
+
         def trace_update():
             """Update the trace plot based on the selected x and y columns."""
 
@@ -239,8 +673,7 @@ class MaggyEditor(QtWidgets.QMainWindow):
             x_column = self.dataFrame.columns[x_idx]
             y_column = self.dataFrame.columns[y_idx]
             
-            self.ui.Plot.clear()
-            self.ui.Plot.plot(self.dataFrame[x_column], self.dataFrame[y_column], pen='b')
+            curve.setData(self._column_values(x_column), self._column_values(y_column))
             self.ui.Plot.setTitle(f"Plot of {y_column} vs {x_column}")
             
         # Uptate the trace plot based on the selected x and y columns
@@ -280,7 +713,7 @@ class MaggyEditor(QtWidgets.QMainWindow):
                     self.ui.frequencyPlot.setLabel('left', 'Power Spectral Density', units='')
 
                 elif index == 2:  # Welch Periodogram
-                    f, Pxx = trace_welch_periodogram(trace, fs=self.sample_rate)
+                    f, Pxx = trace_welch_periodogram(trace, fs=self.sample_rate, detrend='constant')
                     self.ui.frequencyPlot.clear()
                     self.ui.frequencyPlot.plot(f, Pxx, pen='b')
                     self.ui.frequencyPlot.setTitle(f"Welch Periodogram of Trace {trace_number}")
@@ -326,17 +759,18 @@ class MaggyEditor(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "No Table Selected", "Please select a table first.")
             return
 
-        # Step 1: Get column names from the DB
+        self._finish_loading()
+        self._flush_pending()
+
+        # Step 1: Get column names (cached from the last load)
         try:
-            conn = sqlite3.connect(self.db_file_path)
-            df = pd.read_sql_query(f"SELECT * FROM '{selected_table}' LIMIT 1", conn)
-            conn.close()
+            columns = self._table_columns(selected_table)
         except sqlite3.Error as e:
             QtWidgets.QMessageBox.critical(self, "Database Error", str(e))
             return
 
         # Step 2: Launch Channel Math Dialog
-        dialog = self.ui.ChannelMathDialog(columns=df.columns, parent=self)
+        dialog = self.ui.ChannelMathDialog(columns=columns, parent=self)
         if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
             return
 
@@ -350,42 +784,125 @@ class MaggyEditor(QtWidgets.QMainWindow):
             return
         new_column_name = new_column_name.strip()
 
-        # Step 4: Translate expression to SQL
-        try:
-            translated_sql_expr = self.translate_expression(expression, var_mapping)
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Translation Error", f"Failed to translate expression: {e}")
-            return
+        # Step 4: Evaluate in pandas when possible; otherwise fall back to SQL
+        new_values = None
+        if self._row_key(selected_table) == "rowid":
+            try:
+                new_values = self.evaluate_expression(expression, var_mapping, self.dataFrame)
+            except ValueError as e:
+                logging.info(f"Falling back to SQL evaluation: {e}")
+            except Exception as e:
+                QtWidgets.QMessageBox.critical(self, "Evaluation Error", f"Failed to evaluate expression: {e}")
+                return
+
+        if new_values is None:
+            try:
+                translated_sql_expr = self.translate_expression(expression, var_mapping)
+            except Exception as e:
+                QtWidgets.QMessageBox.critical(self, "Translation Error", f"Failed to translate expression: {e}")
+                return
+            logging.info(f"Final SQL Expression: {translated_sql_expr}")
+
+        # Step 5: Update database in the background
+        if new_values is not None:
+            params = list(zip(new_values.astype(object).where(new_values.notna(), None).tolist(),
+                              new_values.index.tolist()))
+
+        table_sql = quote_identifier(selected_table)
+        column_sql = quote_identifier(new_column_name)
+
+        def write(conn):
+            with bulk_write(conn) as cursor:
+                # Add the new column
+                cursor.execute(f'ALTER TABLE {table_sql} ADD COLUMN {column_sql} REAL')
+
+                if new_values is not None:
+                    # Write the values computed in pandas by rowid
+                    cursor.executemany(
+                        update_cell_sql(selected_table, new_column_name, "rowid"), params
+                    )
+                else:
+                    # Use CTE for complex expressions with LEAD/LAG
+                    update_query = f"""
+                    WITH computed AS (
+                        SELECT rowid, {translated_sql_expr} AS new_value
+                        FROM {table_sql}
+                    )
+                    UPDATE {table_sql}
+                    SET {column_sql} = (SELECT new_value FROM computed WHERE computed.rowid = {table_sql}.rowid)
+                    """
+                    cursor.execute(update_query)
+
+        self._run_sql_task(selected_table, write, f"Column '{new_column_name}' successfully added and updated.")
+
+    def evaluate_expression(self, expr, var_map, df):
+        """
+        Evaluates a Channel Math expression on the loaded DataFrame with pandas.
+
+        Offsets and rolling windows are computed as shifted/rolling Series, and the
+        remaining arithmetic runs through DataFrame.eval (numexpr when installed).
+        The windows match the SQL produced by translate_expression. Expressions with
+        division or modulo go to SQL so they keep SQLite's integer semantics.
+        Args:
+            expr (str): The Channel Math expression (e.g., 'sqrt(C0) - C1.offset(1)').
+            var_map (dict): A mapping from variable names (e.g., 'C0') to column names.
+            df (pd.DataFrame): The table data, indexed by rowid.
+        Returns:
+            pd.Series: The computed values, indexed like ``df`` in rowid order, with
+                non-finite results as NaN (written as NULL).
+        Raises:
+            ValueError: If the expression uses something only the SQL path supports.
+        """
+        if "/" in expr or "%" in expr:
+            # SQLite truncates integer division, returns NULL for a zero divisor and
+            # takes the sign of the dividend for modulo, unlike pandas
+            raise ValueError("Division and modulo are evaluated in SQL")
 
-        logging.info(f"Final SQL Expression: {translated_sql_expr}")
+        df = df.sort_index()
+        operands = {}
 
-        # Step 5: Update database
-        try:
-            conn = sqlite3.connect(self.db_file_path)
-            cursor = conn.cursor()
-
-            # Add the new column
-            cursor.execute(f'ALTER TABLE "{selected_table}" ADD COLUMN "{new_column_name}" REAL')
-
-            # Use CTE for complex expressions with LEAD/LAG
-            update_query = f"""
-            WITH computed AS (
-                SELECT rowid, {translated_sql_expr} AS new_value
-                FROM "{selected_table}"
-            )
-            UPDATE "{selected_table}"
-            SET "{new_column_name}" = (SELECT new_value FROM computed WHERE computed.rowid = "{selected_table}".rowid);
-            """
-
-            cursor.executescript(update_query)
-            conn.commit()
-            conn.close()
+        def operand(series):
+            name = f"v{len(operands)}"
+            operands[name] = series
+            return name
 
-            logging.info(f"Column '{new_column_name}' successfully added and updated.")
-            self.load_selected_table()
+        def column(var):
+            if var not in var_map:
+                raise ValueError(f"Unknown variable: {var}")
+            return pd.to_numeric(df[var_map[var]], errors="coerce")
 
-        except sqlite3.Error as e:
-            QtWidgets.QMessageBox.critical(self, "Database Error", str(e))
+        # Rolling windows: same frame as the SQL ROWS BETWEEN clause
+        def roll_repl(match):
+            func_name, var, window = match.group(1), match.group(2), int(match.group(3))
+            following = window // 2
+            # Pad the tail so the last rows see a truncated window, like SQL does
+            values = np.concatenate([column(var).to_numpy(dtype=float), np.full(following, np.nan)])
+            rolling = pd.Series(values).rolling(window, min_periods=1)
+            rolled = rolling.mean() if func_name == "mean" else rolling.sum()
+            return operand(pd.Series(rolled.to_numpy()[following:], index=df.index))
+
+        # Offsets: LEAD(n) is shift(-n), LAG(n) is shift(n)
+        def repl(match):
+            series = column(match.group(1))
+            if match.group(2):
+                series = series.shift(-int(match.group(2)))
+            return operand(series)
+
+        expr = _ROLL_RE.sub(roll_repl, expr)
+        expr = _OFFSET_RE.sub(repl, expr)
+        expr = _PANDAS_FUNC_RE.sub(lambda m: _PANDAS_FUNC_MAP[m.group(1)] + "(", expr)
+
+        allowed = set(operands) | set(_PANDAS_FUNC_MAP.values())
+        unsupported = set(_IDENT_RE.findall(expr)) - allowed
+        if unsupported:
+            raise ValueError(f"Unsupported names: {', '.join(sorted(unsupported))}")
+
+        result = pd.DataFrame(operands, index=df.index).eval(expr)
+        if not isinstance(result, pd.Series):
+            result = pd.Series(result, index=df.index)
+        result = result.astype(float)
+        # SQLite yields NULL where pandas yields +/-inf (e.g. log(0))
+        return result.where(np.isfinite(result))
 
     def translate_expression(self, expr, var_map):
         """
@@ -410,7 +927,7 @@ class MaggyEditor(QtWidgets.QMainWindow):
         def repl(match):
             var = match.group(1)
             offset = match.group(2)
-            column = f'"{var_map[var]}"'
+            column = quote_identifier(var_map[var])
 
             if offset:
                 offset_val = int(offset)
@@ -424,7 +941,7 @@ class MaggyEditor(QtWidgets.QMainWindow):
             func_name = match.group(1)
             var = match.group(2)
             window = int(match.group(3))
-            column = f'"{var_map[var]}"'
+            column = quote_identifier(var_map[var])
 
             if func_name == "mean":
                 agg_func = "AVG"
@@ -439,47 +956,14 @@ class MaggyEditor(QtWidgets.QMainWindow):
             return f"{agg_func}({column}) OVER (ORDER BY rowid ROWS BETWEEN {preceding} PRECEDING AND {following} FOLLOWING)"
 
         # --- Step 1: handle rollmean / rollsum
-        expr = re.sub(r'\broll(mean|sum)\(\s*(C\d+)\s*,\s*(\d+)\s*\)', 
-                    roll_repl, expr)
+        expr = _ROLL_RE.sub(roll_repl, expr)
 
         # --- Step 2: handle variables and offsets
-        expr = re.sub(r'\b(C\d+)(?:\.offset\((-?\d+)\))?', repl, expr)
+        expr = _OFFSET_RE.sub(repl, expr)
 
         # --- Step 3: replace math functions
-        func_map = {
-            "square": r"POWER(\1, 2)",
-            "sqrt": r"SQRT(\1)",
-            "abs": r"ABS(\1)",
-            "log": r"LOG(\1)",
-            "ln": r"LOG(\1)",
-            "log10": r"LOG10(\1)",
-            "cos": r"COS(\1)",
-            "sin": r"SIN(\1)",
-            "tan": r"TAN(\1)",
-            "atan": r"ATAN(\1)",
-            "atan2": r"ATAN2(\1)",
-            "pow": r"POWER(\1)",  # Note: Ideally power(x,y)
-            "floor": r"FLOOR(\1)",
-            "ceil": r"CEIL(\1)",
-            "round": r"ROUND(\1)",
-            "exp": r"EXP(\1)",
-            # statistical functions
-            "mean": r"AVG(\1)",
-            "median": r"MEDIAN(\1)",  # Note: Only some DBs support this
-            "std": r"STDDEV(\1)",
-            "var": r"VARIANCE(\1)",
-            "min": r"MIN(\1)",
-            "max": r"MAX(\1)",
-            "sum": r"SUM(\1)",
-            "count": r"COUNT(\1)",
-            "countdistinct": r"COUNT(DISTINCT \1)",
-            "first": r"FIRST_VALUE(\1)",
-            "last": r"LAST_VALUE(\1)",
-            # mode usually needs special handling
-        }
-
-        for func, replacement in func_map.items():
-            expr = re.sub(fr'{func}\(([^)]+)\)', replacement, expr)
+        expr = _FUNC_ARG_RE.sub(lambda m: _FUNC_ARG_MAP[m.group(1)].format(m.group(2)), expr)
+        expr = _FUNC_RE.sub(lambda m: _FUNC_MAP[m.group(1)] + "(", expr)
 
         return expr
 
@@ -490,44 +974,87 @@ class MaggyEditor(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "No Table Selected", "Please select a table first.")
             return
 
-        # Step 1: Get column names from the DB
+        self._finish_loading()
+        self._flush_pending()
+
+        # Step 1: Get column names (cached from the last load)
         try:
-            conn = sqlite3.connect(self.db_file_path)
-            df = pd.read_sql_query(f"SELECT * FROM '{selected_table}' LIMIT 1", conn)
-            conn.close()
+            columns = self._table_columns(selected_table)
         except sqlite3.Error as e:
             QtWidgets.QMessageBox.critical(self, "Database Error", str(e))
             return
 
         # Step 2: Launch Column Deletion Dialog
-        dialog = self.ui.ColumnDeleteDialog(columns=df.columns, parent=self)
+        dialog = self.ui.ColumnDeleteDialog(columns=columns, parent=self)
         if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
             return
 
         column_to_delete = dialog.get_selected_column()
 
-        # Step 3: Update database
-        try:
-            conn = sqlite3.connect(self.db_file_path)
-            cursor = conn.cursor()
-
-            # Create a new table without the column to be deleted
-            columns = [col for col in df.columns if col != column_to_delete]
-            columns_str = ", ".join([f'"{col}"' for col in columns])
-            cursor.execute(f'CREATE TABLE "{selected_table}_temp" AS SELECT {columns_str} FROM "{selected_table}"')
-
-            # Drop the old table and rename the new one
-            cursor.execute(f'DROP TABLE "{selected_table}"')
-            cursor.execute(f'ALTER TABLE "{selected_table}_temp" RENAME TO "{selected_table}"')
-
-            conn.commit()
-            conn.close()
+        # Step 3: Update database in the background
+        table_sql = quote_identifier(selected_table)
+        temp_sql = quote_identifier(f"{selected_table}_temp")
+
+        def write(conn):
+            if sqlite3.sqlite_version_info >= (3, 35):
+                # Metadata-only drop; SQLite refuses it for key/indexed columns
+                try:
+                    with bulk_write(conn) as cursor:
+                        cursor.execute(f'ALTER TABLE {table_sql} DROP COLUMN {quote_identifier(column_to_delete)}')
+                    return
+                except sqlite3.OperationalError as e:
+                    logging.info(f"DROP COLUMN not possible, rebuilding table: {e}")
+
+            conn.execute("PRAGMA foreign_keys=OFF")
+            with bulk_write(conn) as cursor:
+                # Create a new table without the column to be deleted
+                kept = [col for col in columns if col != column_to_delete]
+                columns_str = ", ".join([quote_identifier(col) for col in kept])
+                cursor.execute(f'CREATE TABLE {temp_sql} AS SELECT {columns_str} FROM {table_sql}')
+
+                # Drop the old table and rename the new one
+                cursor.execute(f'DROP TABLE {table_sql}')
+                cursor.execute(f'ALTER TABLE {temp_sql} RENAME TO {table_sql}')
+
+        self._run_sql_task(selected_table, write, f"Column '{column_to_delete}' successfully deleted.")
+
+    def _run_sql_task(self, table, write, done_message):
+        """
+        Run a database write on the global thread pool and reload the table when it is done.
+        Args:
+            table (str): The table whose schema the write changes.
+            write (callable): Function taking a private sqlite3.Connection and doing the writes.
+            done_message (str): Message logged once the write has succeeded.
+        """
+        task = SqlTask(self.db_file_path, write)
+        if not self._sql_tasks:
+            # The task holds the write lock, so cell edits are disabled until it is done
+            self._edit_triggers = self.ui.dataTable.editTriggers()
+            self.ui.dataTable.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._sql_tasks.add(task)
+
+        def done():
+            self._sql_tasks.discard(task)
+            if not self._sql_tasks:
+                self.ui.dataTable.setEditTriggers(self._edit_triggers)
+
+        def finished(_result):
+            done()
+            self._columns_cache.pop(table, None)
+            self._row_keys.pop(table, None)
+            self.ui.statusBar.showMessage("Ready")
+            logging.info(done_message)
+            self.load_table_names()
 
-            logging.info(f"Column '{column_to_delete}' successfully deleted.")
-            self.load_selected_table()
+        def failed(message):
+            done()
+            self.ui.statusBar.showMessage("Ready")
+            QtWidgets.QMessageBox.critical(self, "Database Error", message)
 
-        except sqlite3.Error as e:
-            QtWidgets.QMessageBox.critical(self, "Database Error", str(e))
+        task.signals.finished.connect(finished)
+        task.signals.error.connect(failed)
+        self.ui.statusBar.showMessage("Updating database...")
+        QThreadPool.globalInstance().start(task)
 
     
     def grid_data(self):
@@ -650,6 +1177,7 @@ class MaggyEditor(QtWidgets.QMainWindow):
             if self.current_line is None:
                 QtWidgets.QMessageBox.warning(self, "No Line Selected", "Please select a magnetic line first.")
                 return
+            self._finish_loading()
             
             # Get X and Y columns
             columns = self.dataFrame.columns.tolist()
@@ -669,6 +1197,8 @@ class MaggyEditor(QtWidgets.QMainWindow):
 
             # Update DB
             self.dataFrame.to_sql(self.current_line, self.conn, if_exists='replace', index=False)
+            self._row_keys.pop(self.current_line, None)
+            self._columns_cache.pop(self.current_line, None)
 
             # Refresh table
             self.load_table_to_view(self.current_line)
@@ -683,13 +1213,21 @@ class MaggyEditor(QtWidgets.QMainWindow):
         self.load_selected_table()
     
     def closeEvent(self, event):
+        # Running tasks finish on their own connections; just stop them calling back
+        for task in self._sql_tasks:
+            task.signals.finished.disconnect()
+            task.signals.error.disconnect()
+        self._sql_tasks.clear()
         if self.conn:
+            self._flush_pending()
             self.conn.close()
+            self.conn = None
         logging.info("Closing application.")
         event.accept()
 
 if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
+    apply_app_stylesheet(app)
     window = MaggyEditor()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
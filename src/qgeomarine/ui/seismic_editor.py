@@ -28,7 +28,7 @@ from qgeomarine.core.processing.trace_analysis import trace_periodogram, trace_w
 from qgeomarine.core.signals.deconvolution import Wavelets, Deconvolution
 from qgeomarine.core.processing.trace_qc import TraceQC
 from qgeomarine.core.interpretation.interpretation import SeismicInterpretationWindow
-from qgeomarine.ui.ui import bandass_filter_UI, highpass_filter_UI, lowpass_filter_UI, TraceAnalysisWindowUI, WaveletWindowUI, TraceQCUI
+from qgeomarine.ui.ui import FilterUI, TraceAnalysisWindowUI, WaveletWindowUI, TraceQCUI, apply_app_stylesheet
 
 import logging
 logging.basicConfig(
@@ -830,7 +830,7 @@ class SeismicEditor(QMainWindow):
                     self.ui.frequencyPlot.setLabel('left', 'Power Spectral Density', units='')
 
                 elif index == 2:  # Welch Periodogram
-                    f, Pxx = trace_welch_periodogram(trace, fs=self.sample_rate)
+                    f, Pxx = trace_welch_periodogram(trace, fs=self.sample_rate, detrend='constant')
                     self.ui.frequencyPlot.clear()
                     self.ui.frequencyPlot.plot(f, Pxx, pen='b')
                     self.ui.frequencyPlot.setTitle(f"Welch Periodogram of Trace {trace_number}")
@@ -1035,9 +1035,7 @@ class SeismicEditor(QMainWindow):
 
         if type == 'bandpass':
             # Create a dialog for the filter preview
-                self.filterDialog = QDialog(self)
-                self.ui = bandass_filter_UI()
-                self.ui.setupUi(self.filterDialog, traceCount=len(self.processed_data if self.processed_data is not None else self.data))
+                self.filterDialog, self.ui = FilterUI.load("bandpass", len(self.processed_data if self.processed_data is not None else self.data), self)
                 self.filterDialog.setWindowTitle(f"{filter_type.capitalize()} Bandpass Filter Preview")
                 # default trace number (can be changed by the user)
                 self.ui.traceNumberInput.setValue(0)
@@ -1056,11 +1054,10 @@ class SeismicEditor(QMainWindow):
                 
                     trace_number = self.ui.traceNumberInput.value()
                     trace = self.processed_data[trace_number] if self.processed_data is not None else self.data[trace_number]
-                    t = np.arange(0, len(trace)) * self.sample_interval
+                    t = self.ui.time_axis(len(trace), self.sample_interval)
 
                     # Plot the original trace
-                    self.ui.tracePlot.clear()
-                    self.ui.tracePlot.plot(t, trace, pen='b')
+                    self.ui.update_trace(t, trace)
                     self.ui.tracePlot.setTitle(f"Raw Trace {trace_number}")
                     self.ui.tracePlot.setLabel('bottom', 'Time', units='seconds')
                     self.ui.tracePlot.setLabel('left', 'Amplitude', units='dB')
@@ -1090,7 +1087,7 @@ class SeismicEditor(QMainWindow):
 
                     low_cut = self.ui.lowcutSlider.value()
                     high_cut = self.ui.highcutSlider.value()
-                    order = int(self.ui.filterOrderInput.text())
+                    order = self.ui.filterOrderInput.value()
                     if low_cut >= high_cut or low_cut < 0 or high_cut > self.sample_rate / 2:
                         self.show_error(f"Invalid frequency range: {low_cut}-{high_cut} Hz.")
                         return
@@ -1105,9 +1102,8 @@ class SeismicEditor(QMainWindow):
 
                     # Reconstruct the signal
                     reconstructed_signal = np.fft.ifft(filtered_fft).real
-                    t = np.arange(0, len(reconstructed_signal)) * self.sample_interval
-                    self.ui.reconstructedTracePlot.clear()
-                    self.ui.reconstructedTracePlot.plot(t, reconstructed_signal, pen='r')
+                    t = self.ui.time_axis(len(reconstructed_signal), self.sample_interval)
+                    self.ui.update_reconstructed_trace(t, reconstructed_signal)
                     self.ui.reconstructedTracePlot.setTitle(f"Reconstructed Trace {trace_number}")
                     self.ui.reconstructedTracePlot.setLabel('bottom', 'Time', units='seconds')
                     self.ui.reconstructedTracePlot.setLabel('left', 'Amplitude', units='dB')
@@ -1129,7 +1125,7 @@ class SeismicEditor(QMainWindow):
                     self.filterDialog.accept()  # Close the dialog 
                     freq = self.ui.lowcutSlider.value()
                     freqmax = self.ui.highcutSlider.value()
-                    order = int(self.ui.filterOrderInput.text())
+                    order = self.ui.filterOrderInput.value()
                     self.validate_filter_params(order, freq, self.sample_rate, filter_type, bandpass=True, freqmax=freqmax)
                     return order, freq, freqmax
 
@@ -1150,9 +1146,7 @@ class SeismicEditor(QMainWindow):
                 
         if type == 'lowpass':
             # Create a dialog for the filter preview
-                self.filterDialog = QDialog(self)
-                self.ui = lowpass_filter_UI()
-                self.ui.setupUi(self.filterDialog, traceCount=len(self.processed_data if self.processed_data is not None else self.data))
+                self.filterDialog, self.ui = FilterUI.load("lowpass", len(self.processed_data if self.processed_data is not None else self.data), self)
                 self.filterDialog.setWindowTitle(f"{filter_type.capitalize()} Lowpass Filter Preview")
                 # default trace number (can be changed by the user)
                 self.ui.traceNumberInput.setValue(0)
@@ -1164,11 +1158,10 @@ class SeismicEditor(QMainWindow):
                 
                     trace_number = self.ui.traceNumberInput.value()
                     trace = self.processed_data[trace_number] if self.processed_data is not None else self.data[trace_number]
-                    t = np.arange(0, len(trace)) * self.sample_interval
+                    t = self.ui.time_axis(len(trace), self.sample_interval)
 
                     # Plot the original trace
-                    self.ui.tracePlot.clear()
-                    self.ui.tracePlot.plot(t, trace, pen='b')
+                    self.ui.update_trace(t, trace)
                     self.ui.tracePlot.setTitle(f"Raw Trace {trace_number}")
                     self.ui.tracePlot.setLabel('bottom', 'Time', units='seconds')
                     self.ui.tracePlot.setLabel('left', 'Amplitude', units='dB')
@@ -1188,7 +1181,7 @@ class SeismicEditor(QMainWindow):
                 # Function to update the preview plot
                 def update_preview():
                     low_cut = self.ui.lowcutSlider.value()
-                    order = int(self.ui.filterOrderInput.text())
+                    order = self.ui.filterOrderInput.value()
                     if low_cut < 0 or low_cut > self.sample_rate / 2:
                         self.show_error(f"Invalid frequency range: {low_cut} Hz.")
                         return
@@ -1205,9 +1198,8 @@ class SeismicEditor(QMainWindow):
 
                     # Reconstruct the signal
                     reconstructed_signal = np.fft.ifft(filtered_fft).real
-                    t = np.arange(0, len(reconstructed_signal)) * self.sample_interval
-                    self.ui.reconstructedTracePlot.clear()
-                    self.ui.reconstructedTracePlot.plot(t, reconstructed_signal, pen='r')
+                    t = self.ui.time_axis(len(reconstructed_signal), self.sample_interval)
+                    self.ui.update_reconstructed_trace(t, reconstructed_signal)
                     self.ui.reconstructedTracePlot.setTitle(f"Reconstructed Trace {trace_number}")
                     self.ui.reconstructedTracePlot.setLabel('bottom', 'Time', units='seconds')
                     self.ui.reconstructedTracePlot.setLabel('left', 'Amplitude', units='dB')
@@ -1218,7 +1210,7 @@ class SeismicEditor(QMainWindow):
                     # Get the filter parameters and close the dialog
                     self.filterDialog.accept()  # Close the dialog
                     freq = self.ui.lowcutSlider.value()
-                    order = int(self.ui.filterOrderInput.text())
+                    order = self.ui.filterOrderInput.value()
                     self.validate_filter_params(order, freq, self.sample_rate, filter_type)
                     return order, freq
 
@@ -1238,9 +1230,7 @@ class SeismicEditor(QMainWindow):
         
         if type == 'highpass':
             # Create a dialog for the filter preview
-                self.filterDialog = QDialog(self)
-                self.ui = highpass_filter_UI()
-                self.ui.setupUi(self.filterDialog, traceCount=len(self.processed_data if self.processed_data is not None else self.data))
+                self.filterDialog, self.ui = FilterUI.load("highpass", len(self.processed_data if self.processed_data is not None else self.data), self)
                 self.filterDialog.setWindowTitle(f"{filter_type.capitalize()} Highpass Filter Preview")
                 # default trace number (can be changed by the user)
                 self.ui.traceNumberInput.setValue(0)
@@ -1252,11 +1242,10 @@ class SeismicEditor(QMainWindow):
                 
                     trace_number = self.ui.traceNumberInput.value()
                     trace = self.processed_data[trace_number] if self.processed_data is not None else self.data[trace_number]
-                    t = np.arange(0, len(trace)) * self.sample_interval
+                    t = self.ui.time_axis(len(trace), self.sample_interval)
 
                     # Plot the original trace
-                    self.ui.tracePlot.clear()
-                    self.ui.tracePlot.plot(t, trace, pen='b')
+                    self.ui.update_trace(t, trace)
                     self.ui.tracePlot.setTitle(f"Raw Trace {trace_number}")
                     self.ui.tracePlot.setLabel('bottom', 'Time', units='seconds')
                     self.ui.tracePlot.setLabel('left', 'Amplitude', units='dB')
@@ -1276,7 +1265,7 @@ class SeismicEditor(QMainWindow):
                 # Function to update the preview plot
                 def update_preview():
                     high_cut= self.ui.highcutSlider.value()
-                    order = int(self.ui.filterOrderInput.text())
+                    order = self.ui.filterOrderInput.value()
                     if high_cut < 0 or high_cut > self.sample_rate / 2:
                         self.show_error(f"Invalid frequency range: {high_cut} Hz.")
                         return
@@ -1292,9 +1281,8 @@ class SeismicEditor(QMainWindow):
 
                     # Reconstruct the signal
                     reconstructed_signal = np.fft.ifft(filtered_fft).real
-                    t = np.arange(0, len(reconstructed_signal)) * self.sample_interval
-                    self.ui.reconstructedTracePlot.clear()
-                    self.ui.reconstructedTracePlot.plot(t, reconstructed_signal, pen='r')
+                    t = self.ui.time_axis(len(reconstructed_signal), self.sample_interval)
+                    self.ui.update_reconstructed_trace(t, reconstructed_signal)
                     self.ui.reconstructedTracePlot.setTitle(f"Reconstructed Trace {trace_number}")
                     self.ui.reconstructedTracePlot.setLabel('bottom', 'Time', units='seconds')
                     self.ui.reconstructedTracePlot.setLabel('left', 'Amplitude', units='dB')
@@ -1305,7 +1293,7 @@ class SeismicEditor(QMainWindow):
                     # Get the filter parameters and close the dialog
                     self.filterDialog.accept()  # Close the dialog
                     freq = self.ui.highcutSlider.value()
-                    order = int(self.ui.filterOrderInput.text())
+                    order = self.ui.filterOrderInput.value()
                     self.validate_filter_params(order, freq, self.sample_rate, filter_type)
                     return order, freq
 
@@ -1811,6 +1799,7 @@ class SeismicEditor(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    apply_app_stylesheet(app)
     main_window = SeismicEditor()
     main_window.show()
     sys.exit(app.exec())
\ No newline at end of file
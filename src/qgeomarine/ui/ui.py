@@ -8,15 +8,23 @@ SEG-Y seismic traces, magnetic profiles, and associated metadata.
 
 Modules and Classes:
 --------------------
+- apply_app_stylesheet:
+    Installs the shared QSS (sidebar buttons, frequency sliders) on the QApplication once.
+
+- IconCache:
+    Shared cache of decoded QIcon/QPixmap assets, loaded once per process.
+
 - Ui_IntroWindow:
     Main entry screen showing app branding, new/open project buttons, and recent projects list.
 
 - bandass_filter_UI, lowpass_filter_UI, highpass_filter_UI:
     Dialogs for seismic trace filtering using frequency cut sliders and order inputs.
+    All three share their layout through _FilterUIBase and only differ in the sliders shown.
 
 - FilterUI:
     Unified wrapper that dynamically loads the appropriate filter UI (bandpass, lowpass, highpass)
     based on user selection.
+    FilterUI.load reuses the built preview dialog on later opens instead of rebuilding it.
 
 - TraceAnalysisWindowUI:
     UI for advanced trace analysis using time-frequency methods like FFT, spectrograms,
@@ -44,11 +52,119 @@ Notes:
 - All dialogs are styled with a consistent theme and designed for ease of data interaction.
 - This module is under active development and will be extended with additional features and optimized updates."""
 
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
 from PyQt6 import QtCore, QtGui, QtWidgets
-import pyqtgraph as pg
-import re
-import json
+
+# Static resources live in <repo>/resources, three levels above this package module
+_RESOURCE_DIR = Path(__file__).resolve().parents[3] / "resources"
+_IMAGE_DIR = _RESOURCE_DIR / "images"
+_STYLESHEET_PATH = _RESOURCE_DIR / "app.qss"
+_LOGO_PATH = str(_IMAGE_DIR / "Logo.png")
+_NEWFOLDER_PATH = str(_IMAGE_DIR / "newfolder.png")
+_OPENFOLDER_PATH = str(_IMAGE_DIR / "openfolder.png")
+_SETTINGS_PATH = str(_IMAGE_DIR / "settings.png")
+_DOCUMENTATION_PATH = str(_IMAGE_DIR / "documentation.png")
+
+_pyqtgraph = None
+
+def _pg():
+    """
+    Import pyqtgraph on first use and apply the shared rendering options once.
+    When PyOpenGL is installed, plot widgets render through OpenGL (including the
+    experimental GL curve path) instead of building QPainterPaths on the CPU.
+    Returns:
+        module: The configured pyqtgraph module.
+    """
+    global _pyqtgraph
+    if _pyqtgraph is None:
+        import pyqtgraph
+
+        # Optional OpenGL support; without PyOpenGL pyqtgraph keeps the raster paint engine
+        try:
+            import OpenGL  # noqa: F401
+            opengl_available = True
+        except ImportError:
+            opengl_available = False
+        pyqtgraph.setConfigOptions(useOpenGL=opengl_available, enableExperimental=opengl_available, antialias=False)
+        _pyqtgraph = pyqtgraph
+    return _pyqtgraph
+
+@contextmanager
+def _updates_disabled(widget):
+    """Suspend repaints of a widget while its children are built, re-enabling them even on error."""
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.setUpdatesEnabled(True)
+        widget.updateGeometry()  # One geometry pass for everything added while suspended
+
+def _tighten(layout, margins=(0, 0, 0, 0), spacing=0):
+    """Set the contents margins (left, top, right, bottom) and spacing of a layout in one call."""
+    layout.setContentsMargins(*margins)
+    layout.setSpacing(spacing)
+
+def apply_app_stylesheet(app):
+    """
+    Install the shared application stylesheet (resources/app.qss) on the QApplication.
+    Widgets opt in through their object names, so the sheet is parsed once per process
+    instead of once per widget.
+    Args:
+        app (QApplication): The running application instance.
+    """
+    try:
+        app.setStyleSheet(_STYLESHEET_PATH.read_text(encoding="utf-8"))
+    except OSError:
+        pass  # Styling is cosmetic; fall back to the platform style
+
+class _Fonts:
+    """
+    _Fonts
+    Shared "Segoe UI" fonts keyed by point size. QFont is implicitly shared, so handing the
+    same instance to many widgets is safe and avoids a font database lookup per widget.
+    Fonts are created on first use, once the QApplication exists.
+    """
+
+    _segoe = {}
+
+    @classmethod
+    def segoe(cls, size):
+        """Return the shared "Segoe UI" font of the given point size."""
+        font = cls._segoe.get(size)
+        if font is None:
+            font = cls._segoe[size] = QtGui.QFont("Segoe UI", size)
+        return font
+
+class IconCache:
+    """
+    IconCache
+    Process-wide cache of the QIcon and QPixmap assets used by the windows in this module.
+    Each image file is read and decoded on first use only, so reopening a window reuses
+    the already decoded assets instead of hitting the disk again. Pixmaps are kept in Qt's
+    global QPixmapCache, keyed by their file path.
+    """
+
+    PIXMAP_CACHE_LIMIT_KB = 20480  # Large enough that the bundled PNGs are never evicted
+    _icons = {}
+
+    @classmethod
+    def icon(cls, path):
+        """Return the cached QIcon for an image path, loading it on first access."""
+        icon = cls._icons.get(path)
+        if icon is None:
+            icon = cls._icons[path] = QtGui.QIcon(path)
+        return icon
+
+    @classmethod
+    def pixmap(cls, path):
+        """Return the cached QPixmap for an image path, decoded once through QImage."""
+        pixmap = QtGui.QPixmapCache.find(path)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap.fromImage(QtGui.QImage(path))
+            QtGui.QPixmapCache.insert(path, pixmap)
+        return pixmap
 
 # UI Class Introduction Window
 class Ui_IntroWindow(object):
@@ -59,406 +175,267 @@ class Ui_IntroWindow(object):
     It also displays a list of recent projects.
     """
 
+    # Source strings, built once at class load and passed through translate() in retranslateUi
+    _CONTEXT = "QGeoMmarineIntroWindow"
+    _WINDOW_TITLE = "QGeoMmarine"
+    _LOGO_HTML = (
+        "<html><head/><body><p><span style=\" font-size:25pt;\">QGeoMarine</span>"
+        "<span style=\" font-family:\'Segoe UI\',\'sans-serif\'; font-size:12pt; vertical-align:super;\">©</span>"
+        "</p></body></html>"
+    )
+    # New Project, Open Project, Settings, Documentation
+    _BTN_LABELS = ("    New Project", "   Open Project", "   Settings", "   Documentation")
+    _RECENT_PROJECTS = "Recent Projects"
+    _BTN_ICON_SIZE = QtCore.QSize(30, 30)
+
     def setupUi(self, QGeoMmarineIntroWindow):
         """
         Setup the main window layout, header, sidebar, and content sections.
         Args:
             pyqmarineIntroWindow (QMainWindow): The main window instance to set up.
         """
-        # Main window setup
-        QGeoMmarineIntroWindow.setObjectName("QGeoMmarineIntroWindow")
-        QGeoMmarineIntroWindow.resize(851, 627)
-
-        # Central Widget
-        self.centralwidget = QtWidgets.QWidget(QGeoMmarineIntroWindow)
-        self.centralwidget.setStyleSheet("background-color: rgb(230, 230, 230);")
-        self.centralwidget.setObjectName("centralwidget")
-
-        # Main Vertical Layout for the Entire Window
-        self.mainLayout = QtWidgets.QVBoxLayout(self.centralwidget)
-        self.mainLayout.setContentsMargins(0, 0, 0, 0)  # No extra margins
-        self.mainLayout.setSpacing(60)  # Spacing between sections
-
-        # Header Section
-        self.header = QtWidgets.QFrame(self.centralwidget)
-        self.header.setStyleSheet("background-color: rgb(255, 255, 255);")
-        self.header.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.header.setObjectName("header")
-
-        # Header Layout
-        self.headerLayout = QtWidgets.QHBoxLayout(self.header)
-        self.headerLayout.setContentsMargins(10, 10, 10, 10)
-        self.headerLayout.setSpacing(10)
-
-        # Navigate to the resource directory for the static images
-        resource_dir = Path(__file__).resolve().parent.parent.parent / "resources"
-        # Logo
-        self.label = QtWidgets.QLabel(self.header)
-        self.label.setPixmap(QtGui.QPixmap(str(resource_dir / "images/Logo.png")))
-        self.label.setScaledContents(True)
-        self.label.setFixedSize(100, 80)  # Fixed size for the logo
-        self.headerLayout.addWidget(self.label)
-
-        # App Name Label
-        self.Logolabel = QtWidgets.QLabel(self.header)
-        self.Logolabel.setStyleSheet("color: rgb(0, 144, 144);")
-        self.Logolabel.setObjectName("Logolabel")
-        self.Logolabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter)
-        self.headerLayout.addWidget(self.Logolabel)
-
-        # Add Header to Main Layout
-        self.mainLayout.addWidget(self.header)
-
-        # Content Section
-        self.contentLayout = QtWidgets.QHBoxLayout()
-        self.contentLayout.setSpacing(30)
-
-        # Sidebar Section (Left Panel)
-        self.leftLayout = QtWidgets.QVBoxLayout()  # New vertical layout for sidebar 
-        self.leftLayout.setSpacing(30)
-
-        self.sidebar = QtWidgets.QFrame(self.centralwidget)
-        self.sidebar.setStyleSheet("background-color: rgb(255, 255, 255); border-radius: 10px;")
-        self.sidebar.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.sidebarLayout = QtWidgets.QVBoxLayout(self.sidebar)
-        self.sidebarLayout.setContentsMargins(0, 0, 0, 0)
-
-        # Sidebar Buttons
-        buttonStyle = """
-            QPushButton {
-                background-color: rgb(255, 255, 255);
-                color: rgb(0, 0, 0);
-                border: none;
-                border-radius: 10px;
-            }
-            QPushButton:hover {
-                 background-color: rgb(255, 255, 255);
-                color: rgb(0, 130, 130);
-            }
-            QPushButton:pressed {
-                background-color: rgb(255, 255, 255);
-                color: rgb(0, 144, 144);
-            }
-        """
-        buttonStyle_1 = """
-        QPushButton {
-            background-color: rgb(255, 255, 255);
-            color: rgb(0, 144, 144);
-            border: none;
-            border-radius: 10px;
-            padding: 100px 100px 100px 100px; /* Space above for icon */
-        }
-        QPushButton:hover {
-            background-color: rgb(220, 240, 255);
-         }
-        QPushButton:pressed {
-            background-color: rgb(180, 210, 240);
-        }
-        """
-        icon_size = QtCore.QSize(30,30)
-        self.buttonnewproject = QtWidgets.QPushButton("    New Project", self.sidebar)
-        self.buttonnewproject.setStyleSheet(buttonStyle)
-        self.buttonnewproject.setIcon(QtGui.QIcon(str(resource_dir / "images/newfolder.png")))
-        self.buttonnewproject.setIconSize(icon_size)
-        self.buttonnewproject.setFont(QtGui.QFont("Segoe UI", 16))
-        self.sidebarLayout.addWidget(self.buttonnewproject)
-
-        self.buttonopenproject = QtWidgets.QPushButton("   Open Project", self.sidebar)
-        self.buttonopenproject.setStyleSheet(buttonStyle)
-        self.buttonopenproject.setIcon(QtGui.QIcon(str(resource_dir / "images/openfolder.png")))
-        self.buttonopenproject.setIconSize(icon_size)
-        self.buttonopenproject.setFont(QtGui.QFont("Segoe UI", 16))
-        self.sidebarLayout.addWidget(self.buttonopenproject)
-
-        self.buttonsettings = QtWidgets.QPushButton("Settings", self.sidebar)
-        self.buttonsettings.setStyleSheet(buttonStyle)
-        self.buttonsettings.setIcon(QtGui.QIcon(str(resource_dir / "images/settings.png")))
-        self.buttonsettings.setIconSize(icon_size)
-        self.buttonsettings.setFont(QtGui.QFont("Segoe UI", 16))
-        self.sidebarLayout.addWidget(self.buttonsettings)
-
-        self.buttonresources = QtWidgets.QPushButton("   Documentation", self.sidebar)
-        self.buttonresources.setStyleSheet(buttonStyle)
-        self.buttonresources.setIcon(QtGui.QIcon(str(resource_dir / "images/documentation.png")))
-        self.buttonresources.setIconSize(icon_size)
-        self.buttonresources.setFont(QtGui.QFont("Segoe UI", 16))
-        self.sidebarLayout.addWidget(self.buttonresources)
-
-        # Add Sidebar to Left Layout
-        self.leftLayout.addWidget(self.sidebar)
+        # Build the whole widget tree with repaints suspended so the window paints once
+        with _updates_disabled(QGeoMmarineIntroWindow):
+            # Main window setup
+            QGeoMmarineIntroWindow.setObjectName("QGeoMmarineIntroWindow")
+            QGeoMmarineIntroWindow.resize(851, 627)
+
+            # Central Widget
+            self.centralwidget = QtWidgets.QWidget(QGeoMmarineIntroWindow)
+            self.centralwidget.setStyleSheet("background-color: rgb(230, 230, 230);")
+            self.centralwidget.setObjectName("centralwidget")
+
+            # Main Vertical Layout for the Entire Window
+            self.mainLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+            _tighten(self.mainLayout, (0, 0, 0, 0), 60)  # No extra margins, spacing between sections
+
+            # Header Section
+            self.header = QtWidgets.QFrame(self.centralwidget)
+            self.header.setStyleSheet("background-color: rgb(255, 255, 255);")
+            self.header.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+            self.header.setObjectName("header")
+
+            # Header Layout
+            self.headerLayout = QtWidgets.QHBoxLayout(self.header)
+            _tighten(self.headerLayout, (10, 10, 10, 10), 10)
+
+            # Logo
+            self.label = QtWidgets.QLabel(self.header)
+            self.label.setPixmap(IconCache.pixmap(_LOGO_PATH))
+            self.label.setScaledContents(True)
+            self.label.setFixedSize(100, 80)  # Fixed size for the logo
+            self.headerLayout.addWidget(self.label)
+
+            # App Name Label
+            self.Logolabel = QtWidgets.QLabel(self.header)
+            self.Logolabel.setStyleSheet("color: rgb(0, 144, 144);")
+            self.Logolabel.setObjectName("Logolabel")
+            self.Logolabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter)
+            self.headerLayout.addWidget(self.Logolabel)
+
+            # Add Header to Main Layout
+            self.mainLayout.addWidget(self.header)
+
+            # Content Section
+            self.contentLayout = QtWidgets.QHBoxLayout()
+            self.contentLayout.setSpacing(30)
+
+            # Sidebar Section (Left Panel)
+            self.leftLayout = QtWidgets.QVBoxLayout()  # New vertical layout for sidebar 
+            self.leftLayout.setSpacing(30)
+
+            self.sidebar = QtWidgets.QFrame(self.centralwidget)
+            self.sidebar.setStyleSheet("background-color: rgb(255, 255, 255); border-radius: 10px;")
+            self.sidebar.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+            self.sidebarLayout = QtWidgets.QVBoxLayout(self.sidebar)
+            self.sidebarLayout.setContentsMargins(0, 0, 0, 0)
+
+            # Sidebar Buttons (styled by the application stylesheet as QPushButton#sidebarButton)
+            sidebar_font = _Fonts.segoe(16)  # Shared by all sidebar buttons
+            new_label, open_label, settings_label, docs_label = self._BTN_LABELS
+            self.buttonnewproject = self._make_sidebar_button(new_label, _NEWFOLDER_PATH, sidebar_font)
+            self.buttonopenproject = self._make_sidebar_button(open_label, _OPENFOLDER_PATH, sidebar_font)
+            self.buttonsettings = self._make_sidebar_button(settings_label, _SETTINGS_PATH, sidebar_font)
+            self.buttonresources = self._make_sidebar_button(docs_label, _DOCUMENTATION_PATH, sidebar_font)
+
+            # Add Sidebar to Left Layout
+            self.leftLayout.addWidget(self.sidebar)
+
+            # Add Left Layout to Content Layout
+            self.contentLayout.addLayout(self.leftLayout, 1)  # Left layout gets 1 stretch factor
+
+            # Main Content Section (Right Panel)
+            self.mainContent = QtWidgets.QFrame(self.centralwidget)
+            self.mainContent.setStyleSheet("background-color: rgb(230, 230, 230);")
+            self.mainContentLayout = QtWidgets.QVBoxLayout(self.mainContent)
+            self.mainContentLayout.setContentsMargins(10, 10, 10, 10)
+
+            # Recent Projects Label
+            self.recentprojlabel = QtWidgets.QLabel(self._RECENT_PROJECTS, self.mainContent)
+            self.recentprojlabel.setStyleSheet("color: rgb(0, 0, 0);")
+            self.recentprojlabel.setFont(_Fonts.segoe(18))
+            self.mainContentLayout.addWidget(self.recentprojlabel)
+
+            # Recent Projects List
+            self.listWidget = QtWidgets.QListWidget(self.mainContent)
+            self.listWidget.setStyleSheet("color: rgb(0, 0, 0);")
+            self.listWidget.setFont(_Fonts.segoe(12))
+            self.mainContentLayout.addWidget(self.listWidget)
+
+            # Add Main Content to Content Layout
+            self.contentLayout.addWidget(self.mainContent, 3)  # Main content gets 3 stretch factor
+
+            # Add Content Layout to Main Layout
+            self.mainLayout.addLayout(self.contentLayout)
+
+            # Footer Section
+            self.footer = QtWidgets.QFrame(self.centralwidget)
+            self.footer.setStyleSheet("background-color: rgb(0, 144, 144);")
+            self.footer.setFixedHeight(80)  # Fixed height for footer
+            self.mainLayout.addWidget(self.footer)
+
+            # Set Central Widget
+            QGeoMmarineIntroWindow.setCentralWidget(self.centralwidget)
+
+            # Retranslate the UI
+            self.retranslateUi(QGeoMmarineIntroWindow)
+        QtCore.QMetaObject.connectSlotsByName(QGeoMmarineIntroWindow)
 
+    def _make_sidebar_button(self, text, icon_path, font):
         """
-        # Documentation Bar Section
-        self.documentationbar = QtWidgets.QFrame(self.centralwidget)
-        self.documentationbar.setStyleSheet("background-color: rgb(255, 255, 255); border-radius: 10px;")
-        self.documentationbar.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.documentationbarLayout = QtWidgets.QHBoxLayout(self.documentationbar)
-        self.documentationbarLayout.setContentsMargins(0, 0, 0, 0)
-        self.documentationbarLayout.setSpacing(50)
-
-        self.buttonresources = QtWidgets.QPushButton("Documentation", self.documentationbar)
-        self.buttonresources.setStyleSheet(buttonStyle)
-        self.buttonresources.setIcon(QtGui.QIcon(os.path.join(os.path.dirname(__file__), "Images/documentation.png")))
-        self.buttonresources.setIconSize(QtCore.QSize(30,30))
-        self.buttonresources.setFont(QtGui.QFont("Segoe UI", 16))
-
-        # Add Documentation Bar to Left Layout
-        self.leftLayout.addWidget(self.documentationbar)
+        Create a sidebar button and add it to the sidebar layout.
+        Args:
+            text (str): The button label.
+            icon_path (str): Path of the button icon image.
+            font (QFont): The font shared by the sidebar buttons.
+        Returns:
+            QtWidgets.QPushButton: The new button.
         """
-        # Add Left Layout to Content Layout
-        self.contentLayout.addLayout(self.leftLayout, 1)  # Left layout gets 1 stretch factor
-
-        # Main Content Section (Right Panel)
-        self.mainContent = QtWidgets.QFrame(self.centralwidget)
-        self.mainContent.setStyleSheet("background-color: rgb(230, 230, 230);")
-        self.mainContentLayout = QtWidgets.QVBoxLayout(self.mainContent)
-        self.mainContentLayout.setContentsMargins(10, 10, 10, 10)
-
-        # Recent Projects Label
-        self.recentprojlabel = QtWidgets.QLabel("Recent Projects", self.mainContent)
-        self.recentprojlabel.setStyleSheet("color: rgb(0, 0, 0);")
-        self.recentprojlabel.setFont(QtGui.QFont("Segoe UI", 18))
-        self.mainContentLayout.addWidget(self.recentprojlabel)
-
-        # Recent Projects List
-        self.listWidget = QtWidgets.QListWidget(self.mainContent)
-        self.listWidget.setStyleSheet("color: rgb(0, 0, 0);")
-        self.listWidget.setFont(QtGui.QFont("Segoe UI", 12))
-        self.mainContentLayout.addWidget(self.listWidget)
-
-        # Add Main Content to Content Layout
-        self.contentLayout.addWidget(self.mainContent, 3)  # Main content gets 3 stretch factor
-
-        # Add Content Layout to Main Layout
-        self.mainLayout.addLayout(self.contentLayout)
-
-        # Footer Section
-        self.footer = QtWidgets.QFrame(self.centralwidget)
-        self.footer.setStyleSheet("background-color: rgb(0, 144, 144);")
-        self.footer.setFixedHeight(80)  # Fixed height for footer
-        self.mainLayout.addWidget(self.footer)
-
-        # Set Central Widget
-        QGeoMmarineIntroWindow.setCentralWidget(self.centralwidget)
-
-        # Retranslate the UI
-        self.retranslateUi(QGeoMmarineIntroWindow)
-        QtCore.QMetaObject.connectSlotsByName(QGeoMmarineIntroWindow)
+        button = QtWidgets.QPushButton(text, self.sidebar)
+        button.setObjectName("sidebarButton")
+        button.setIcon(IconCache.icon(icon_path))
+        button.setIconSize(self._BTN_ICON_SIZE)
+        button.setFont(font)
+        self.sidebarLayout.addWidget(button)
+        return button
 
     def retranslateUi(self, QGeoMmarineIntroWindow):
         _translate = QtCore.QCoreApplication.translate
-        QGeoMmarineIntroWindow.setWindowTitle(_translate("QGeoMmarineIntroWindow", "QGeoMmarine"))
-        self.Logolabel.setText(_translate("QGeoMmarineIntroWindow",
-    "<html><head/><body><p><span style=\" font-size:25pt;\">QGeoMarine</span><span style=\" font-family:\'Segoe UI\',\'sans-serif\'; font-size:12pt; vertical-align:super;\">©</span></p></body></html>"))
-        self.buttonnewproject.setText(_translate("QGeoMmarineIntroWindow", "    New Project"))
-        self.buttonopenproject.setText(_translate("QGeoMmarineIntroWindow", "   Open Project"))
-        self.buttonsettings.setText(_translate("QGeoMmarineIntroWindow", "   Settings"))
-        self.buttonresources.setText(_translate("QGeoMmarineIntroWindow", "   Documentation"))
-        self.recentprojlabel.setText(_translate("QGeoMmarineIntroWindow", "Recent Projects"))
-
-class bandass_filter_UI(object):
+        context = self._CONTEXT
+        QGeoMmarineIntroWindow.setWindowTitle(_translate(context, self._WINDOW_TITLE))
+        self.Logolabel.setText(_translate(context, self._LOGO_HTML))
+        buttons = (self.buttonnewproject, self.buttonopenproject, self.buttonsettings, self.buttonresources)
+        for button, label in zip(buttons, self._BTN_LABELS):
+            button.setText(_translate(context, label))
+        self.recentprojlabel.setText(_translate(context, self._RECENT_PROJECTS))
+
+class _FilterUIBase(object):
     """
-    bandass_filter_UI
-    This class sets up the UI for a bandpass filter dialog, allowing users to select
-    lowcut and highcut frequencies, filter order, and the seismic trace number to apply the filter on.
-    It includes sliders for frequency selection, a spin box for trace number input, and plots for original and reconstructed traces.
+    _FilterUIBase
+    Shared layout of the bandpass, lowpass and highpass filter dialogs: trace selection,
+    frequency sliders, filter order input, original and reconstructed trace plots and the
+    OK/Cancel button box. Subclasses only choose which frequency sliders to show.
+    Subclasses declared with a ``filter_type`` class keyword are registered for FilterUI.load.
     """
 
+    _registry = {}  # filter_type -> dialog UI class, shared by all subclasses
+
+    def __init_subclass__(cls, filter_type=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if filter_type is not None:
+            cls._registry[filter_type] = cls
+
+    SLIDERS = ()  # Subset of ("lowcut", "highcut"), in display order
+    _SLIDER_SETTINGS = {
+        "lowcut": ("Lowcut Frequency (Hz):", 0),
+        "highcut": ("Highcut Frequency (Hz):", 10000),
+    }
+    _CONSTRAINT_DELAY_MS = 16  # Coalesce slider drags to about one constraint update per frame
+    _DEFAULT_ORDER = 4
+    _constraints_pending = False
+
     def setupUi(self, filterPreview, traceCount):
         """
-        Setup the bandpass filter dialog layout, including frequency sliders, trace selection, and plots.
+        Setup the filter dialog layout, including frequency sliders, trace selection, and plots.
         Args:
             filterPreview (QDialog): The dialog instance to set up.
             traceCount (int): The total number of seismic traces available
         """
-        # Dialog setup
-        filterPreview.setObjectName("filterPreview")
-        filterPreview.resize(1000, 800)
-        self.traceCount = traceCount
-
-        # Main Vertical Layout
-        self.mainLayout = QtWidgets.QVBoxLayout(filterPreview)
-
-        # Trace Number Input
-        self.traceselectionlayout = QtWidgets.QHBoxLayout()
-        self.traceSelectionlabel = QtWidgets.QLabel("Enter Seismic Trace Number:")
-        self.traceSelectionlabel.setFont(QtGui.QFont("Segoe UI", 12))
-        self.traceselectionlayout.addWidget(self.traceSelectionlabel)
-        self.traceNumberInput = QtWidgets.QSpinBox()
-        self.traceNumberInput.setMinimum(0)
-        self.traceNumberInput.setMaximum(max(0, self.traceCount - 1))  # Ensure max is non-negative
-        self.traceselectionlayout.addWidget(self.traceNumberInput)
-        self.mainLayout.addLayout(self.traceselectionlayout)
-
-        # Filter Settings
-        self.filterSettings = QtWidgets.QFrame()
-        self.filterSettingsLayout = QtWidgets.QVBoxLayout(self.filterSettings)
-
-        self.filterSettingsLabel = QtWidgets.QLabel("Filter Settings")
-        self.filterSettingsLabel.setFont(QtGui.QFont("Segoe UI", 14))
-        self.filterSettingsLayout.addWidget(self.filterSettingsLabel)
-
-        # Frequency Sliders
-        self.freqSliders = QtWidgets.QHBoxLayout()
-
-        # Slider Style
-        slider_style = """
-        QSlider::groove:horizontal {
-            border: 1px solid #bbb;
-            background: #eee;
-            height: 8px;
-            border-radius: 4px;
-        }
-
-        QSlider::handle:horizontal {
-            background: #0a84ff;
-            border: 1px solid #5c5c5c;
-            width: 16px;
-            height: 16px;
-            border-radius: 8px;
-            margin: -4px 0; /* Handle overlaps the groove */
-        }
-        QSlider::sub-page:horizontal {
-            background: #0a84ff;
-            border: 1px solid #0a84ff;
-            height: 8px;
-            border-radius: 4px;
-        }
-        QSlider::add-page:horizontal {
-            background: #c5c5c5;
-            border: 1px solid #bbb;
-            height: 8px;
-            border-radius: 4px;
-        }
-        """
-
-        # Slider Labels
-        self.lowcutLabel = QtWidgets.QLabel("Lowcut Frequency (Hz):")
-        self.lowcutLabel.setFont(QtGui.QFont("Segoe UI", 10))
-        self.highcutLabel = QtWidgets.QLabel("Highcut Frequency (Hz):")
-        self.highcutLabel.setFont(QtGui.QFont("Segoe UI", 10))
-
-        # Lowcut Slider with Display
-        self.lowcutSliderLayout = QtWidgets.QVBoxLayout()
-        self.lowcutValueLabel = QtWidgets.QLabel("0 Hz")  # Initial frequency display
-        self.lowcutValueLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.lowcutValueLabel.setFont(QtGui.QFont("Segoe UI", 10))
-        self.lowcutSlider = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
-        self.lowcutSlider.setStyleSheet(slider_style)
-        self.lowcutSlider.setRange(0, 10000)
-        self.lowcutSlider.setValue(0)
-        self.lowcutSlider.valueChanged.connect(self.update_lowcut_display)
-        self.lowcutSliderLayout.addWidget(self.lowcutLabel)
-        self.lowcutSliderLayout.addWidget(self.lowcutValueLabel)
-        self.lowcutSliderLayout.addWidget(self.lowcutSlider)
-
-        # Highcut Slider with Display
-        self.highcutSliderLayout = QtWidgets.QVBoxLayout()
-        self.highcutValueLabel = QtWidgets.QLabel("10000 Hz")  # Initial frequency display
-        self.highcutValueLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.highcutValueLabel.setFont(QtGui.QFont("Segoe UI", 10))
-        self.highcutSlider = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
-        self.highcutSlider.setStyleSheet(slider_style)
-        self.highcutSlider.setRange(0, 10000)
-        self.highcutSlider.setValue(10000)
-        self.highcutSlider.valueChanged.connect(self.update_highcut_display)
-        self.highcutSliderLayout.addWidget(self.highcutLabel)
-        self.highcutSliderLayout.addWidget(self.highcutValueLabel)
-        self.highcutSliderLayout.addWidget(self.highcutSlider)
-
-        # Connect Sliders for Constraints
-        self.lowcutSlider.valueChanged.connect(self.update_slider_constraints)
-        self.highcutSlider.valueChanged.connect(self.update_slider_constraints)
-
-        # Filter Order Input
-        self.filterOrder = QtWidgets.QVBoxLayout()
-        self.filterOrderLabel = QtWidgets.QLabel("Filter Order:")
-        self.filterOrderLabel.setFont(QtGui.QFont("Segoe UI", 10))
-        self.filterOrderInput = QtWidgets.QLineEdit()
-        self.filterOrderInput.setValidator(QtGui.QIntValidator(1, 100))  # Valid filter orders
-        self.filterOrderInput.setText("")  # Default filter order
-        self.filterOrderInput.setFixedWidth(50)
-        self.filterOrder.addWidget(self.filterOrderLabel)
-        self.filterOrder.addWidget(self.filterOrderInput)
-
-        # Add Slider Layouts to Main Layout
-        self.freqSliders.addLayout(self.lowcutSliderLayout)
-        self.freqSliders.addLayout(self.highcutSliderLayout)
-        self.filterSettingsLayout.addLayout(self.freqSliders)
-        self.filterSettingsLayout.addLayout(self.filterOrder)
-        self.mainLayout.addWidget(self.filterSettings)
-
-        # Trace Plots
-        self.tracePlot = pg.PlotWidget()
-        self.tracePlot.setBackground("w")
-        self.tracePlot.showGrid(x=True, y=True)
-        self.tracePlot.setTitle("Original Trace")
-        self.mainLayout.addWidget(self.tracePlot)
-
-        self.reconstructedTracePlot = pg.PlotWidget()
-        self.reconstructedTracePlot.setBackground("w")
-        self.reconstructedTracePlot.showGrid(x=True, y=True)
-        self.reconstructedTracePlot.setTitle("Reconstructed Trace")
-        self.mainLayout.addWidget(self.reconstructedTracePlot)
-
-        # Create Accept and Cancel Buttons
-        self.button_box = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.StandardButton.Ok | QtWidgets.QDialogButtonBox.StandardButton.Cancel)
-        self.mainLayout.addWidget(self.button_box)
+        # Build the dialog with repaints suspended so it is laid out and painted once
+        with _updates_disabled(filterPreview):
+            # Dialog setup
+            filterPreview.setObjectName("filterPreview")
+            filterPreview.resize(1000, 800)
+            self.traceCount = traceCount
 
+            # Main Vertical Layout
+            self.mainLayout = QtWidgets.QVBoxLayout(filterPreview)
+            self._build_trace_selector()
 
-        # Retranslate the UI
-        self.retranslateUi(filterPreview)
+            # Filter Settings
+            self.filterSettings = QtWidgets.QFrame()
+            self.filterSettingsLayout = QtWidgets.QVBoxLayout(self.filterSettings)
 
-    def retranslateUi(self, filterPreview):
-        """Set the text for all UI elements."""
-        filterPreview.setWindowTitle("Filter Preview")
-        self.filterSettingsLabel.setText("Filter Settings")
-        self.lowcutLabel.setText("Lowcut Frequency (Hz):")
-        self.highcutLabel.setText("Highcut Frequency (Hz):")
-        self.filterOrderLabel.setText("Filter Order:")
-        self.traceSelectionlabel.setText("Enter Seismic Trace Number:")
-        self.tracePlot.setTitle("Original Trace")
-        self.reconstructedTracePlot.setTitle("Reconstructed Trace")
+            self.filterSettingsLabel = QtWidgets.QLabel("Filter Settings")
+            self.filterSettingsLabel.setFont(_Fonts.segoe(14))
+            self.filterSettingsLayout.addWidget(self.filterSettingsLabel)
 
-    def update_lowcut_display(self, value):
-        """Update the displayed value above the Lowcut slider."""
-        self.lowcutValueLabel.setText(f"{value} Hz")
+            # Frequency Sliders
+            self.freqSliders = QtWidgets.QHBoxLayout()
+            for name in self.SLIDERS:
+                self.freqSliders.addLayout(self._build_slider(name))
+            self.filterSettingsLayout.addLayout(self.freqSliders)
+            self.filterSettingsLayout.addLayout(self._build_filter_order())
+            self.mainLayout.addWidget(self.filterSettings)
 
-    def update_highcut_display(self, value):
-        """Update the displayed value above the Highcut slider."""
-        self.highcutValueLabel.setText(f"{value} Hz")
+            self._build_plots()
+            self._build_buttons()
+            self._connect_signals()
 
-    def update_slider_constraints(self):
-        """Ensure the sliders do not overlap."""
-        self.highcutSlider.setMinimum(self.lowcutSlider.value() + 1)
-        self.lowcutSlider.setMaximum(self.highcutSlider.value() - 1)
+            # Retranslate the UI
+            self.retranslateUi(filterPreview)
 
-class lowpass_filter_UI(object):
-    """
-    lowpass_filter_UI
-    This class sets up the UI for a lowpass filter dialog, allowing users to select
-    a lowcut frequency, filter order, and the seismic trace number to apply the filter on.
-    It includes a slider for frequency selection, a spin box for trace number input, and plots for original and reconstructed traces.
-    """
-    def setupUi(self, filterPreview, traceCount):
+    def resetUi(self, traceCount):
         """
-        Setup the lowpass filter dialog layout, including frequency slider, trace selection, and plots.
+        Return an already built dialog to its initial state so it can be shown again.
+        Drops the connections made by the previous caller, sets the trace range for
+        ``traceCount`` and restores the default slider values and filter order.
         Args:
-            filterPreview (QDialog): The dialog instance to set up.
             traceCount (int): The total number of seismic traces available
         """
-
-        filterPreview.setObjectName("filterPreview")
-        filterPreview.resize(1000, 800)
         self.traceCount = traceCount
-
-        # Main Vertical Layout
-        self.mainLayout = QtWidgets.QVBoxLayout(filterPreview)
-
-        # Trace Number Input
+        signals = [self.traceNumberInput.valueChanged, self.button_box.accepted, self.button_box.rejected]
+        signals += [getattr(self, f"{name}Slider").valueChanged for name in self.SLIDERS]
+        for signal in signals:
+            try:
+                signal.disconnect()
+            except TypeError:
+                pass  # Nothing connected
+
+        self.traceNumberInput.setRange(0, max(0, traceCount - 1))
+        self.traceNumberInput.setValue(0)
+        for name in self.SLIDERS:
+            slider = getattr(self, f"{name}Slider")
+            slider.setRange(0, 10000)
+            slider.setValue(self._SLIDER_SETTINGS[name][1])
+            getattr(self, f"update_{name}_display")(slider.value())
+        self.filterOrderInput.setValue(self._DEFAULT_ORDER)
+        self.tracePlot.clear()
+        if self._reconstructedTracePlot is not None:
+            self._reconstructedTracePlot.clear()
+        self._curves.clear()
+        self._connect_signals()
+
+    def _connect_signals(self):
+        """Connect each slider to its single display and constraint slot."""
+        for name in self.SLIDERS:
+            getattr(self, f"{name}Slider").valueChanged.connect(getattr(self, f"_on_{name}_changed"))
+
+    def _build_trace_selector(self):
+        """Add the trace number selection row to the main layout."""
         self.traceselectionlayout = QtWidgets.QHBoxLayout()
         self.traceSelectionlabel = QtWidgets.QLabel("Enter Seismic Trace Number:")
-        self.traceSelectionlabel.setFont(QtGui.QFont("Segoe UI", 12))
+        self.traceSelectionlabel.setFont(_Fonts.segoe(12))
         self.traceselectionlayout.addWidget(self.traceSelectionlabel)
         self.traceNumberInput = QtWidgets.QSpinBox()
         self.traceNumberInput.setMinimum(0)
@@ -466,497 +443,262 @@ class lowpass_filter_UI(object):
         self.traceselectionlayout.addWidget(self.traceNumberInput)
         self.mainLayout.addLayout(self.traceselectionlayout)
 
-        # Filter Settings
-        self.filterSettings = QtWidgets.QFrame()
-        self.filterSettingsLayout = QtWidgets.QVBoxLayout(self.filterSettings)
-
-        self.filterSettingsLabel = QtWidgets.QLabel("Filter Settings")
-        self.filterSettingsLabel.setFont(QtGui.QFont("Segoe UI", 14))
-        self.filterSettingsLayout.addWidget(self.filterSettingsLabel)
-
-        # Frequency Sliders
-        self.freqSliders = QtWidgets.QHBoxLayout()
-
-        # Slider Style
-        slider_style = """
-        QSlider::groove:horizontal {
-            border: 1px solid #bbb;
-            background: #eee;
-            height: 8px;
-            border-radius: 4px;
-        }
-
-        QSlider::handle:horizontal {
-            background: #0a84ff;
-            border: 1px solid #5c5c5c;
-            width: 16px;
-            height: 16px;
-            border-radius: 8px;
-            margin: -4px 0; /* Handle overlaps the groove */
-        }
-        QSlider::sub-page:horizontal {
-            background: #0a84ff;
-            border: 1px solid #0a84ff;
-            height: 8px;
-            border-radius: 4px;
-        }
-        QSlider::add-page:horizontal {
-            background: #c5c5c5;
-            border: 1px solid #bbb;
-            height: 8px;
-            border-radius: 4px;
-        }
+    def _build_slider(self, name):
         """
+        Build a frequency slider with its label and value display.
+        The widgets are stored as ``<name>Label``, ``<name>ValueLabel``, ``<name>Slider``
+        and ``<name>SliderLayout``.
+        Args:
+            name (str): "lowcut" or "highcut".
+        Returns:
+            QtWidgets.QVBoxLayout: The layout containing the label, value display, and slider.
+        """
+        label_text, initial_value = self._SLIDER_SETTINGS[name]
+        label = QtWidgets.QLabel(label_text)
+        label.setFont(_Fonts.segoe(10))
+        value_label = QtWidgets.QLabel(f"{initial_value} Hz")  # Initial frequency display
+        value_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        value_label.setFont(_Fonts.segoe(10))
+        slider = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
+        slider.setObjectName("freqSlider")  # Styled by the application stylesheet
+        slider.setRange(0, 10000)
+        slider.setValue(initial_value)
+
+        layout = QtWidgets.QVBoxLayout()
+        layout.addWidget(label)
+        layout.addWidget(value_label)
+        layout.addWidget(slider)
 
-        # Slider Labels
-        self.lowcutLabel = QtWidgets.QLabel("Lowcut Frequency (Hz):")
-        self.lowcutLabel.setFont(QtGui.QFont("Segoe UI", 10))
-
-        # Lowcut Slider with Display
-        self.lowcutSliderLayout = QtWidgets.QVBoxLayout()
-        self.lowcutValueLabel = QtWidgets.QLabel("0 Hz")
-        self.lowcutValueLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.lowcutValueLabel.setFont(QtGui.QFont("Segoe UI", 10))
-        self.lowcutSlider = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
-        self.lowcutSlider.setStyleSheet(slider_style)
-        self.lowcutSlider.setRange(0, 10000)
-        self.lowcutSlider.setValue(0)
-        self.lowcutSlider.valueChanged.connect(self.update_lowcut_display)
-        self.lowcutSliderLayout.addWidget(self.lowcutLabel)
-        self.lowcutSliderLayout.addWidget(self.lowcutValueLabel)
-        self.lowcutSliderLayout.addWidget(self.lowcutSlider)
-
-        # Connect Sliders for Constraints
-        self.lowcutSlider.valueChanged.connect(self.update_slider_constraints)
-
-        # Filter Order Input
+        setattr(self, f"{name}Label", label)
+        setattr(self, f"{name}ValueLabel", value_label)
+        setattr(self, f"{name}Slider", slider)
+        setattr(self, f"{name}SliderLayout", layout)
+        return layout
+
+    def _build_filter_order(self):
+        """Build the filter order input and return its layout."""
         self.filterOrder = QtWidgets.QVBoxLayout()
         self.filterOrderLabel = QtWidgets.QLabel("Filter Order:")
-        self.filterOrderLabel.setFont(QtGui.QFont("Segoe UI", 10))
-        self.filterOrderInput = QtWidgets.QLineEdit()
-        self.filterOrderInput.setValidator(QtGui.QIntValidator(1, 100))
-        self.filterOrderInput.setText("")
-        self.filterOrderInput.setFixedWidth(50)
+        self.filterOrderLabel.setFont(_Fonts.segoe(10))
+        self.filterOrderInput = QtWidgets.QSpinBox()
+        self.filterOrderInput.setRange(1, 100)  # Valid filter orders
+        self.filterOrderInput.setValue(self._DEFAULT_ORDER)
+        self.filterOrderInput.setFixedWidth(60)
         self.filterOrder.addWidget(self.filterOrderLabel)
         self.filterOrder.addWidget(self.filterOrderInput)
+        return self.filterOrder
 
-        # Add Slider Layouts to Main Layout
-        self.freqSliders.addLayout(self.lowcutSliderLayout)
-        self.filterSettingsLayout.addLayout(self.freqSliders)
-        self.filterSettingsLayout.addLayout(self.filterOrder)
-        self.mainLayout.addWidget(self.filterSettings)
-
-        # Trace Plots
-        self.tracePlot = pg.PlotWidget()
-        self.tracePlot.setBackground("w")
-        self.tracePlot.showGrid(x=True, y=True)
-        self.tracePlot.setTitle("Original Trace")
+    def _build_plots(self):
+        """
+        Add the original trace plot and a placeholder for the reconstructed trace plot.
+        The reconstructed plot stays empty until the first preview, so it is only built
+        when reconstructedTracePlot is first accessed.
+        """
+        self.tracePlot = self._make_trace_plot("Original Trace")
         self.mainLayout.addWidget(self.tracePlot)
+        self._curves = {}  # Persistent curve per plot, updated in place by update_trace
+        self._time_axis = None
+
+        self._reconstructedTracePlot = None
+        self._reconstructedPlaceholder = QtWidgets.QWidget()
+        self._reconstructedPlaceholder.setSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.mainLayout.addWidget(self._reconstructedPlaceholder)
+
+    @property
+    def reconstructedTracePlot(self):
+        """The reconstructed trace plot, built in place of its placeholder on first access."""
+        if self._reconstructedTracePlot is None:
+            plot = self._make_trace_plot("Reconstructed Trace")
+            self.mainLayout.replaceWidget(self._reconstructedPlaceholder, plot)
+            self._reconstructedPlaceholder.deleteLater()
+            self._reconstructedPlaceholder = None
+            self._reconstructedTracePlot = plot
+        return self._reconstructedTracePlot
+
+    def time_axis(self, n_samples, sample_interval):
+        """
+        Return the time axis for a trace, reusing the previous array when the length and
+        sample interval are unchanged. The array is shared, so callers must not modify it.
+        Args:
+            n_samples (int): Number of samples in the trace.
+            sample_interval (float): Sample interval in seconds.
+        Returns:
+            numpy.ndarray: Sample times in seconds.
+        """
+        import numpy as np
 
-        self.reconstructedTracePlot = pg.PlotWidget()
-        self.reconstructedTracePlot.setBackground("w")
-        self.reconstructedTracePlot.showGrid(x=True, y=True)
-        self.reconstructedTracePlot.setTitle("Reconstructed Trace")
-        self.mainLayout.addWidget(self.reconstructedTracePlot)
+        axis = self._time_axis
+        if axis is None or axis[0] != (n_samples, sample_interval):
+            axis = self._time_axis = ((n_samples, sample_interval), np.arange(n_samples) * sample_interval)
+        return axis[1]
 
-        
-        # Create Accept and Cancel Buttons
+    def update_trace(self, t, trace):
+        """Show a trace on the original trace plot, reusing its curve item."""
+        self._set_curve(self.tracePlot, t, trace, pen="b")
+
+    def update_reconstructed_trace(self, t, trace):
+        """Show a trace on the reconstructed trace plot, reusing its curve item."""
+        self._set_curve(self.reconstructedTracePlot, t, trace, pen="r")
+
+    def _set_curve(self, plot, t, trace, pen):
+        """Create the plot's curve on first use, then only replace its data."""
+        curve = self._curves.get(id(plot))
+        if curve is None:
+            curve = self._curves[id(plot)] = plot.plot(pen=pen, skipFiniteCheck=True)
+        curve.setData(t, trace)
+
+    @staticmethod
+    def _make_trace_plot(title):
+        """Create a white, gridded trace plot with the given title."""
+        pg = _pg()
+        plot = pg.PlotWidget()
+        plot.setBackground("w")
+        plot.showGrid(x=True, y=True)
+        plot.setTitle(title)
+        # Draw at most about one peak pair per pixel and skip samples outside the view,
+        # so re-plotting long traces while a slider is dragged stays cheap
+        plot.setDownsampling(auto=True, mode="peak")
+        plot.setClipToView(True)
+        return plot
+
+    def _build_buttons(self):
+        """Add the Accept and Cancel buttons to the main layout."""
         self.button_box = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.StandardButton.Ok | QtWidgets.QDialogButtonBox.StandardButton.Cancel)
         self.mainLayout.addWidget(self.button_box)
 
-        # Retranslate the UI
-        self.retranslateUi(filterPreview)
-
     def retranslateUi(self, filterPreview):
         """Set the text for all UI elements."""
         filterPreview.setWindowTitle("Filter Preview")
         self.filterSettingsLabel.setText("Filter Settings")
-        self.lowcutLabel.setText("Lowcut Frequency (Hz)")
+        for name in self.SLIDERS:
+            getattr(self, f"{name}Label").setText(self._SLIDER_SETTINGS[name][0])
         self.filterOrderLabel.setText("Filter Order:")
         self.traceSelectionlabel.setText("Enter Seismic Trace Number:")
         self.tracePlot.setTitle("Original Trace")
-        self.reconstructedTracePlot.setTitle("Reconstructed Trace")
+        if self._reconstructedTracePlot is not None:
+            self._reconstructedTracePlot.setTitle("Reconstructed Trace")
 
     def update_lowcut_display(self, value):
         """Update the displayed value above the Lowcut slider."""
         self.lowcutValueLabel.setText(f"{value} Hz")
 
-    def update_slider_constraints(self):
-        """Ensure the sliders do not overlap."""
-        pass
-    
-class highpass_filter_UI(object):
-    """
-    highpass_filter_UI
-    This class sets up the UI for a highpass filter dialog, allowing users to select
-    a highcut frequency, filter order, and the seismic trace number to apply the filter on.
-    It includes a slider for frequency selection, a spin box for trace number input, and plots for original and reconstructed traces.
-    """
+    def update_highcut_display(self, value):
+        """Update the displayed value above the Highcut slider."""
+        self.highcutValueLabel.setText(f"{value} Hz")
 
-    def setupUi(self, filterPreview, traceCount):
-        filterPreview.setObjectName("filterPreview")
-        filterPreview.resize(1000, 800)
-        self.traceCount = traceCount
+    def _on_lowcut_changed(self, value):
+        """Refresh the Lowcut display and queue the slider constraints."""
+        self.lowcutValueLabel.setText(f"{value} Hz")
+        if len(self.SLIDERS) > 1:
+            self._schedule_slider_constraints()
 
-        # Main Vertical Layout
-        self.mainLayout = QtWidgets.QVBoxLayout(filterPreview)
+    def _on_highcut_changed(self, value):
+        """Refresh the Highcut display and queue the slider constraints."""
+        self.highcutValueLabel.setText(f"{value} Hz")
+        if len(self.SLIDERS) > 1:
+            self._schedule_slider_constraints()
 
-        # Trace Number Input
-        self.traceselectionlayout = QtWidgets.QHBoxLayout()
-        self.traceSelectionlabel = QtWidgets.QLabel("Enter Seismic Trace Number:")
-        self.traceSelectionlabel.setFont(QtGui.QFont("Segoe UI", 12))
-        self.traceselectionlayout.addWidget(self.traceSelectionlabel)
-        self.traceNumberInput = QtWidgets.QSpinBox()
-        self.traceNumberInput.setMinimum(0)
-        self.traceNumberInput.setMaximum(max(0, self.traceCount - 1))  # Ensure max is non-negative
-        self.traceselectionlayout.addWidget(self.traceNumberInput)
-        self.mainLayout.addLayout(self.traceselectionlayout)
+    def _schedule_slider_constraints(self):
+        """Queue a single constraint update for a burst of slider changes."""
+        if not self._constraints_pending:
+            self._constraints_pending = True
+            QtCore.QTimer.singleShot(self._CONSTRAINT_DELAY_MS, self._apply_slider_constraints)
 
-        # Filter Settings
-        self.filterSettings = QtWidgets.QFrame()
-        self.filterSettingsLayout = QtWidgets.QVBoxLayout(self.filterSettings)
-
-        self.filterSettingsLabel = QtWidgets.QLabel("Filter Settings")
-        self.filterSettingsLabel.setFont(QtGui.QFont("Segoe UI", 14))
-        self.filterSettingsLayout.addWidget(self.filterSettingsLabel)
-
-        # Frequency Sliders
-        self.freqSliders = QtWidgets.QHBoxLayout()
-
-        # Slider Style
-        slider_style = """
-        QSlider::groove:horizontal {
-            border: 1px solid #bbb;
-            background: #eee;
-            height: 8px;
-            border-radius: 4px;
-        }
-
-        QSlider::handle:horizontal {
-            background: #0a84ff;
-            border: 1px solid #5c5c5c;
-            width: 16px;
-            height: 16px;
-            border-radius: 8px;
-            margin: -4px 0; /* Handle overlaps the groove */
-        }
-        QSlider::sub-page:horizontal {
-            background: #0a84ff;
-            border: 1px solid #0a84ff;
-            height: 8px;
-            border-radius: 4px;
-        }
-        QSlider::add-page:horizontal {
-            background: #c5c5c5;
-            border: 1px solid #bbb;
-            height: 8px;
-            border-radius: 4px;
-        }
-        """
+    def _apply_slider_constraints(self):
+        """Run the queued constraint update."""
+        self._constraints_pending = False
+        self.update_slider_constraints()
 
-        # Slider Labels
-        self.highcutLabel = QtWidgets.QLabel("Highcut Frequency (Hz):")
-        self.highcutLabel.setFont(QtGui.QFont("Segoe UI", 10))
-
-        # Highcut Slider with Display
-        self.highcutSliderLayout = QtWidgets.QVBoxLayout()
-        self.highcutValueLabel = QtWidgets.QLabel("10000 Hz")
-        self.highcutValueLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.highcutValueLabel.setFont(QtGui.QFont("Segoe UI", 10))
-        self.highcutSlider = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
-        self.highcutSlider.setStyleSheet(slider_style)
-        self.highcutSlider.setRange(0, 10000)
-        self.highcutSlider.setValue(10000)
-        self.highcutSlider.valueChanged.connect(self.update_highcut_display)
-        self.highcutSliderLayout.addWidget(self.highcutLabel)
-        self.highcutSliderLayout.addWidget(self.highcutValueLabel)
-        self.highcutSliderLayout.addWidget(self.highcutSlider)
-
-        # Connect Sliders for Constraints
-        self.highcutSlider.valueChanged.connect(self.update_slider_constraints)
-
-        # Filter Order Input
-        self.filterOrder = QtWidgets.QVBoxLayout()
-        self.filterOrderLabel = QtWidgets.QLabel("Filter Order:")
-        self.filterOrderLabel.setFont(QtGui.QFont("Segoe UI", 10))
-        self.filterOrderInput = QtWidgets.QLineEdit()
-        self.filterOrderInput.setValidator(QtGui.QIntValidator(1, 100))
-        self.filterOrderInput.setText("")
-        self.filterOrderInput.setFixedWidth(50)
-        self.filterOrder.addWidget(self.filterOrderLabel)
-        self.filterOrder.addWidget(self.filterOrderInput)
+    def update_slider_constraints(self):
+        """Ensure the sliders do not overlap (nothing to do with a single slider)."""
+        pass
 
-        # Add Slider Layouts to Main Layout
-        self.freqSliders.addLayout(self.highcutSliderLayout)
-        self.filterSettingsLayout.addLayout(self.freqSliders)
-        self.filterSettingsLayout.addLayout(self.filterOrder)
-        self.mainLayout.addWidget(self.filterSettings)
+class bandass_filter_UI(_FilterUIBase, filter_type="bandpass"):
+    """
+    bandass_filter_UI
+    This class sets up the UI for a bandpass filter dialog, allowing users to select
+    lowcut and highcut frequencies, filter order, and the seismic trace number to apply the filter on.
+    It includes sliders for frequency selection, a spin box for trace number input, and plots for original and reconstructed traces.
+    """
 
-        # Trace Plots
-        self.tracePlot = pg.PlotWidget()
-        self.tracePlot.setBackground("w")
-        self.tracePlot.showGrid(x=True, y=True)
-        self.tracePlot.setTitle("Original Trace")
-        self.mainLayout.addWidget(self.tracePlot)
+    SLIDERS = ("lowcut", "highcut")
 
-        self.reconstructedTracePlot = pg.PlotWidget()
-        self.reconstructedTracePlot.setBackground("w")
-        self.reconstructedTracePlot.showGrid(x=True, y=True)
-        self.reconstructedTracePlot.setTitle("Reconstructed Trace")
-        self.mainLayout.addWidget(self.reconstructedTracePlot)
-        
-        # Create Accept and Cancel Buttons
-        self.button_box = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.StandardButton.Ok | QtWidgets.QDialogButtonBox.StandardButton.Cancel)
-        self.mainLayout.addWidget(self.button_box)
+    def update_slider_constraints(self):
+        """Ensure the sliders do not overlap."""
+        # Block signals so the range changes do not re-enter this method
+        for slider in (self.lowcutSlider, self.highcutSlider):
+            slider.blockSignals(True)
+        try:
+            self.highcutSlider.setMinimum(self.lowcutSlider.value() + 1)
+            self.lowcutSlider.setMaximum(self.highcutSlider.value() - 1)
+        finally:
+            for slider in (self.lowcutSlider, self.highcutSlider):
+                slider.blockSignals(False)
+        # A clamped value emits nothing while blocked, so refresh the displays
+        self.update_lowcut_display(self.lowcutSlider.value())
+        self.update_highcut_display(self.highcutSlider.value())
+
+class lowpass_filter_UI(_FilterUIBase, filter_type="lowpass"):
+    """
+    lowpass_filter_UI
+    This class sets up the UI for a lowpass filter dialog, allowing users to select
+    a lowcut frequency, filter order, and the seismic trace number to apply the filter on.
+    It includes a slider for frequency selection, a spin box for trace number input, and plots for original and reconstructed traces.
+    """
 
-        # Retranslate the UI
-        self.retranslateUi(filterPreview)
+    SLIDERS = ("lowcut",)
 
-    def retranslateUi(self, filterPreview):
-        """Set the text for all UI elements."""
-        filterPreview.setWindowTitle("Filter Preview")
-        self.filterSettingsLabel.setText("Filter Settings")
-        self.highcutLabel.setText("Highcut Frequency (Hz)")
-        self.filterOrderLabel.setText("Filter Order:")
-        self.traceSelectionlabel.setText("Enter Seismic Trace Number:")
-        self.tracePlot.setTitle("Original Trace")
-        self.reconstructedTracePlot.setTitle("Reconstructed Trace")
+class highpass_filter_UI(_FilterUIBase, filter_type="highpass"):
+    """
+    highpass_filter_UI
+    This class sets up the UI for a highpass filter dialog, allowing users to select
+    a highcut frequency, filter order, and the seismic trace number to apply the filter on.
+    It includes a slider for frequency selection, a spin box for trace number input, and plots for original and reconstructed traces.
+    """
 
-    def update_highcut_display(self, value):
-        """Update the displayed value above the Highcut slider."""
-        self.highcutValueLabel.setText(f"{value} Hz")
+    SLIDERS = ("highcut",)
 
-    def update_slider_constraints(self):
-        """Ensure the sliders do not overlap."""
-        pass
 
+# Filter preview dialogs built by FilterUI.load: parent window -> {filter_type: (dialog, ui)}.
+# Weakly keyed, so the dialogs go away with the window that opened them.
+_FILTER_UI_CACHE = weakref.WeakKeyDictionary()
 
 class FilterUI(object):
     """
     FilterUI
     This class is capable of creating different filter UIs based on the specified filter type.
-    It supports bandpass, lowpass, and highpass filters, each with its own settings and layout.
+    It supports bandpass, lowpass, and highpass filters, each with its own settings and layout,
+    looked up in the _FilterUIBase registry.
     """
 
-    def __init__(self, filter_type, trace_count):
-        """
-        Initialize the FilterUI for the specified filter type.
-        :param filter_type: "bandpass", "lowpass", or "highpass"
-        :param trace_count: The number of traces available
-        """
-        self.filter_type = filter_type
-        self.trace_count = trace_count
-        self.filter_class = self._get_filter_class(filter_type)(trace_count)
-
-    def setupUi(self, filterPreview):
-        """
-        Set up the UI using the specific filter class.
-        :param filterPreview: The parent QWidget for the UI.
-        """
-        self.filter_class.setupUi(filterPreview)
-
-    def retranslateUi(self, filterPreview):
-        """
-        Retranslate UI if necessary (e.g., for localization).
+    @classmethod
+    def load(cls, filter_type, trace_count, parent=None):
         """
-        self.filter_class.retranslateUi(filterPreview)
-
-    @staticmethod
-    def _get_filter_class(filter_type):
-        """
-        Map filter types to their respective nested classes.
-        """
-        filter_classes = {
-            "bandpass": FilterUI.BandpassFilter,
-            "lowpass": FilterUI.LowpassFilter,
-            "highpass": FilterUI.HighpassFilter,
-        }
-        return filter_classes.get(filter_type, None)
-
-    class BaseFilter:
-        """
-        BaseFilter
-        This is a base class for all filter UIs, providing common setup methods.
-        It should not be instantiated directly.
-        """
-
-        def __init__(self, trace_count):
-            self.trace_count = trace_count
-
-        def setupUi(self, filterPreview):
-            """
-            Set up the base UI layout for the filter dialog.
-            :param filterPreview: The parent QWidget for the UI.
-            """
-            # Dialog setup
-            filterPreview.setObjectName("filterPreview")
-            filterPreview.resize(1000, 800)
-
-           # Main Horizontal Splitter
-            self.mainSplitter = QtWidgets.QSplitter(QtCore.Qt.Orientation.Horizontal)
-            
-            # Left Panel
-            self.leftPanel = QtWidgets.QWidget()
-            self.leftLayout = QtWidgets.QVBoxLayout(self.leftPanel)
-
-            # Trace Selection
-            self.traceselectionlayout = QtWidgets.QHBoxLayout()
-            self.traceSelectionlabel = QtWidgets.QLabel("Enter Seismic Trace Number:")
-            self.traceSelectionlabel.setFont(QtGui.QFont("Segoe UI", 12))
-            self.traceselectionlayout.addWidget(self.traceSelectionlabel)
-            self.traceNumberInput = QtWidgets.QSpinBox()
-            self.traceNumberInput.setMinimum(0)
-            self.traceNumberInput.setMaximum(self.traceCount - 1 if self.traceCount > 0 else 0)  # Ensure max is valid
-            self.traceNumberInput.setToolTip("Select a trace number for analysis.")
-            self.traceselectionlayout.addWidget(self.traceNumberInput)
-            self.leftLayout.addLayout(self.traceselectionlayout)
-
-            # Filter Settings
-            self.filterSettings = QtWidgets.QFrame()
-            self.filterSettingsLayout = QtWidgets.QVBoxLayout(self.filterSettings)
-            self.filterSettingsLabel = QtWidgets.QLabel("Filter Settings")
-            self.filterSettingsLabel.setFont(QtGui.QFont("Segoe UI", 14))
-            self.filterSettingsLayout.addWidget(self.filterSettingsLabel)
-            self.leftLayout.addWidget(self.filterSettings)
-
-            # Right Panel
-            self.rightPanel = QtWidgets.QWidget()
-            self.rightLayout = QtWidgets.QVBoxLayout(self.rightPanel)
-
-            # QSplitter for Plots
-            self.plotSplitter = QtWidgets.QSplitter(QtCore.Qt.Orientation.Vertical)
-            
-            # Trace Plots
-            self.tracePlot = pg.PlotWidget()
-            self.tracePlot.setBackground("w")
-            self.tracePlot.showGrid(x=True, y=True)
-            self.tracePlot.setTitle("Original Trace")
-            self.rightLayout.addWidget(self.tracePlot)
-
-            self.reconstructedTracePlot = pg.PlotWidget()
-            self.reconstructedTracePlot.setBackground("w")
-            self.reconstructedTracePlot.showGrid(x=True, y=True)
-            self.reconstructedTracePlot.setTitle("Reconstructed Trace")
-            self.rightLayout.addWidget(self.reconstructedTracePlot)
-
-            # Buttons
-            self.buttonLayout = QtWidgets.QHBoxLayout()
-            self.acceptButton = QtWidgets.QPushButton("Accept")
-            self.cancelButton = QtWidgets.QPushButton("Cancel")
-            self.buttonLayout.addWidget(self.acceptButton)
-            self.buttonLayout.addWidget(self.cancelButton)
-            self.rightLayout.addLayout(self.buttonLayout)
-
-        def retranslateUi(self, filterPreview):
-            filterPreview.setWindowTitle("Filter Preview")
-            self.filterSettingsLabel.setText("Filter Settings")
-            self.traceSelectionlabel.setText("Enter Seismic Trace Number:")
-            self.tracePlot.setTitle("Original Trace")
-            self.reconstructedTracePlot.setTitle("Reconstructed Trace")
-
-    class BandpassFilter(BaseFilter):
-        """
-        BandpassFilter
-        This class sets up the UI for a bandpass filter dialog, allowing users to select
-        lowcut and highcut frequencies, filter order, and the seismic trace number to apply the filter on.
-        It includes sliders for frequency selection, a spin box for trace number input, and plots for original and reconstructed traces.
-        """
-
-        def setupUi(self, filterPreview):
-            """
-            Set up the bandpass filter dialog layout, including frequency sliders, trace selection, and plots.
-            Args:
-                filterPreview (QDialog): The dialog instance to set up.
-            """
-            # Call the base setup
-            super().setupUi(filterPreview)
-
-            # Frequency Sliders
-            self.freqSliders = QtWidgets.QHBoxLayout()
-            self.lowcutSliderLayout = self._create_slider_layout("Lowcut Frequency (Hz):", 0)
-            self.highcutSliderLayout = self._create_slider_layout("Highcut Frequency (Hz):", 10000)
-            self.freqSliders.addLayout(self.lowcutSliderLayout)
-            self.freqSliders.addLayout(self.highcutSliderLayout)
-            self.filterSettingsLayout.addLayout(self.freqSliders)
-
-        def _create_slider_layout(self, label_text, initial_value):
-            return FilterUI._create_slider_layout(label_text, initial_value)
-
-    class LowpassFilter(BaseFilter):
-        """
-        LowpassFilter
-        This class sets up the UI for a lowpass filter dialog, allowing users to select
-        a lowcut frequency, filter order, and the seismic trace number to apply the filter on.
-        It includes a slider for frequency selection, a spin box for trace number input, and plots for original and reconstructed traces.
-        """
-        def setupUi(self, filterPreview):
-            """
-            Set up the lowpass filter dialog layout, including frequency slider, trace selection, and plots.
-            Args:
-                filterPreview (QDialog): The dialog instance to set up.
-            """
-            # Call the base setup
-            super().setupUi(filterPreview)
-
-            # Frequency Slider
-            self.freqSliders = QtWidgets.QHBoxLayout()
-            self.lowcutSliderLayout = self._create_slider_layout("Lowcut Frequency (Hz):", 0)
-            self.freqSliders.addLayout(self.lowcutSliderLayout)
-            self.filterSettingsLayout.addLayout(self.freqSliders)
-
-        def _create_slider_layout(self, label_text, initial_value):
-            return FilterUI._create_slider_layout(label_text, initial_value)
-
-    class HighpassFilter(BaseFilter):
-        """
-        HighpassFilter
-        This class sets up the UI for a highpass filter dialog, allowing users to select
-        a highcut frequency, filter order, and the seismic trace number to apply the filter on.
-        It includes a slider for frequency selection, a spin box for trace number input, and plots for original and reconstructed traces.
-        """
-
-        def setupUi(self, filterPreview):
-            """
-            Set up the highpass filter dialog layout, including frequency slider, trace selection, and plots.
-            Args:
-                filterPreview (QDialog): The dialog instance to set up.
-            """
-            # Call the base setup
-            super().setupUi(filterPreview)
-
-            # Frequency Slider
-            self.freqSliders = QtWidgets.QHBoxLayout()
-            self.highcutSliderLayout = self._create_slider_layout("Highcut Frequency (Hz):", 10000)
-            self.freqSliders.addLayout(self.highcutSliderLayout)
-            self.filterSettingsLayout.addLayout(self.freqSliders)
-
-        def _create_slider_layout(self, label_text, initial_value):
-            return FilterUI._create_slider_layout(label_text, initial_value)
-
-    @staticmethod
-    def _create_slider_layout(label_text, initial_value):
-        """
-        Create a slider layout with a label and a value display.
+        Return a filter preview dialog and its UI, reusing a previously built one when possible.
+        Dialogs are hidden rather than destroyed when closed, so the widget tree is built once
+        per filter type and parent window, and later opens only reset its state and trace range.
         Args:
-            label_text (str): The text for the label.
-            initial_value (int): The initial value for the slider.
+            filter_type (str): "bandpass", "lowpass", or "highpass".
+            trace_count (int): The number of traces available.
+            parent (QWidget): The parent of the dialog.
         Returns:
-            QtWidgets.QVBoxLayout: The layout containing the label, value display, and slider.
+            tuple: The QDialog and its filter UI instance.
         """
-
-        layout = QtWidgets.QVBoxLayout()
-        label = QtWidgets.QLabel(label_text)
-        label.setFont(QtGui.QFont("Segoe UI", 10))
-        value_label = QtWidgets.QLabel(f"{initial_value} Hz")
-        value_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        slider = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
-        slider.setRange(0, 10000)
-        slider.setValue(initial_value)
-        slider.valueChanged.connect(lambda value, lbl=value_label: lbl.setText(f"{value} Hz"))
-        layout.addWidget(label)
-        layout.addWidget(value_label)
-        layout.addWidget(slider)
-        return layout
+        from PyQt6 import sip
+
+        dialogs = _FILTER_UI_CACHE.setdefault(parent, {}) if parent is not None else {}
+        cached = dialogs.get(filter_type)
+        if cached is not None:
+            dialog, ui = cached
+            if not sip.isdeleted(dialog):
+                ui.resetUi(trace_count)
+                return dialog, ui
+
+        dialog = QtWidgets.QDialog(parent)
+        ui = _FilterUIBase._registry[filter_type]()
+        ui.setupUi(dialog, traceCount=trace_count)
+        dialogs[filter_type] = (dialog, ui)
+        return dialog, ui
 
 class TraceAnalysisWindowUI(object):
     """
@@ -973,6 +715,7 @@ class TraceAnalysisWindowUI(object):
             TraceAnalysisWindow (QDialog): The dialog instance to set up.
             traceCount (int): The total number of seismic traces available
         """
+        pg = _pg()
         # Dialog setup
         TraceAnalysisWindow.setObjectName("Trace Analysis")
         TraceAnalysisWindow.resize(1000, 800)
@@ -988,7 +731,7 @@ class TraceAnalysisWindowUI(object):
         # Trace Selection
         self.traceselectionlayout = QtWidgets.QHBoxLayout()
         self.traceSelectionlabel = QtWidgets.QLabel("Enter Seismic Trace Number:")
-        self.traceSelectionlabel.setFont(QtGui.QFont("Segoe UI", 12))
+        self.traceSelectionlabel.setFont(_Fonts.segoe(12))
         self.traceselectionlayout.addWidget(self.traceSelectionlabel)
         self.traceNumberInput = QtWidgets.QSpinBox()
         self.traceNumberInput.setMinimum(0)
@@ -1000,7 +743,7 @@ class TraceAnalysisWindowUI(object):
         # Analysis Combo Box
         self.comboBoxLayout = QtWidgets.QHBoxLayout()
         self.analysisLabel = QtWidgets.QLabel("Select Analysis Method:")
-        self.analysisLabel.setFont(QtGui.QFont("Segoe UI", 12))
+        self.analysisLabel.setFont(_Fonts.segoe(12))
         self.analysisComboBox = QtWidgets.QComboBox()
         self.analysisComboBox.addItems(["FFT", "Periodogram", "Welch Periodogram", "Spectrogram", "Wavelet Transform", "Instantaneous Amplitude", "Instantaneous Phase", "Instantaneous Frequency"])
         self.comboBoxLayout.addWidget(self.analysisLabel)
@@ -1041,12 +784,14 @@ class TraceAnalysisWindowUI(object):
 
         
         # Image Plot for Advanced Analysis (e.g., Spectrogram, Wavelet Transform)
+        # Only a hidden placeholder for now; the plot itself is built by the imagePlot property
         self.image = pg.ImageItem(axisOrder='col-major')  # This arg is purely for performance
-        self.imagePlot = pg.PlotWidget(labels={'left': 'Frequency [Hz]', 'bottom': 'Time [s]'})
-        self.imagePlot.setBackground("w")
-        self.imagePlot.showGrid(x=True, y=True)
-        self.imagePlot.setVisible(False)  # Initially hidden
-        self.analysisSplitter.addWidget(self.imagePlot)
+        self.image.setAutoDownsample(True)  # Map at most one sample per screen pixel when zoomed out
+        self.image.setLookupTable(self._image_lut(pg))
+        self._imagePlot = None
+        self._imagePlaceholder = QtWidgets.QWidget()
+        self._imagePlaceholder.setVisible(False)  # Initially hidden
+        self.analysisSplitter.addWidget(self._imagePlaceholder)
         
         
         # Add the analysis splitter to the main splitter
@@ -1078,10 +823,36 @@ class TraceAnalysisWindowUI(object):
         self.tracePlot.setLabel("bottom", "Time (s)")
         self.tracePlot.setLabel("left", "Amplitude")
 
+    _IMAGE_LUT = None
+
+    @classmethod
+    def _image_lut(cls, pg):
+        """Return the shared uint8 viridis lookup table for the analysis image, built once."""
+        if cls._IMAGE_LUT is None:
+            cls._IMAGE_LUT = pg.colormap.get("viridis").getLookupTable(nPts=256, alpha=False)
+        return cls._IMAGE_LUT
+
+    @property
+    def imagePlot(self):
+        """The image plot for advanced analysis, built in place of its placeholder on first access."""
+        if self._imagePlot is None:
+            pg = _pg()
+            plot = pg.PlotWidget(labels={'left': 'Frequency [Hz]', 'bottom': 'Time [s]'})
+            plot.setBackground("w")
+            plot.showGrid(x=True, y=True)
+            visible = self._imagePlaceholder.isVisibleTo(self.analysisSplitter)
+            self.analysisSplitter.replaceWidget(self.analysisSplitter.indexOf(self._imagePlaceholder), plot)
+            plot.setVisible(visible)
+            self._imagePlaceholder.deleteLater()
+            self._imagePlaceholder = None
+            self._imagePlot = plot
+        return self._imagePlot
+
     def togglePlots(self, show_image: bool):
         """Toggle visibility between frequencyPlot and imagePlot."""
         self.frequencyPlot.setVisible(not show_image)
-        self.imagePlot.setVisible(show_image)  # Show or hide the image plot based on the boolean value
+        if show_image or self._imagePlot is not None:
+            self.imagePlot.setVisible(show_image)  # Show or hide the image plot based on the boolean value
 
 
 class WaveletWindowUI(QtWidgets.QDialog):
@@ -1206,6 +977,7 @@ class TraceQCUI(QtWidgets.QDialog):
     """
 
     def __init__(self, seismic_data=None, qc = None, sample_interval=None, parent=None):
+        pg = _pg()
         super().__init__(parent)
         self.setWindowTitle("Trace Quality Control")
         self.resize(800, 600)
@@ -1254,6 +1026,7 @@ class TraceQCUI(QtWidgets.QDialog):
         self.run_button.clicked.connect(self.run_qc)
         self.export_button.clicked.connect(self.export_report)
 
+    @QtCore.pyqtSlot()
     def run_qc(self):
         if self.data is None:
             self.info_label.setText("Error: No data loaded.")
@@ -1262,6 +1035,7 @@ class TraceQCUI(QtWidgets.QDialog):
         self.display_results()
 
     def display_results(self):
+        pg = _pg()
         import numpy as np
 
         self.plot_item.clear()
@@ -1301,6 +1075,7 @@ class TraceQCUI(QtWidgets.QDialog):
         self.info_label.setText("QC complete. Flagged traces shown in red.")
 
 
+    @QtCore.pyqtSlot()
     def export_report(self):
         if not self.qc_results:
             self.info_label.setText("Run QC before exporting report.")
@@ -1331,102 +1106,122 @@ class Maggy_editor_UI(object):
         Args:
             MaggyEditor (QMainWindow): The main window instance to set up.
         """
-        # Main Window Setup
-        MaggyEditor.setObjectName("Maggy Editor")
-        MaggyEditor.resize(1200, 800)  # Increase size for better layout
-
-        # Central Widget (TableWidget takes main focus)
-        self.centralwidget = QtWidgets.QWidget(MaggyEditor)
-        MaggyEditor.setCentralWidget(self.centralwidget)
-        main_layout = QtWidgets.QVBoxLayout(self.centralwidget)
-
-        # === Magnetic Line selection ComboBox ===
-        self.lineSelectionLayout = QtWidgets.QHBoxLayout()
-        self.lineSelectionLabel = QtWidgets.QLabel("Select Magnetic Line:")
-        self.lineSelectionLabel.setFont(QtGui.QFont("Segoe UI", 12))
-        self.lineSelectionLayout.addWidget(self.lineSelectionLabel)
-        self.lineSelection = QtWidgets.QComboBox()
-        self.lineSelectionLayout.addWidget(self.lineSelection)
-        main_layout.addLayout(self.lineSelectionLayout)
-
-        # === Data Table ===
-        self.dataTable = QtWidgets.QTableWidget()
-        main_layout.addWidget(self.dataTable)
-
-        # === TreeView Dock (Moved to a DockWidget) ===
-        self.treeDock = QtWidgets.QDockWidget("Loaded Files", MaggyEditor)
-        self.treeDock.setAllowedAreas(QtCore.Qt.DockWidgetArea.LeftDockWidgetArea | QtCore.Qt.DockWidgetArea.RightDockWidgetArea)
-        self.treeDock.setFeatures(QtWidgets.QDockWidget.DockWidgetFeature.DockWidgetMovable | QtWidgets.QDockWidget.DockWidgetFeature.DockWidgetFloatable)
-        self.treeDock.setMinimumWidth(150)  # Make the dock smaller
-        self.treeDock.setMaximumWidth(250)
-
-        # TreeView inside Dock
-        self.treeview = QtWidgets.QTreeWidget()
-        self.treeview.setHeaderLabel("Loaded Files")
-        root = QtWidgets.QTreeWidgetItem(["Loaded Files"])
-        self.treeview.addTopLevelItem(root)
-        self.treeDock.setWidget(self.treeview)  # Attach to Dock
-
-        # Add TreeView Dock to Main Window
-        MaggyEditor.addDockWidget(QtCore.Qt.DockWidgetArea.LeftDockWidgetArea, self.treeDock)
-
-        # === Graphs and Plots Dock ===
-        self.plotDock = QtWidgets.QDockWidget("Data Visualization", MaggyEditor)
-        self.plotDock.setAllowedAreas(QtCore.Qt.DockWidgetArea.BottomDockWidgetArea)
-        self.plotDock.setFeatures(QtWidgets.QDockWidget.DockWidgetFeature.DockWidgetMovable | QtWidgets.QDockWidget.DockWidgetFeature.DockWidgetFloatable)
-        self.plotDock.setMinimumHeight(150)
-        self.plotDock.setMaximumHeight(250)
-
-        # Placeholder Widget inside the Plot Dock
-        self.plotDock.setWidget(QtWidgets.QWidget())
-        MaggyEditor.addDockWidget(QtCore.Qt.DockWidgetArea.BottomDockWidgetArea, self.plotDock)
-
-        # Add a Pyqtgraph PlotWidget to the placeholder widget
-        self.plotWidget = pg.PlotWidget()
-        self.plotWidget.setBackground("w")
-        self.plotWidget.showGrid(x=True, y=True)
-        self.plotDock.setWidget(self.plotWidget)
-
-        # Linear Region for Zooming
-        self.linearRegion = pg.LinearRegionItem()
-
-        # === Menu Bar ===
-        self.menuBar = QtWidgets.QMenuBar(MaggyEditor)
-        self.menuFile = QtWidgets.QMenu("File", self.menuBar)
-        self.menuBar.addMenu(self.menuFile)
-        self.DataAnalysis = QtWidgets.QMenu("Data Analysis...", self.menuBar)
-        self.menuBar.addMenu(self.DataAnalysis)
-        self.plotting_action = self.DataAnalysis.addAction("Plot Data")
-        self.plotting_action.triggered.connect(MaggyEditor.MaggyAnalysisWin) 
+        # Build the window with repaints suspended so it is laid out and painted once
+        with _updates_disabled(MaggyEditor):
+            # Main Window Setup
+            MaggyEditor.setObjectName("Maggy Editor")
+            MaggyEditor.resize(1200, 800)  # Increase size for better layout
+
+            # Central Widget (TableView takes main focus)
+            self.centralwidget = QtWidgets.QWidget(MaggyEditor)
+            MaggyEditor.setCentralWidget(self.centralwidget)
+            main_layout = QtWidgets.QVBoxLayout(self.centralwidget)
+
+            # === Magnetic Line selection ComboBox ===
+            self.lineSelectionLayout = QtWidgets.QHBoxLayout()
+            self.lineSelectionLabel = QtWidgets.QLabel("Select Magnetic Line:")
+            self.lineSelectionLabel.setFont(_Fonts.segoe(12))
+            self.lineSelectionLayout.addWidget(self.lineSelectionLabel)
+            self.lineSelection = QtWidgets.QComboBox()
+            self.lineSelectionLayout.addWidget(self.lineSelection)
+            main_layout.addLayout(self.lineSelectionLayout)
+
+            # === Data Table ===
+            self.dataTable = QtWidgets.QTableView()
+            # Rows share one fixed height so the view never measures row contents; scroll by pixel
+            self.dataTable.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollMode.ScrollPerPixel)
+            self.dataTable.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+            main_layout.addWidget(self.dataTable)
+
+            # === TreeView Dock (Moved to a DockWidget) ===
+            self.treeDock = QtWidgets.QDockWidget("Loaded Files", MaggyEditor)
+            self.treeDock.setAllowedAreas(QtCore.Qt.DockWidgetArea.LeftDockWidgetArea | QtCore.Qt.DockWidgetArea.RightDockWidgetArea)
+            self.treeDock.setFeatures(QtWidgets.QDockWidget.DockWidgetFeature.DockWidgetMovable | QtWidgets.QDockWidget.DockWidgetFeature.DockWidgetFloatable)
+            self.treeDock.setMinimumWidth(150)  # Make the dock smaller
+            self.treeDock.setMaximumWidth(250)
+
+            # TreeView inside Dock
+            self.treeview = QtWidgets.QTreeWidget()
+            self.treeview.setHeaderLabel("Loaded Files")
+            root = QtWidgets.QTreeWidgetItem(["Loaded Files"])
+            self.treeview.addTopLevelItem(root)
+            self.treeDock.setWidget(self.treeview)  # Attach to Dock
+
+            # Add TreeView Dock to Main Window
+            MaggyEditor.addDockWidget(QtCore.Qt.DockWidgetArea.LeftDockWidgetArea, self.treeDock)
+
+            # === Graphs and Plots Dock ===
+            self.plotDock = QtWidgets.QDockWidget("Data Visualization", MaggyEditor)
+            self.plotDock.setAllowedAreas(QtCore.Qt.DockWidgetArea.BottomDockWidgetArea)
+            self.plotDock.setFeatures(QtWidgets.QDockWidget.DockWidgetFeature.DockWidgetMovable | QtWidgets.QDockWidget.DockWidgetFeature.DockWidgetFloatable)
+            self.plotDock.setMinimumHeight(150)
+            self.plotDock.setMaximumHeight(250)
+
+            # Placeholder Widget inside the Plot Dock; the PlotWidget replaces it when the dock
+            # is first shown (or plotWidget is first accessed)
+            self._plotWidget = None
+            self.plotDock.setWidget(QtWidgets.QWidget())
+            self.plotDock.visibilityChanged.connect(self._on_plot_dock_visibility_changed)
+            MaggyEditor.addDockWidget(QtCore.Qt.DockWidgetArea.BottomDockWidgetArea, self.plotDock)
+
+            # === Menu Bar ===
+            self.menuBar = QtWidgets.QMenuBar(MaggyEditor)
+            self.menuFile = QtWidgets.QMenu("File", self.menuBar)
+            self.menuBar.addMenu(self.menuFile)
+            self.DataAnalysis = QtWidgets.QMenu("Data Analysis...", self.menuBar)
+            self.menuBar.addMenu(self.DataAnalysis)
+            self.plotting_action = self.DataAnalysis.addAction("Plot Data")
+            self.plotting_action.triggered.connect(MaggyEditor.MaggyAnalysisWin) 
         
-        self.filter_sort_action = self.DataAnalysis.addAction("Filter & Sorting")
-        #self.filter_sort_action.triggered.connect(MaggyEditor.enable_filter_sorting)
-        self.channelmath_action = self.DataAnalysis.addAction("Channel Math")
-        self.channelmath_action.triggered.connect(MaggyEditor.create_column)
-        self.delcolumn_action = self.DataAnalysis.addAction("Delete Column")
-        self.delcolumn_action.triggered.connect(MaggyEditor.delete_column)
-        self.grid_action = self.DataAnalysis.addAction("Grid Data")
-        self.grid_action.triggered.connect(MaggyEditor.grid_data)
-        self.distance_action = self.DataAnalysis.addAction("Compute Distance Channel")
-        self.distance_action.triggered.connect(MaggyEditor.compute_distance_channel)
+            self.filter_sort_action = self.DataAnalysis.addAction("Filter & Sorting")
+            #self.filter_sort_action.triggered.connect(MaggyEditor.enable_filter_sorting)
+            self.channelmath_action = self.DataAnalysis.addAction("Channel Math")
+            self.channelmath_action.triggered.connect(MaggyEditor.create_column)
+            self.delcolumn_action = self.DataAnalysis.addAction("Delete Column")
+            self.delcolumn_action.triggered.connect(MaggyEditor.delete_column)
+            self.grid_action = self.DataAnalysis.addAction("Grid Data")
+            self.grid_action.triggered.connect(MaggyEditor.grid_data)
+            self.distance_action = self.DataAnalysis.addAction("Compute Distance Channel")
+            self.distance_action.triggered.connect(MaggyEditor.compute_distance_channel)
 
         
-        MaggyEditor.setMenuBar(self.menuBar)
+            MaggyEditor.setMenuBar(self.menuBar)
 
-        # === Status Bar ===
-        self.statusBar = QtWidgets.QStatusBar(MaggyEditor)
-        self.statusBar.showMessage("Ready")
-        MaggyEditor.setStatusBar(self.statusBar)
+            # === Status Bar ===
+            self.statusBar = QtWidgets.QStatusBar(MaggyEditor)
+            self.statusBar.showMessage("Ready")
+            MaggyEditor.setStatusBar(self.statusBar)
 
-        self.retranslateUi(MaggyEditor)
+            self.retranslateUi(MaggyEditor)
         QtCore.QMetaObject.connectSlotsByName(MaggyEditor)
 
 
+    @property
+    def plotWidget(self):
+        """The plot in the Data Visualization dock, built in place of its placeholder on first use."""
+        if self._plotWidget is None:
+            pg = _pg()
+            self._plotWidget = pg.PlotWidget()
+            self._plotWidget.setBackground("w")
+            self._plotWidget.showGrid(x=True, y=True)
+            self.plotDock.setWidget(self._plotWidget)
+
+            # Linear Region for Zooming
+            self.linearRegion = pg.LinearRegionItem()
+        return self._plotWidget
+
+    def _on_plot_dock_visibility_changed(self, visible):
+        """Build the dock's PlotWidget the first time the dock becomes visible."""
+        if visible:
+            self.plotDock.visibilityChanged.disconnect(self._on_plot_dock_visibility_changed)
+            self.plotWidget  # Builds the widget on first access
+
     # === Ui window for plotting data ===
     def plot_data_ui_win(self):
         """
         Create a new window for plotting data.
         """
+        pg = _pg()
         self.plot_data_win = QtWidgets.QWidget()
         self.plot_data_win.setWindowTitle("Maggy Analysis Window")
         #self.plot_data_win.resize(800, 600)
@@ -1441,7 +1236,7 @@ class Maggy_editor_UI(object):
         # X column Selection
         self.xcolumnselsctionlayout = QtWidgets.QHBoxLayout()
         self.xcolumnselsctionlabel = QtWidgets.QLabel("Enter the X column name for plotting:") # Change to x column name
-        self.xcolumnselsctionlabel.setFont(QtGui.QFont("Segoe UI", 12))
+        self.xcolumnselsctionlabel.setFont(_Fonts.segoe(12))
         self.xcolumnselsctionlayout.addWidget(self.xcolumnselsctionlabel)
         self.xcolumnInput = QtWidgets.QComboBox()
         self.xcolumnselsctionlayout.addWidget(self.xcolumnInput)
@@ -1450,7 +1245,7 @@ class Maggy_editor_UI(object):
         # Y column Selection
         self.ycolumnselsctionlayout = QtWidgets.QHBoxLayout()
         self.ycolumnselsctionlabel = QtWidgets.QLabel("Enter the Y column name for plotting:") # Change to y column name
-        self.ycolumnselsctionlabel.setFont(QtGui.QFont("Segoe UI", 12))
+        self.ycolumnselsctionlabel.setFont(_Fonts.segoe(12))
         self.ycolumnselsctionlayout.addWidget(self.ycolumnselsctionlabel)
         self.ycolumnInput = QtWidgets.QComboBox()
         self.ycolumnselsctionlayout.addWidget(self.ycolumnInput)
@@ -1459,7 +1254,7 @@ class Maggy_editor_UI(object):
         # Analysis Combo Box
         self.comboBoxLayout = QtWidgets.QHBoxLayout()
         self.analysisLabel = QtWidgets.QLabel("Select Analysis Method:")
-        self.analysisLabel.setFont(QtGui.QFont("Segoe UI", 12))
+        self.analysisLabel.setFont(_Fonts.segoe(12))
         self.analysisComboBox = QtWidgets.QComboBox()
         self.analysisComboBox.addItems(["FFT", "Periodogram", "Welch Periodogram", "Spectrogram", "Wavelet Transform"])
         self.comboBoxLayout.addWidget(self.analysisLabel)
@@ -1496,14 +1291,13 @@ class Maggy_editor_UI(object):
         self.analysisSplitter.addWidget(self.frequencyPlot)
 
             
-        # Create a matplotlib figure and canvas for Spectrogram plot and Wavelet transform plot
-        from matplotlib import pyplot as plt
-        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas, NavigationToolbar2QT as NavigationToolbar
-        self.figure = plt.figure() # Create a figure
-        plt.ion() # Set interactive mode on for matplotlib
-        self.figure.canvas = FigureCanvas(self.figure) # Create a canvas for the figure
-        self.figure.canvas.hide()
-        self.analysisSplitter.addWidget(self.figure.canvas)
+        # Placeholder for the matplotlib canvas of the Spectrogram and Wavelet transform plots;
+        # matplotlib is only imported once one of those methods is selected
+        self.figure = None
+        self._figurePlaceholder = QtWidgets.QWidget()
+        self._figurePlaceholder.hide()
+        self.analysisSplitter.addWidget(self._figurePlaceholder)
+        self.analysisComboBox.currentTextChanged.connect(self._on_analysis_method_changed)
 
             
         # Add the analysis splitter to the main splitter
@@ -1526,6 +1320,33 @@ class Maggy_editor_UI(object):
 
 
         return self.plot_data_win
+
+    _FIGURE_METHODS = ("Spectrogram", "Wavelet Transform")
+
+    def _on_analysis_method_changed(self, method):
+        """Build the matplotlib figure the first time an image-style analysis is selected."""
+        if method in self._FIGURE_METHODS:
+            self.ensure_analysis_figure()
+
+    def ensure_analysis_figure(self):
+        """
+        Create the matplotlib figure and canvas for the analysis window on first use.
+        The canvas takes the place of its placeholder in the analysis splitter and starts hidden.
+        Returns:
+            matplotlib.figure.Figure: The analysis figure.
+        """
+        if self.figure is None:
+            from matplotlib import pyplot as plt
+            from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+            self.figure = plt.figure() # Create a figure
+            plt.ion() # Set interactive mode on for matplotlib
+            self.figure.canvas = FigureCanvas(self.figure) # Create a canvas for the figure
+            index = self.analysisSplitter.indexOf(self._figurePlaceholder)
+            self.analysisSplitter.replaceWidget(index, self.figure.canvas)
+            self.figure.canvas.hide()
+            self._figurePlaceholder.deleteLater()
+            self._figurePlaceholder = None
+        return self.figure
     
     class Channel_MathDialog(QtWidgets.QDialog):
         """Dialog for channel math operations. It wil be triggered """
@@ -1692,6 +1513,7 @@ class Maggy_editor_UI(object):
             button_box.button(QtWidgets.QDialogButtonBox.StandardButton.Reset).clicked.connect(self.clear_fields)
             layout.addWidget(button_box)
 
+        @QtCore.pyqtSlot()
         def insert_variable(self):
             """
             Insert a new variable as a channel in the expression editor (C0, C1, etc.) and add it to the channel assignments.
@@ -1722,6 +1544,7 @@ class Maggy_editor_UI(object):
                 return
             super().accept()
 
+        @QtCore.pyqtSlot()
         def clear_fields(self):
             """
             Clear the expression editor and reset all channel assignments.
@@ -1732,10 +1555,12 @@ class Maggy_editor_UI(object):
             for _, combo in self.column_assignments:
                 combo.setCurrentIndex(0)
 
+        @QtCore.pyqtSlot()
         def save_expression_file(self):
             """
             Save the current expression and channel assignments to a file.
             """
+            import json
 
             path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save Expression File", "", "Expression Files (*.exp)")
             if path:
@@ -1750,10 +1575,12 @@ class Maggy_editor_UI(object):
                 except Exception as e:
                     QtWidgets.QMessageBox.critical(self, "Save Error", str(e))
 
+        @QtCore.pyqtSlot()
         def load_expression_file(self):
             """
             Load an expression from a file and populate the expression editor and channel assignments.
             """
+            import json
             path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Load Expression File", "", "Expression Files (*.exp)")
             if path:
                 try:
@@ -1770,10 +1597,12 @@ class Maggy_editor_UI(object):
                 except Exception as e:
                     QtWidgets.QMessageBox.critical(self, "Load Error", str(e))
 
+        @QtCore.pyqtSlot()
         def update_preview(self):
             """
             Update the SQL preview based on the current expression and channel assignments.
             """ 
+            import re
             try: 
                 # Get the current expression and channel assignments
                 expr = self.expression_editor.toPlainText()
@@ -1872,6 +1701,7 @@ class Maggy_editor_UI(object):
             - Checks if all used Cx variables are assigned to actual columns.
             - Returns (bool, message)
             """
+            import re
             expr = self.expression_editor.toPlainText()
             used_vars = set(re.findall(r'\bC\d+\b', expr))
             assigned_vars = {v for v, combo in self.column_assignments if combo.currentText()}
@@ -1926,6 +1756,7 @@ class Maggy_editor_UI(object):
     
     class GriddingWindow(QtWidgets.QDialog):
         def __init__(self, dataframe, parent=None):
+            pg = _pg()
             super().__init__(parent)
             self.setWindowTitle("Gridding")
             self.setMinimumSize(1000, 600)
@@ -11,9 +11,68 @@ Functions:
     plot_welch_periodogram(ax, f, Pxx, trace_number): Plots the Welch periodogram of a seismic trace.
     plot_wavelet_transform(ax, cwt_matrix, widths, trace_number): Plots the wavelet transform of a seismic trace.
     plot_spectrogram(ax, f, t, Sxx, trace_number): Plots the spectrogram of a seismic trace.
+    compute_spectrogram(trace, fs): Computes the spectrogram of a seismic trace without plotting it.
     plot_seismic_image(ax, seismic_data): Displays a seismic section as an image.
 """
+from functools import lru_cache
+
 import numpy as np
+from scipy.signal import spectrogram
+
+# Hanning window shared by every spectrogram (128-sample segments)
+_HANN_128 = np.hanning(128).astype(np.float64)
+_HANN_128.flags.writeable = False
+
+@lru_cache(maxsize=16)
+def _time_axis(n_samples, delta):
+    """
+    Return the time axis for ``n_samples`` samples spaced ``delta`` apart.
+
+    The axis always has exactly ``n_samples`` points, which ``np.arange`` with a
+    float step does not guarantee. It is cached because traces of a section share
+    the same sampling; the returned array is read-only.
+
+    Parameters:
+        n_samples (int): Number of samples.
+        delta (float): The time interval between samples.
+
+    Returns:
+        ndarray: Time of each sample, starting at 0.
+    """
+    time_axis = np.linspace(0.0, (n_samples - 1) * delta, n_samples)
+    time_axis.flags.writeable = False
+    return time_axis
+
+def _reduce_to_pixels(ax, image, ax_size_px=None):
+    """
+    Block-average an image down to roughly the pixel size of the axis.
+
+    Drawing more samples than the axis has pixels only costs resampling time,
+    so larger images are reduced to the mean of each block. A partial block at
+    the far edge is averaged over the samples it has, so the reduced image still
+    spans every row and column and lines up with the caller's extent.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): The axis the image will be drawn on.
+        image (ndarray): 2D image, rows by columns.
+        ax_size_px (tuple, optional): (height, width) in pixels; taken from ``ax`` if omitted.
+
+    Returns:
+        ndarray: The reduced image, or ``image`` itself if it already fits.
+    """
+    if ax_size_px is None:
+        bbox = ax.get_window_extent()
+        ax_size_px = (bbox.height, bbox.width)
+    by = max(1, image.shape[0] // max(1, int(ax_size_px[0])))
+    bx = max(1, image.shape[1] // max(1, int(ax_size_px[1])))
+    if by == 1 and bx == 1:
+        return image
+    h, w = image.shape
+    rows = np.arange(0, h, by)
+    cols = np.arange(0, w, bx)
+    sums = np.add.reduceat(np.add.reduceat(image, rows, axis=0), cols, axis=1)
+    counts = np.outer(np.diff(rows, append=h), np.diff(cols, append=w))
+    return sums / counts
 
 def plot_trace(ax, trace, trace_number, delta):
     
@@ -30,8 +89,7 @@ def plot_trace(ax, trace, trace_number, delta):
         None: The trace is plotted on the provided Matplotlib axis.
     """
     # Compute the time axis based on sample interval (delta convetred in milliseconds)
-    n_samples = len(trace)
-    time_axis = np.arange(0, n_samples * delta, delta)
+    time_axis = _time_axis(len(trace), float(delta))
     ax.plot(time_axis, trace, color='black')
     ax.set_title(f"Seismic Trace {trace_number}")
     ax.set_xlabel("Tow Way Time (ms)")
@@ -77,7 +135,7 @@ def plot_welch_periodogram(ax, f, Pxx, trace_number):
     ax.set_xlabel("Frequency (Hz)")
     ax.set_ylabel("Power/Frequency (dB/Hz)")
 
-def plot_wavelet_transform(ax, cwt_matrix, widths, trace_number):
+def plot_wavelet_transform(ax, cwt_matrix, widths, trace_number, ax_size_px=None):
     
     """
     Plot the wavelet transform of a seismic trace.
@@ -87,12 +145,16 @@ def plot_wavelet_transform(ax, cwt_matrix, widths, trace_number):
         cwt_matrix (ndarray): The continuous wavelet transform (CWT) matrix. Each row corresponds to a different scale.
         widths (ndarray): Array of wavelet widths (scales) used for the transform.
         trace_number (int): The index of the seismic trace being analyzed.
+        ax_size_px (tuple, optional): (height, width) of the axis in pixels; measured from ``ax`` if omitted.
 
     Returns:
         None: The wavelet transform is displayed as an image on the provided Matplotlib axis.
     """
 
-    ax.imshow(np.abs(cwt_matrix), aspect='auto', extent=[0, len(cwt_matrix[0]), min(widths), max(widths)])
+    image = _reduce_to_pixels(ax, np.abs(cwt_matrix), ax_size_px)
+    ax.imshow(image, aspect='auto', interpolation='nearest',
+              extent=[0, len(cwt_matrix[0]), min(widths), max(widths)])
+    ax.set_rasterized(True)
     ax.set_title(f"Seismic Trace {trace_number} Wavelet Transform")
     ax.set_xlabel("Sample")
     ax.set_ylabel("Scale")
@@ -112,24 +174,46 @@ def plot_spectrogram(ax, trace, fs):
     Returns:
         None: The spectrogram is displayed as a color map on the provided Matplotlib axis.
     """
-    window = np.hanning(128)
-    ax.specgram(trace, NFFT=128, Fs=fs, noverlap=120, cmap='jet', window=window, interpolation = 'bicubic')
+    ax.specgram(trace, NFFT=128, Fs=fs, noverlap=120, cmap='jet', window=_HANN_128, interpolation = 'bicubic')
     #ax.colorbar(label='Amplitude (dB)')
     ax.set_xlabel('Time (s)')
     ax.set_ylabel('Frequency (Hz)')
     ax.set_title('Spectrogram with Hanning Window')
 
-def plot_seismic_image(ax, seismic_data, delta):
+def compute_spectrogram(trace, fs):
+    
+    """
+    Compute the spectrogram drawn by plot_spectrogram without any plotting.
+
+    Uses scipy's STFT with the same 128-sample Hanning window and 120-sample
+    overlap, and like ``specgram`` no detrending and one-sided PSD scaling, which
+    is cheaper than going through matplotlib when spectrograms are computed for
+    many traces. The result can be drawn with
+    ``ax.pcolormesh(t, f, Sxx)``.
+
+    Parameters:
+        trace (ndarray): The seismic trace data.
+        fs (float): The sampling frequency of the trace.
+
+    Returns:
+        tuple: (f, t, Sxx) sample frequencies, segment times and power spectral density.
+    """
+    return spectrogram(trace, fs=fs, window=_HANN_128, nperseg=128, noverlap=120,
+                       detrend=False, scaling='density')
+
+def plot_seismic_image(ax, seismic_data, delta, ax_size_px=None):
     
-    """Plot the seismic image with proper time scaling."""
+    """Plot the seismic image with proper time scaling, reduced to the axis resolution."""
     n_traces, n_samples = seismic_data.shape
     
     # Compute the time axis for the seismic image (in milliseconds)
-    time_axis = np.arange(0, n_samples * delta, delta)
+    time_axis = _time_axis(n_samples, float(delta))
     
     # Plot the seismic image with time on the y-axis
-    ax.imshow(np.transpose(seismic_data), cmap='seismic', aspect='auto', interpolation = 'bicubic',
+    image = _reduce_to_pixels(ax, np.transpose(seismic_data), ax_size_px)
+    ax.imshow(image, cmap='seismic', aspect='auto', interpolation='nearest',
                        extent=[0, n_traces, time_axis[-1], time_axis[0]])  # Time axis on y-axis
+    ax.set_rasterized(True)
     ax.set_xlabel("Trace Number")
     ax.set_ylabel("Two-Way Travel Time (ms)")
     
@@ -0,0 +1,59 @@
+"""Channel Math: the pandas evaluation must match the SQL it replaces."""
+
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qgeomarine.ui.maggy_editor import MaggyEditor
+
+VAR_MAP = {"C0": "a", "C1": "b", "C2": "c"}
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (a INTEGER, b REAL, c INTEGER)")
+    conn.executemany(
+        "INSERT INTO t VALUES (?, ?, ?)",
+        [(-7, 5.5, 3), (4, -2.25, 2), (9, 0.5, -4), (1, 8.0, 5), (-3, 1.5, 3), (6, 2.0, 7)],
+    )
+    yield conn
+    conn.close()
+
+
+def sql_values(conn, expr):
+    """Evaluate ``expr`` the way create_column's SQL fallback does."""
+    sql_expr = MaggyEditor.translate_expression(None, expr, VAR_MAP)
+    rows = conn.execute(f"SELECT {sql_expr} FROM t ORDER BY rowid").fetchall()
+    return np.array([np.nan if value is None else value for (value,) in rows], dtype=float)
+
+
+def pandas_values(conn, expr):
+    df = pd.read_sql_query("SELECT rowid, * FROM t", conn, index_col="rowid")
+    return MaggyEditor.evaluate_expression(None, expr, VAR_MAP, df).to_numpy()
+
+
+@pytest.mark.parametrize("expr", [
+    "C0 + C1 * 2",
+    "C0.offset(1) - C0",
+    "C1.offset(-2) + C2",
+    "rollmean(C1, 3)",
+    "rollsum(C0, 4) - C2",
+    "rollmean(C0, 2) + C1.offset(1)",
+])
+def test_pandas_matches_sql(conn, expr):
+    np.testing.assert_allclose(pandas_values(conn, expr), sql_values(conn, expr), equal_nan=True)
+
+
+@pytest.mark.parametrize("expr", ["C0 % C2", "C1 % 2", "C0 / C2"])
+def test_modulo_and_division_use_sql(conn, expr):
+    # SQLite's modulo and integer division differ from pandas, so these must fall back to SQL
+    with pytest.raises(ValueError):
+        pandas_values(conn, expr)
+
+
+def test_sql_modulo_semantics(conn):
+    np.testing.assert_allclose(sql_values(conn, "C0 % C2")[:1], [-1.0])
+    np.testing.assert_allclose(sql_values(conn, "C1 % 2")[:1], [1.0])